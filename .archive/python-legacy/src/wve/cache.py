@@ -3,10 +3,16 @@
 import hashlib
 import json
 import os
+import sqlite3
+from contextlib import closing
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 DEFAULT_CACHE_DIR = Path.home() / ".cache" / "wve"
 DEFAULT_TTL_DAYS = 30
 
@@ -32,6 +38,19 @@ def cache_key(prefix: str, *args: Any) -> str:
     return f"{prefix}_{content_hash(combined)}"
 
 
+def directory_fingerprint(path: Path, pattern: str = "*.txt") -> list[tuple[str, int, int]]:
+    """Sorted (name, mtime_ns, size) of the files matching pattern in path.
+
+    Changes whenever a matching file is added, removed or modified, so it can
+    key cached results derived from the directory's contents.
+    """
+    fingerprint = []
+    for f in path.glob(pattern):
+        st = f.stat()
+        fingerprint.append((f.name, st.st_mtime_ns, st.st_size))
+    return sorted(fingerprint)
+
+
 def get_cached(key: str, ttl_days: int = DEFAULT_TTL_DAYS) -> dict | None:
     """Retrieve cached artifact if exists and not expired."""
     cache_dir = get_cache_dir()
@@ -68,6 +87,7 @@ def set_cached(key: str, data: dict) -> Path:
 def clear_cache(older_than_days: int | None = None) -> int:
     """Clear cache files, optionally only older than N days.
 
+    Cached spaCy DocBins are cleared along with the JSON artifacts.
     Returns number of files deleted.
     """
     cache_dir = get_cache_dir()
@@ -77,7 +97,7 @@ def clear_cache(older_than_days: int | None = None) -> int:
     deleted = 0
     cutoff = datetime.now() - timedelta(days=older_than_days) if older_than_days else None
 
-    for cache_file in cache_dir.glob("*.json"):
+    for cache_file in chain(cache_dir.glob("*.json"), cache_dir.glob("spacy/**/*.docbin")):
         if cutoff:
             mtime = datetime.fromtimestamp(cache_file.stat().st_mtime)
             if mtime > cutoff:
@@ -107,3 +127,181 @@ def cache_stats() -> dict:
         "oldest": min(mtimes).isoformat() if mtimes else None,
         "newest": max(mtimes).isoformat() if mtimes else None,
     }
+
+
+# === LLM prompt cache ===
+
+PROMPT_CACHE_FILE = "prompt_cache.sqlite"
+SEMANTIC_THRESHOLD = 0.97
+PROMPT_EMBED_MODEL = "all-MiniLM-L6-v2"
+
+
+@lru_cache(maxsize=2)
+def _prompt_embedder(model_name: str):
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(model_name)
+
+
+class PromptCache:
+    """Persistent cache of LLM JSON responses, keyed by model and prompt.
+
+    Besides the prompt, entries record the structured request parameters
+    (n_points and the JSON schema), and a lookup only ever returns an entry
+    whose parameters match. Lookups try an exact SHA-256 match of the prompt
+    first. With semantic lookup enabled, a miss falls back to the most similar
+    cached prompt with the same model and parameters, when its embedding
+    cosine similarity reaches the threshold.
+
+    Semantic lookup is opt-in (WVE_PROMPT_CACHE=semantic): the embedding
+    model truncates long prompts, so it only suits prompts whose differences
+    fall early in the text. WVE_PROMPT_CACHE=off disables the cache entirely
+    (see prompt_cache_mode).
+
+    The cache never fails a call: errors while reading count as a miss and
+    errors while writing skip the store.
+    """
+
+    SCHEMA_VERSION = 2
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        semantic: bool = False,
+        threshold: float = SEMANTIC_THRESHOLD,
+        embed_model: str = PROMPT_EMBED_MODEL,
+    ):
+        self.path = path or get_cache_dir() / PROMPT_CACHE_FILE
+        self.semantic = semantic
+        self.threshold = threshold
+        self.embed_model = embed_model
+        self._embeddings: dict[str, np.ndarray] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        # Entries from before parameters were recorded cannot be told apart
+        # by n_points or schema, so they are dropped rather than migrated
+        if conn.execute("PRAGMA user_version").fetchone()[0] < self.SCHEMA_VERSION:
+            with conn:
+                conn.execute("DROP TABLE IF EXISTS prompts")
+                conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS prompts ("
+            " model TEXT NOT NULL,"
+            " prompt_hash TEXT NOT NULL,"
+            " n_points INTEGER NOT NULL,"
+            " schema_hash TEXT NOT NULL,"
+            " embedding BLOB,"
+            " response TEXT NOT NULL,"
+            " created_at TEXT NOT NULL,"
+            " PRIMARY KEY (model, prompt_hash, n_points, schema_hash))"
+        )
+        return conn
+
+    @staticmethod
+    def _params(n_points: int | None, schema: dict | None) -> tuple[int, str]:
+        """Column values for the structured parameters; 0 and "" mean unset."""
+        if not schema:
+            return n_points or 0, ""
+        schema_hash = hashlib.sha256(json.dumps(schema, sort_keys=True).encode()).hexdigest()
+        return n_points or 0, schema_hash
+
+    def _embed(self, prompt: str, prompt_hash: str) -> np.ndarray:
+        if prompt_hash not in self._embeddings:
+            vector = _prompt_embedder(self.embed_model).encode(
+                [prompt], normalize_embeddings=True
+            )[0]
+            self._embeddings[prompt_hash] = np.asarray(vector, dtype=np.float32)
+        return self._embeddings[prompt_hash]
+
+    def get(
+        self,
+        prompt: str,
+        model: str,
+        n_points: int | None = None,
+        schema: dict | None = None,
+    ) -> dict | None:
+        """Return the cached response for prompt, or None on a miss."""
+        try:
+            return self._get(prompt, model, *self._params(n_points, schema))
+        except Exception:
+            return None
+
+    def _get(self, prompt: str, model: str, n_points: int, schema_hash: str) -> dict | None:
+        prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT response FROM prompts"
+                " WHERE model = ? AND prompt_hash = ? AND n_points = ? AND schema_hash = ?",
+                (model, prompt_hash, n_points, schema_hash),
+            ).fetchone()
+            if row is not None:
+                return json.loads(row[0])
+            if not self.semantic:
+                return None
+            rows = conn.execute(
+                "SELECT embedding, response FROM prompts"
+                " WHERE model = ? AND n_points = ? AND schema_hash = ? AND embedding IS NOT NULL",
+                (model, n_points, schema_hash),
+            ).fetchall()
+
+        if not rows:
+            return None
+        query = self._embed(prompt, prompt_hash)
+        matrix = np.stack([np.frombuffer(blob, dtype=np.float32) for blob, _ in rows])
+        similarities = matrix @ query
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.threshold:
+            return json.loads(rows[best][1])
+        return None
+
+    def put(
+        self,
+        prompt: str,
+        model: str,
+        response: dict,
+        n_points: int | None = None,
+        schema: dict | None = None,
+    ) -> None:
+        """Store a response for prompt; failures skip the store silently."""
+        try:
+            self._put(prompt, model, response, *self._params(n_points, schema))
+        except Exception:
+            pass
+
+    def _put(
+        self, prompt: str, model: str, response: dict, n_points: int, schema_hash: str
+    ) -> None:
+        prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()
+        embedding = self._embed(prompt, prompt_hash).tobytes() if self.semantic else None
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO prompts VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    model,
+                    prompt_hash,
+                    n_points,
+                    schema_hash,
+                    embedding,
+                    json.dumps(response),
+                    datetime.now().isoformat(),
+                ),
+            )
+
+    def clear(self, model: str | None = None) -> int:
+        """Delete cached responses, for one model or all. Returns rows deleted."""
+        if not self.path.exists():
+            return 0
+        with closing(self._connect()) as conn, conn:
+            if model is None:
+                cursor = conn.execute("DELETE FROM prompts")
+            else:
+                cursor = conn.execute("DELETE FROM prompts WHERE model = ?", (model,))
+            return cursor.rowcount
+
+
+def prompt_cache_mode() -> str:
+    """Prompt cache mode from WVE_PROMPT_CACHE: "exact" (default), "semantic" or "off"."""
+    mode = os.environ.get("WVE_PROMPT_CACHE", "exact").lower()
+    return mode if mode in ("semantic", "exact", "off") else "exact"
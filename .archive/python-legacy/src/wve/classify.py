@@ -1,9 +1,10 @@
 """Classification heuristics for video candidates (v0.2)."""
 
 from datetime import datetime
-from typing import Literal
+from functools import lru_cache
+from typing import Callable, Collection, Literal, NamedTuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from wve.identity import Identity
 
@@ -38,6 +39,27 @@ class CandidateSet(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
 
 
+@lru_cache(maxsize=1)
+def _candidates_adapter() -> TypeAdapter:
+    """Validator for a whole list of candidates, built once."""
+    return TypeAdapter(list[VideoCandidate])
+
+
+def candidates_from_videos(videos: list) -> list[VideoCandidate]:
+    """Convert search result videos into unclassified candidates.
+
+    Validates the whole list in one call, which is several times faster
+    than constructing each VideoCandidate on its own.
+
+    Args:
+        videos: VideoMetadata items from a search
+
+    Returns:
+        One candidate per video, in the same order
+    """
+    return _candidates_adapter().validate_python([vars(v) for v in videos])
+
+
 # Entertainment/music channels - common false positive sources
 ENTERTAINMENT_INDICATORS = [
     "cover", "reaction", "music video", "official video", "lyrics",
@@ -53,6 +75,116 @@ INTERVIEW_INDICATORS = [
 ]
 
 
+@lru_cache(maxsize=64)
+def _pattern_matcher(patterns: tuple[str, ...]) -> Callable[[str], str | None]:
+    """Build a matcher returning the first pattern (in list order) found in a title.
+
+    Uses a single Aho-Corasick automaton over the lowercased patterns when
+    pyahocorasick is installed (the "fast" extra), so the title is scanned
+    once however many patterns there are; otherwise falls back to substring
+    checks. Matchers are cached per pattern tuple, so the indicator lists and
+    each identity's suspicious patterns are compiled once per process.
+    Titles passed to the matcher must already be lowercased.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        lowered = [(p.lower(), p) for p in patterns]
+        return lambda title: next((p for key, p in lowered if key in title), None)
+
+    automaton = ahocorasick.Automaton()
+    always = None  # An empty pattern is a substring of every title
+    for i, pattern in enumerate(patterns):
+        key = pattern.lower()
+        if not key:
+            always = always or (i, pattern)
+        elif not automaton.exists(key):
+            automaton.add_word(key, (i, pattern))
+    if not len(automaton):
+        return lambda title: always[1] if always else None
+    automaton.make_automaton()
+
+    def first_match(title: str) -> str | None:
+        best = always
+        for _, hit in automaton.iter(title):
+            if best is None or hit < best:
+                best = hit
+        return best[1] if best else None
+
+    return first_match
+
+
+class _KnownIds(NamedTuple):
+    """An identity's channel and video IDs, as containers to test membership."""
+
+    channels: Collection[str]
+    channel_keys: tuple[str, ...]  # Lowercased own-channel IDs
+    trusted_channels: Collection[str]
+    confirmed_videos: Collection[str]
+    rejected_videos: Collection[str]
+    suspicious: Callable[[str], str | None] | None
+
+
+def _known_ids(identity: Identity, as_sets: bool = False) -> _KnownIds:
+    """Collect identity's IDs and patterns for the per-candidate checks.
+
+    Building sets costs a pass over each list, so it only pays off when
+    many candidates are checked against the same identity.
+    """
+    channels = [c.id for c in identity.channels]
+    suspicious = (
+        _pattern_matcher(tuple(identity.suspicious_patterns))
+        if identity.suspicious_patterns
+        else None
+    )
+    channel_keys = tuple(c.lower() for c in channels)
+    if not as_sets:
+        return _KnownIds(
+            channels,
+            channel_keys,
+            identity.trusted_channels,
+            identity.confirmed_videos,
+            identity.rejected_videos,
+            suspicious,
+        )
+    return _KnownIds(
+        frozenset(channels),
+        channel_keys,
+        frozenset(identity.trusted_channels),
+        frozenset(identity.confirmed_videos),
+        frozenset(identity.rejected_videos),
+        suspicious,
+    )
+
+
+class _TitleRules(NamedTuple):
+    """What a title is checked for once the identity checks have passed."""
+
+    query_lower: str
+    query_parts: tuple[str, ...]
+    entertainment: Callable[[str], str | None]
+    interview: Callable[[str], str | None]
+
+
+class _Prepared(NamedTuple):
+    """Query and identity state shared by every candidate classified against them."""
+
+    rules: _TitleRules
+    known: _KnownIds | None
+
+
+def _prepare(query: str, identity: Identity | None, as_sets: bool = False) -> _Prepared:
+    """Lowercase the query and look up matchers once for a batch of candidates."""
+    query_lower = query.lower()
+    rules = _TitleRules(
+        query_lower,
+        tuple(query_lower.split()),
+        _pattern_matcher(tuple(ENTERTAINMENT_INDICATORS)),
+        _pattern_matcher(tuple(INTERVIEW_INDICATORS)),
+    )
+    return _Prepared(rules, _known_ids(identity, as_sets) if identity else None)
+
+
 def classify_candidate(
     candidate: VideoCandidate,
     query: str,
@@ -63,61 +195,109 @@ def classify_candidate(
     
     Returns (classification, reason, confidence).
     """
+    return _classify_one(candidate, _prepare(query, identity))
+
+
+def _classify_one(
+    candidate: VideoCandidate,
+    prepared: _Prepared,
+) -> tuple[Literal["likely", "uncertain", "false_positive"], str, float]:
+    """classify_candidate with the query and identity already prepared."""
+    # Check against identity's known data; the ID lookups come first so a
+    # known candidate is answered without lowercasing or scanning its title
+    known = prepared.known
+    if known is not None:
+        verdict = _identity_verdict(candidate, known)
+        if verdict is not None:
+            return verdict
+
     title_lower = candidate.title.lower()
-    query_lower = query.lower()
-    query_parts = query_lower.split()
-
-    # Check against identity's known data
-    if identity:
-        # From subject's own channel - highest confidence
-        channel_ids = [c.id for c in identity.channels]
-        if candidate.channel_id in channel_ids or any(
-            c.id.lower() in candidate.channel.lower() for c in identity.channels
-        ):
+
+    # Matches suspicious pattern
+    if known is not None and known.suspicious is not None:
+        pattern = known.suspicious(title_lower)
+        if pattern is not None:
+            return ("false_positive", f"matches suspicious pattern: {pattern}", 0.7)
+
+    return _classify_title(title_lower, prepared.rules)
+
+
+def _identity_verdict(
+    candidate: VideoCandidate,
+    known: _KnownIds,
+) -> tuple[Literal["likely", "uncertain", "false_positive"], str, float] | None:
+    """Classify a candidate by its channel and video IDs, if the identity knows them."""
+    # From subject's own channel - highest confidence
+    if candidate.channel_id in known.channels:
+        return ("likely", "from subject's own channel", 0.99)
+    if known.channel_keys:
+        channel_lower = candidate.channel.lower()
+        if any(key in channel_lower for key in known.channel_keys):
             return ("likely", "from subject's own channel", 0.99)
 
-        # From trusted channel
-        if candidate.channel_id in identity.trusted_channels:
-            return ("likely", "from trusted channel", 0.95)
+    # From trusted channel
+    if candidate.channel_id in known.trusted_channels:
+        return ("likely", "from trusted channel", 0.95)
 
-        # Previously confirmed
-        if candidate.id in identity.confirmed_videos:
-            return ("likely", "previously confirmed", 1.0)
+    # Previously confirmed
+    if candidate.id in known.confirmed_videos:
+        return ("likely", "previously confirmed", 1.0)
 
-        # Previously rejected
-        if candidate.id in identity.rejected_videos:
-            return ("false_positive", "previously rejected", 1.0)
+    # Previously rejected
+    if candidate.id in known.rejected_videos:
+        return ("false_positive", "previously rejected", 1.0)
+
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _classify_title(
+    title_lower: str,
+    rules: _TitleRules,
+) -> tuple[Literal["likely", "uncertain", "false_positive"], str, float]:
+    """Classify a lowercased title by name and format alone.
+
+    This part depends only on the title and the query, not on the
+    candidate's IDs or the identity, so repeated titles (re-runs of the
+    same search, reuploads) are answered from the cache.
+    """
+    return _title_verdict(title_lower, rules, title_lower.__contains__)
 
-        # Matches suspicious pattern
-        for pattern in identity.suspicious_patterns:
-            if pattern.lower() in title_lower:
-                return ("false_positive", f"matches suspicious pattern: {pattern}", 0.7)
+
+def _title_verdict(
+    title_lower: str,
+    rules: _TitleRules,
+    contains: Callable[[str], bool],
+) -> tuple[Literal["likely", "uncertain", "false_positive"], str, float]:
+    """Title rules, with name lookups answered by `contains`.
+
+    `contains(name)` must say whether the lowercased query or one of its
+    parts occurs in the title; the format indicators still scan `title_lower`.
+    """
+    query_parts = rules.query_parts
 
     # Full name in title - strong signal
-    if query_lower in title_lower:
+    if contains(rules.query_lower):
         return ("likely", "full name in title", 0.85)
 
     # All name parts in title
-    if all(part in title_lower for part in query_parts):
+    if all(contains(part) for part in query_parts):
         # Check for entertainment false positives
-        for indicator in ENTERTAINMENT_INDICATORS:
-            if indicator in title_lower:
-                return ("false_positive", f"entertainment content ({indicator})", 0.8)
+        indicator = rules.entertainment(title_lower)
+        if indicator is not None:
+            return ("false_positive", f"entertainment content ({indicator})", 0.8)
         return ("likely", "all name parts in title", 0.75)
 
-    # Interview/podcast format with partial match
-    has_interview_indicator = any(ind in title_lower for ind in INTERVIEW_INDICATORS)
-    has_partial_match = any(part in title_lower for part in query_parts)
+    # Without any name part the interview indicators cannot matter
+    if any(contains(part) for part in query_parts):
+        # Interview/podcast format with partial match
+        if rules.interview(title_lower) is not None:
+            return ("uncertain", "interview format with partial name match", 0.5)
 
-    if has_interview_indicator and has_partial_match:
-        return ("uncertain", "interview format with partial name match", 0.5)
-
-    # Partial match only - uncertain
-    if has_partial_match:
-        # Check for entertainment first
-        for indicator in ENTERTAINMENT_INDICATORS:
-            if indicator in title_lower:
-                return ("false_positive", f"entertainment content ({indicator})", 0.8)
+        # Partial match only - uncertain, unless it is entertainment
+        indicator = rules.entertainment(title_lower)
+        if indicator is not None:
+            return ("false_positive", f"entertainment content ({indicator})", 0.8)
         return ("uncertain", "partial name match only", 0.3)
 
     # No meaningful match
@@ -130,16 +310,88 @@ def classify_candidates(
     identity: Identity | None = None,
 ) -> list[VideoCandidate]:
     """Classify all candidates in a list."""
+    prepared = _prepare(query, identity, as_sets=True)
     for candidate in candidates:
-        classification, reason, confidence = classify_candidate(
-            candidate, query, identity
-        )
+        classification, reason, confidence = _classify_one(candidate, prepared)
         candidate.classification = classification
         candidate.classification_reason = reason
         candidate.confidence = confidence
     return candidates
 
 
+@lru_cache(maxsize=64)
+def _name_scanner(names: tuple[str, ...]) -> Callable[[str], set[str]]:
+    """Build a scanner returning which of `names` occur in a lowercased title.
+
+    Like _pattern_matcher, uses one Aho-Corasick automaton when pyahocorasick
+    is installed, so the title is read once however many names there are,
+    and falls back to a substring check per name otherwise. The empty name
+    is always reported, since it is a substring of every title.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return lambda title: {name for name in names if name in title}
+
+    automaton = ahocorasick.Automaton()
+    for name in names:
+        if name and not automaton.exists(name):
+            automaton.add_word(name, name)
+    if not len(automaton):
+        return lambda title: {""}
+    automaton.make_automaton()
+
+    def scan(title: str) -> set[str]:
+        found = {name for _, name in automaton.iter(title)}
+        found.add("")
+        return found
+
+    return scan
+
+
+class MultiIdentityClassifier:
+    """Classify candidates against several subjects at once.
+
+    Batch discovery for N people would otherwise check every title against
+    each subject's name separately. Here the names and name parts of all
+    subjects go into one scanner, so each title is read once and every
+    subject's name rules are answered from the set of names it contains.
+    Results match classify_candidate for each (identity, query) pair; with
+    a single subject, classify_candidates is the simpler call.
+
+    Args:
+        subjects: (identity, query) pairs; identity may be None to classify
+            by query alone
+    """
+
+    def __init__(self, subjects: list[tuple[Identity | None, str]]):
+        self._prepared = [_prepare(query, identity, as_sets=True) for identity, query in subjects]
+        names = dict.fromkeys(
+            name
+            for prepared in self._prepared
+            for name in (prepared.rules.query_lower, *prepared.rules.query_parts)
+        )
+        self._scan = _name_scanner(tuple(names))
+
+    def classify(
+        self, candidate: VideoCandidate
+    ) -> list[tuple[Literal["likely", "uncertain", "false_positive"], str, float]]:
+        """Classify one candidate for every subject, in the order given."""
+        title_lower = candidate.title.lower()
+        contains = self._scan(title_lower).__contains__
+        results = []
+        for rules, known in self._prepared:
+            verdict = None
+            if known is not None:
+                verdict = _identity_verdict(candidate, known)
+                if verdict is None and known.suspicious is not None:
+                    pattern = known.suspicious(title_lower)
+                    if pattern is not None:
+                        verdict = ("false_positive", f"matches suspicious pattern: {pattern}", 0.7)
+            results.append(verdict or _title_verdict(title_lower, rules, contains))
+        return results
+
+
 def update_identity_from_feedback(
     identity: Identity,
     candidate: VideoCandidate,
@@ -1,6 +1,9 @@
 """CLI entrypoint for Weave - Comprehensive worldview synthesis tool."""
 
 import json
+import os
+import re
+import stat
 from pathlib import Path
 
 import click
@@ -91,13 +94,74 @@ def main(ctx: click.Context, debug: bool, subject: str | None, search: bool, cha
                 click.echo("  Run 'wve --help' for CLI commands.")
 
 
+def _model_json(model) -> bytes:
+    """Indented JSON for a pydantic model, as UTF-8 bytes.
+
+    Encodes with orjson when installed (the `fast` extra); the output is
+    byte-identical to pydantic's own model_dump_json(indent=2).
+    """
+    try:
+        import orjson
+    except ImportError:
+        return model.model_dump_json(indent=2).encode()
+    return orjson.dumps(model.model_dump(mode="json"), option=orjson.OPT_INDENT_2)
+
+
+def _json_bytes(data) -> bytes:
+    """Indented JSON for CLI output, as UTF-8 bytes.
+
+    Encodes with orjson when installed (the `fast` extra). Values JSON has
+    no type for, such as datetimes and paths, are written with str(), as
+    json.dumps(default=str) does.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(data, indent=2, default=str).encode()
+    return orjson.dumps(
+        data,
+        default=str,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+    )
+
+
+# A --accept/--reject selection: comma-separated indices or inclusive ranges
+_SELECTION_ITEM_RE = re.compile(r"\s*(\d+)\s*(?:-\s*(\d+)\s*)?")
+_SELECTION_RE = re.compile(
+    rf"{_SELECTION_ITEM_RE.pattern}(?:,{_SELECTION_ITEM_RE.pattern})*"
+)
+
+
+def _parse_selection(selection: str | None, param: str) -> set[int]:
+    """1-based candidate indices named by a selection such as "1,3" or "2-5".
+
+    Raises:
+        click.BadParameter: If the selection is not a list of indices and ranges.
+    """
+    if not selection:
+        return set()
+    if not _SELECTION_RE.fullmatch(selection):
+        raise click.BadParameter(
+            f"expected indices like 1,3 or 2-5, got {selection!r}", param_hint=param
+        )
+
+    indices: set[int] = set()
+    for match in _SELECTION_ITEM_RE.finditer(selection):
+        start = int(match[1])
+        if match[2] is None:
+            indices.add(start)
+        else:
+            indices.update(range(start, int(match[2]) + 1))
+    return indices
+
+
 def _run_non_interactive(subject: str, channel: str | None = None) -> None:
     """Run fully non-interactive extraction: discover, auto-accept likely, fetch."""
     import subprocess
     
     from rich.console import Console
     
-    from wve.classify import CandidateSet, VideoCandidate, classify_candidates
+    from wve.classify import CandidateSet, candidates_from_videos, classify_candidates
     from wve.identity import slugify
     from wve.search import search_videos
     from wve.transcripts import download_transcript
@@ -112,18 +176,7 @@ def _run_non_interactive(subject: str, channel: str | None = None) -> None:
     results = search_videos(subject, max_results=20, channel=channel)
     
     # Convert and classify
-    candidates = [
-        VideoCandidate(
-            id=v.id,
-            title=v.title,
-            channel=v.channel,
-            channel_id=v.channel_id,
-            duration_seconds=v.duration_seconds,
-            url=v.url,
-            published=v.published,
-        )
-        for v in results.videos
-    ]
+    candidates = candidates_from_videos(results.videos)
     
     classify_candidates(candidates, subject, None)
     
@@ -160,6 +213,35 @@ def _run_non_interactive(subject: str, channel: str | None = None) -> None:
 
 # === Primary Entry Point ===
 
+_URL_RE = re.compile(r"https?://")
+_URL_LINE_RE = re.compile(r"^[ \t]*(https?://\S+)", re.MULTILINE)
+
+
+def _classify_input(inp: str) -> str:
+    """Return 'url', 'file', 'dir', 'url_list', 'missing' or 'unknown'.
+
+    Costs at most one regex match and one stat call per input.
+    """
+    if _URL_RE.match(inp):
+        return "url"
+    try:
+        mode = os.stat(inp).st_mode
+    except OSError:
+        return "missing"
+    if stat.S_ISDIR(mode):
+        return "dir"
+    if stat.S_ISREG(mode):
+        try:
+            with open(inp) as f:
+                content = f.read()
+            lines = [l.strip() for l in content.split("\n") if l.strip() and not l.startswith("#")]
+            if lines and all(_URL_RE.match(l) for l in lines[:5]):
+                return "url_list"
+        except Exception:
+            pass
+        return "file"
+    return "unknown"
+
 
 @main.command()
 @click.argument("input", nargs=-1, required=False)
@@ -170,6 +252,7 @@ def _run_non_interactive(subject: str, channel: str | None = None) -> None:
 @click.option("--force", is_flag=True, help="Re-download even if transcripts exist")
 @click.option("--fetch-only", is_flag=True, help="Download transcripts only, no analysis")
 @click.option("--report-only", is_flag=True, help="Analyze existing transcripts only")
+@click.option("--workers", default=8, show_default=True, help="Concurrent downloads")
 @click.option("--json", "as_json", is_flag=True, help="Output report as JSON")
 def run(
     input: tuple[str, ...],
@@ -180,6 +263,7 @@ def run(
     force: bool,
     fetch_only: bool,
     report_only: bool,
+    workers: int,
     as_json: bool,
 ) -> None:
     """Build your worldview library from any source.
@@ -207,9 +291,9 @@ def run(
       wve store show <slug>       View a worldview
       wve store delete <slug>     Remove a worldview
     """
-    import re
     import shutil
     from collections import Counter
+    from concurrent.futures import ThreadPoolExecutor, as_completed
     from datetime import datetime
     from pathlib import Path
 
@@ -217,8 +301,9 @@ def run(
     from rich.panel import Panel
     from rich.table import Table
 
+    from wve.cache import directory_fingerprint
     from wve.identity import extract_video_id, slugify
-    from wve.quotes import extract_quotes_from_dir
+    from wve.quotes import cached_quotes_from_dir
     from wve.store import WorldviewEntry, get_entry_dir, get_store_dir, load_entry, save_entry
     from wve.transcripts import download_transcript
     from wve.theme import get_console
@@ -258,42 +343,20 @@ def run(
         raise SystemExit(1)
 
     # === Input Classification ===
-    def classify_input(inp: str) -> str:
-        """Return 'url', 'file', 'dir', or 'url_list'."""
-        if inp.startswith(("http://", "https://")):
-            return "url"
-        p = Path(inp)
-        if p.is_dir():
-            return "dir"
-        if p.is_file():
-            try:
-                content = p.read_text()
-                lines = [l.strip() for l in content.split("\n") if l.strip() and not l.startswith("#")]
-                if lines and all(l.startswith(("http://", "https://")) for l in lines[:5]):
-                    return "url_list"
-            except Exception:
-                pass
-            return "file"
-        return "unknown"
-
     urls_to_fetch: list[str] = []
     local_files: list[Path] = []
     existing_transcript_dir: Path | None = None
 
     for inp in all_inputs:
-        inp_type = classify_input(inp)
+        inp_type = _classify_input(inp)
         if inp_type == "url":
             urls_to_fetch.append(inp)
         elif inp_type == "url_list":
-            with open(inp) as f:
-                url_count = 0
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        urls_to_fetch.append(line)
-                        url_count += 1
+            # Comment and blank lines never start with a URL, so one sweep skips them
+            urls = _URL_LINE_RE.findall(Path(inp).read_text())
+            urls_to_fetch.extend(urls)
             if not as_json:
-                console.print(f"[dim]Loaded {url_count} URLs from {inp}[/dim]")
+                console.print(f"[dim]Loaded {len(urls)} URLs from {inp}[/dim]")
         elif inp_type == "dir":
             existing_transcript_dir = Path(inp)
             if not as_json:
@@ -305,7 +368,7 @@ def run(
             console.print()
             console.print(f"[yellow bold]Unknown input:[/yellow bold] {inp}")
             console.print()
-            if not Path(inp).exists():
+            if inp_type == "missing":
                 console.print(f"  File or directory does not exist: [red]{inp}[/red]")
                 console.print()
                 console.print("  Did you mean to provide a URL? Make sure it starts with http:// or https://")
@@ -346,6 +409,8 @@ def run(
                 console.print("[dim]Skipping download. Use --force to re-download.[/dim]")
         else:
             # === Download Transcripts ===
+            # The same URL twice would race on one output file
+            urls_to_fetch = list(dict.fromkeys(urls_to_fetch))
             if urls_to_fetch:
                 if not as_json:
                     console.print()
@@ -366,20 +431,28 @@ def run(
                     disable=as_json,
                 ) as progress:
                     task = progress.add_task("Fetching transcripts...", total=len(urls_to_fetch))
-                    for video_url in urls_to_fetch:
-                        vid_id = "unknown"
-                        try:
-                            vid_id = extract_video_id(video_url)
-                            progress.update(task, description=f"[dim]{vid_id}[/dim]")
-                        except Exception:
-                            progress.update(task, description=f"[dim]{video_url[:30]}...[/dim]")
-
-                        result = download_transcript(video_url, transcripts_dir, lang)
-                        if result:
-                            succeeded.append(vid_id)
-                        else:
-                            failed.append((vid_id, video_url))
-                        progress.advance(task)
+                    # Downloads are network-bound, so run several at once as
+                    # fetch does; results are collected in input order
+                    n_workers = max(1, min(workers, len(urls_to_fetch)))
+                    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                        futures = {
+                            executor.submit(download_transcript, video_url, transcripts_dir, lang): video_url
+                            for video_url in urls_to_fetch
+                        }
+                        for future in as_completed(futures):
+                            progress.update(task, description=f"[dim]{futures[future][:30]}...[/dim]")
+                            progress.advance(task)
+
+                for future, video_url in futures.items():
+                    vid_id = "unknown"
+                    try:
+                        vid_id = extract_video_id(video_url)
+                    except Exception:
+                        pass
+                    if future.result():
+                        succeeded.append(vid_id)
+                    else:
+                        failed.append((vid_id, video_url))
 
                 if not as_json:
                     if succeeded:
@@ -458,7 +531,12 @@ def run(
         console.print()
         console.print(f"[bold]Analyzing {len(transcript_files)} transcript(s)...[/bold]")
 
-    collection = extract_quotes_from_dir(transcripts_dir, max_quotes=100, min_score=0.2)
+    # Re-running on unchanged transcripts (e.g. --report-only to regenerate
+    # the report) reuses the quotes from the last run
+    collection = cached_quotes_from_dir(
+        str(transcripts_dir), tuple(directory_fingerprint(transcripts_dir)), 100, 0.2,
+        parallel=True,
+    )
 
     # === Theme Extraction ===
     word_counts: Counter[str] = Counter()
@@ -519,6 +597,11 @@ def run(
     report_path = output_path / "report.md"
     report_path.write_text(report_text)
 
+    # Dumped once and shared by the store entry and the JSON output
+    themes = [{"name": w.title(), "count": c} for w, c in top_themes]
+    top_quotes = [q.model_dump() for q in collection.quotes[:20]]
+    contrarian_quotes = [q.model_dump() for q in contrarian[:15]]
+
     # === Save to Store ===
     if use_store:
         entry = WorldviewEntry(
@@ -526,9 +609,9 @@ def run(
             display_name=subject,
             source_count=collection.source_count,
             quote_count=len(collection.quotes),
-            themes=[{"name": w.title(), "count": c} for w, c in top_themes],
-            top_quotes=[q.model_dump() for q in collection.quotes[:20]],
-            contrarian_quotes=[q.model_dump() for q in contrarian[:15]],
+            themes=themes,
+            top_quotes=top_quotes,
+            contrarian_quotes=contrarian_quotes,
             transcripts_dir=str(transcripts_dir),
             report_path=str(report_path),
         )
@@ -542,14 +625,14 @@ def run(
             "generated_at": datetime.now().isoformat(),
             "source_count": collection.source_count,
             "total_quotes": len(collection.quotes),
-            "themes": [{"name": w.title(), "count": c} for w, c in top_themes],
-            "top_quotes": [q.model_dump() for q in collection.quotes[:20]],
-            "contrarian_quotes": [q.model_dump() for q in contrarian[:15]],
+            "themes": themes,
+            "top_quotes": top_quotes,
+            "contrarian_quotes": contrarian_quotes,
             "report_path": str(report_path),
             "transcripts_dir": str(transcripts_dir),
             "stored": use_store,
         }
-        click.echo(json.dumps(result, indent=2, default=str))
+        click.echo(_json_bytes(result))
         return
 
     # === Success Output ===
@@ -638,7 +721,7 @@ def identity_list(as_json: bool) -> None:
     identities = list_identities()
 
     if as_json:
-        click.echo(json.dumps([i.model_dump() for i in identities], indent=2, default=str))
+        click.echo(_json_bytes([i.model_dump() for i in identities]))
     elif not identities:
         click.echo("No identities found. Create one with: wve identity create <name>")
     else:
@@ -793,7 +876,7 @@ def discover(
     from rich.console import Console
     from rich.table import Table
 
-    from wve.classify import CandidateSet, VideoCandidate, classify_candidates
+    from wve.classify import CandidateSet, candidates_from_videos, classify_candidates
     from wve.identity import load_identity
     from wve.search import search_videos
 
@@ -823,18 +906,7 @@ def discover(
     )
 
     # Convert to candidates
-    candidates = [
-        VideoCandidate(
-            id=v.id,
-            title=v.title,
-            channel=v.channel,
-            channel_id=v.channel_id,
-            duration_seconds=v.duration_seconds,
-            url=v.url,
-            published=v.published,
-        )
-        for v in results.videos
-    ]
+    candidates = candidates_from_videos(results.videos)
 
     # Apply strict filter
     if strict:
@@ -853,7 +925,7 @@ def discover(
 
     # Output
     if as_json:
-        click.echo(candidate_set.model_dump_json(indent=2))
+        click.echo(_model_json(candidate_set))
     else:
         # Group by classification
         likely = [c for c in candidates if c.classification == "likely"]
@@ -906,8 +978,7 @@ def discover(
         console.print(f"[dim]Summary: {len(likely)} likely, {len(uncertain)} uncertain, {len(false_pos)} false positives[/dim]")
 
         if output:
-            with open(output, "w") as f:
-                f.write(candidate_set.model_dump_json(indent=2))
+            Path(output).write_bytes(_model_json(candidate_set))
             console.print(f"\nSaved to: {output}")
         else:
             console.print("\n[dim]Use --output/-o to save candidates for confirmation[/dim]")
@@ -948,8 +1019,9 @@ def confirm(
 
     console = Console(stderr=True)
 
-    # Load candidates
-    with open(input) as f:
+    # Load candidates; pydantic parses the raw bytes directly, skipping a
+    # UTF-8 decode into an intermediate str
+    with open(input, "rb") as f:
         candidate_set = CandidateSet.model_validate_json(f.read())
 
     candidates = candidate_set.candidates
@@ -975,22 +1047,8 @@ def confirm(
         except FileNotFoundError:
             pass
 
-    # Parse accept/reject indices
-    def parse_indices(s: str | None) -> set[int]:
-        if not s:
-            return set()
-        indices = set()
-        for part in s.split(","):
-            part = part.strip()
-            if "-" in part:
-                start, end = part.split("-", 1)
-                indices.update(range(int(start), int(end) + 1))
-            else:
-                indices.add(int(part))
-        return indices
-
-    accept_set = parse_indices(accept_ids)
-    reject_set = parse_indices(reject_ids)
+    accept_set = _parse_selection(accept_ids, "--accept")
+    reject_set = _parse_selection(reject_ids, "--reject")
 
     # Batch mode or interactive
     is_batch = bool(accept_ids or reject_ids or accept_likely)
@@ -1070,7 +1128,7 @@ def confirm(
             "skipped": [c.model_dump() for c in skipped],
             "count": {"confirmed": len(confirmed), "rejected": len(rejected), "skipped": len(skipped)},
         }
-        click.echo(json.dumps(result, indent=2, default=str))
+        click.echo(_json_bytes(result))
     else:
         console.print(f"\n[green]Confirmed: {len(confirmed)}[/green]")
         console.print(f"[red]Rejected: {len(rejected)}[/red]")
@@ -1083,8 +1141,7 @@ def confirm(
             identity_slug=identity_slug,
             candidates=confirmed,
         )
-        with open(output, "w") as f:
-            f.write(confirmed_set.model_dump_json(indent=2))
+        Path(output).write_bytes(_model_json(confirmed_set))
         if not as_json:
             console.print(f"\nSaved {len(confirmed)} confirmed candidates to: {output}")
 
@@ -1094,12 +1151,16 @@ def confirm(
 @click.option("--identity", "-i", "identity_slug", help="Fetch all confirmed videos from identity")
 @click.option("--output-dir", "-o", type=click.Path(), default="./transcripts", help="Output directory")
 @click.option("--lang", default="en", help="Preferred language code")
+@click.option("--workers", default=8, show_default=True, help="Concurrent downloads")
+@click.option("--force", is_flag=True, help="Re-download even if transcripts exist")
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
 def fetch(
     input: str | None,
     identity_slug: str | None,
     output_dir: str,
     lang: str,
+    workers: int,
+    force: bool,
     as_json: bool,
 ) -> None:
     """Download transcripts for confirmed videos.
@@ -1107,6 +1168,7 @@ def fetch(
     INPUT can be a confirmed.json file from 'wve confirm'.
     Alternatively, use --identity to fetch all confirmed videos from an identity.
     """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
     from pathlib import Path
 
     from rich.console import Console
@@ -1137,7 +1199,7 @@ def fetch(
             console.print(f"Fetching {len(videos_to_fetch)} confirmed videos from {identity.display_name}")
 
     elif input:
-        with open(input) as f:
+        with open(input, "rb") as f:
             candidate_set = CandidateSet.model_validate_json(f.read())
 
         for c in candidate_set.candidates:
@@ -1151,6 +1213,12 @@ def fetch(
         console.print("[red]Provide either INPUT file or --identity[/red]")
         raise SystemExit(1)
 
+    # A repeated ID would start two downloads racing on the same output files
+    unique: dict[str, tuple[str, str, str]] = {}
+    for video in videos_to_fetch:
+        unique.setdefault(video[0], video)
+    videos_to_fetch = list(unique.values())
+
     if not videos_to_fetch:
         if as_json:
             click.echo(json.dumps({"fetched": 0, "transcripts": []}))
@@ -1165,36 +1233,59 @@ def fetch(
     results = []
     failed = []
 
-    if as_json:
+    # A transcript already on disk from an earlier run is reused, so an
+    # interrupted batch resumes where it stopped
+    existing: dict[str, Path] = {}
+    if not force:
         for vid_id, url, title in videos_to_fetch:
-            transcript_path = download_transcript(url, output_path, lang)
-            if transcript_path:
-                results.append({"id": vid_id, "path": str(transcript_path)})
-            else:
-                failed.append(vid_id)
-    else:
-        with Progress(console=console) as progress:
-            task = progress.add_task("Downloading transcripts...", total=len(videos_to_fetch))
+            transcript_path = output_path / f"{vid_id}.txt"
+            if transcript_path.exists():
+                existing[vid_id] = transcript_path
+    pending = [v for v in videos_to_fetch if v[0] not in existing]
+
+    # Downloads are network-bound, so run several yt-dlp calls at once;
+    # results are collected in input order either way
+    downloaded = {}
+    if pending:
+        n_workers = max(1, min(workers, len(pending)))
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            futures = {
+                executor.submit(download_transcript, url, output_path, lang): vid_id
+                for vid_id, url, title in pending
+            }
+            if not as_json:
+                with Progress(console=console) as progress:
+                    task = progress.add_task("Downloading transcripts...", total=len(futures))
+                    for future in as_completed(futures):
+                        progress.update(task, description=f"[dim]{futures[future]}[/dim]")
+                        progress.advance(task)
+        downloaded = {vid_id: future.result() for future, vid_id in futures.items()}
 
-            for vid_id, url, title in videos_to_fetch:
-                progress.update(task, description=f"[dim]{vid_id}[/dim]")
-                transcript_path = download_transcript(url, output_path, lang)
-                if transcript_path:
-                    results.append({"id": vid_id, "path": str(transcript_path)})
-                else:
-                    failed.append(vid_id)
-                progress.advance(task)
+    fetched = 0
+    for vid_id, url, title in videos_to_fetch:
+        if vid_id in existing:
+            results.append({"id": vid_id, "path": str(existing[vid_id])})
+            continue
+        transcript_path = downloaded[vid_id]
+        if transcript_path:
+            results.append({"id": vid_id, "path": str(transcript_path)})
+            fetched += 1
+        else:
+            failed.append(vid_id)
 
     # Output
     if as_json:
         click.echo(json.dumps({
-            "fetched": len(results),
+            "fetched": fetched,
+            "skipped": len(existing),
             "failed": len(failed),
             "transcripts": results,
             "output_dir": str(output_path),
         }, indent=2))
     else:
-        console.print(f"\n[green]Fetched: {len(results)} transcripts[/green]")
+        console.print(f"\n[green]Fetched: {fetched} transcripts[/green]")
+        if existing:
+            console.print(f"[dim]Skipped: {len(existing)} already downloaded[/dim]")
         if failed:
             console.print(f"[red]Failed: {len(failed)}[/red]")
             for vid_id in failed[:5]:
@@ -1601,9 +1692,10 @@ def from_urls(
     results = []
     failed = []
 
+    video_ids = [extract_video_id(video_url) for video_url in urls]
+
     if as_json:
-        for video_url in urls:
-            vid_id = extract_video_id(video_url)
+        for video_url, vid_id in zip(urls, video_ids):
             transcript_path = download_transcript(video_url, output_path, lang)
             if transcript_path:
                 results.append({"id": vid_id, "url": video_url, "path": str(transcript_path)})
@@ -1614,8 +1706,7 @@ def from_urls(
     else:
         with Progress(console=console) as progress:
             task = progress.add_task("Downloading...", total=len(urls))
-            for video_url in urls:
-                vid_id = extract_video_id(video_url)
+            for video_url, vid_id in zip(urls, video_ids):
                 progress.update(task, description=f"[dim]{vid_id}[/dim]")
                 transcript_path = download_transcript(video_url, output_path, lang)
                 if transcript_path:
@@ -1694,7 +1785,7 @@ def ingest(
 
     if as_json:
         sources_json = [s.model_dump() for s in sources.values()]
-        click.echo(json.dumps(sources_json, indent=2, default=str))
+        click.echo(_json_bytes(sources_json))
     else:
         from rich.table import Table
 
@@ -1760,6 +1851,7 @@ def quotes(
         input_path,
         max_quotes=max_quotes,
         min_score=min_score,
+        parallel=True,
     )
 
     # Filter contrarian if requested
@@ -1767,8 +1859,11 @@ def quotes(
         collection.quotes = [q for q in collection.quotes if q.is_contrarian]
         collection.quotes = collection.quotes[:max_quotes]
 
+    # Encoded once for both stdout and --output
+    payload = _model_json(collection) if as_json or output else b""
+
     if as_json:
-        click.echo(collection.model_dump_json(indent=2))
+        click.echo(payload)
     else:
         console.print(f"\nFound {len(collection.quotes)} notable quotes from {collection.source_count} sources\n")
 
@@ -1783,8 +1878,7 @@ def quotes(
             console.print(f"[dim]... and {len(collection.quotes) - 20} more quotes[/dim]")
 
     if output:
-        with open(output, "w") as f:
-            f.write(collection.model_dump_json(indent=2))
+        Path(output).write_bytes(payload)
         if not as_json:
             console.print(f"\nSaved to: {output}")
 
@@ -1824,7 +1918,7 @@ def themes(
         console.print(f"Extracting themes from: {input}")
 
     # First extract quotes
-    collection = extract_quotes_from_dir(input_path, max_quotes=100, min_score=0.2)
+    collection = extract_quotes_from_dir(input_path, max_quotes=100, min_score=0.2, parallel=True)
 
     # Simple theme grouping by common words/phrases
     # This is a basic implementation - could be enhanced with clustering
@@ -1876,7 +1970,7 @@ def themes(
     }
 
     if as_json:
-        click.echo(json.dumps(result, indent=2, default=str))
+        click.echo(_json_bytes(result))
     else:
         console.print(f"\nFound {len(themes_data)} themes from {collection.source_count} sources\n")
 
@@ -1887,8 +1981,7 @@ def themes(
             console.print()
 
     if output:
-        with open(output, "w") as f:
-            json.dump(result, f, indent=2, default=str)
+        Path(output).write_bytes(_json_bytes(result))
         if not as_json:
             console.print(f"Saved to: {output}")
 
@@ -1926,7 +2019,7 @@ def contrast(
         console.print(f"Finding contrarian views for: {subject}")
 
     # Extract quotes with lower threshold to catch more contrarian statements
-    collection = extract_quotes_from_dir(input_path, max_quotes=200, min_score=0.2)
+    collection = extract_quotes_from_dir(input_path, max_quotes=200, min_score=0.2, parallel=True)
 
     # Filter to contrarian quotes
     contrarian_quotes = [q for q in collection.quotes if q.is_contrarian]
@@ -1939,7 +2032,7 @@ def contrast(
     }
 
     if as_json:
-        click.echo(json.dumps(result, indent=2, default=str))
+        click.echo(_json_bytes(result))
     else:
         console.print(f"\nFound {len(contrarian_quotes)} contrarian statements\n")
 
@@ -1952,8 +2045,7 @@ def contrast(
             console.print(f"[dim]... and {len(contrarian_quotes) - 15} more[/dim]")
 
     if output:
-        with open(output, "w") as f:
-            json.dump(result, f, indent=2, default=str)
+        Path(output).write_bytes(_json_bytes(result))
         if not as_json:
             console.print(f"\nSaved to: {output}")
 
@@ -1974,7 +2066,7 @@ def refine(
     from rich.console import Console
     from rich.prompt import Prompt
 
-    from wve.classify import CandidateSet, VideoCandidate, classify_candidates
+    from wve.classify import CandidateSet, candidates_from_videos, classify_candidates
     from wve.identity import load_identity
     from wve.search import search_videos
 
@@ -2008,7 +2100,7 @@ def refine(
             "channels": channel_count,
             "suggested_searches": suggestions,
         }
-        click.echo(json.dumps(result, indent=2))
+        click.echo(_json_bytes(result))
         return
 
     console.print(f"\n[bold]Refining: {identity.display_name}[/bold]")
@@ -2038,24 +2130,11 @@ def refine(
     results = search_videos(query, max_results=20)
 
     # Convert and classify
-    candidates = [
-        VideoCandidate(
-            id=v.id,
-            title=v.title,
-            channel=v.channel,
-            channel_id=v.channel_id,
-            duration_seconds=v.duration_seconds,
-            url=v.url,
-            published=v.published,
-        )
-        for v in results.videos
-    ]
+    candidates = candidates_from_videos(results.videos)
 
     # Filter out already confirmed/rejected
-    new_candidates = [
-        c for c in candidates
-        if c.id not in identity.confirmed_videos and c.id not in identity.rejected_videos
-    ]
+    seen = {*identity.confirmed_videos, *identity.rejected_videos}
+    new_candidates = [c for c in candidates if c.id not in seen]
 
     classify_candidates(new_candidates, identity.display_name, identity)
 
@@ -2079,8 +2158,7 @@ def refine(
             identity_slug=identity_slug,
             candidates=new_candidates,
         )
-        with open(output, "w") as f:
-            f.write(candidate_set.model_dump_json(indent=2))
+        Path(output).write_bytes(_model_json(candidate_set))
         console.print(f"\nSaved to: {output}")
 
 
@@ -2118,7 +2196,7 @@ def report(
         console.print(f"Generating report for: {subject}")
 
     # Extract quotes
-    collection = extract_quotes_from_dir(input_path, max_quotes=100, min_score=0.2)
+    collection = extract_quotes_from_dir(input_path, max_quotes=100, min_score=0.2, parallel=True)
 
     # Separate contrarian quotes
     contrarian = [q for q in collection.quotes if q.is_contrarian]
@@ -2151,7 +2229,7 @@ def report(
             "top_quotes": [q.model_dump() for q in top_quotes],
             "contrarian_quotes": [q.model_dump() for q in contrarian[:15]],
         }
-        click.echo(json.dumps(result, indent=2, default=str))
+        click.echo(_json_bytes(result))
     else:
         # Generate markdown report
         lines = [
@@ -2323,11 +2401,13 @@ def extract(input: str, method: str, top: int, output: str | None) -> None:
     click.echo(f"Loaded {len(texts)} transcripts")
 
     if method == "all":
-        extraction = extract_all(texts, source_ids, top_n=top)
+        extraction = extract_all(texts, source_ids, top_n=top, parallel=True)
     else:
         extraction = Extraction(source_transcripts=source_ids)
         if method == "keywords":
-            extraction.keywords = extract_keywords_yake(texts, source_ids, top_n=top)
+            extraction.keywords = extract_keywords_yake(
+                texts, source_ids, top_n=top, parallel=True
+            )
         elif method == "entities":
             extraction.entities = extract_entities_spacy(texts, source_ids)
         elif method == "phrases":
@@ -2473,7 +2553,7 @@ def pipeline(person: str, depth: str, max_videos: int, output_dir: str, cache: b
     if not texts:
         click.echo("  No transcripts to process!")
         return
-    extraction = extract_all(texts, source_ids)
+    extraction = extract_all(texts, source_ids, parallel=True)
     save_extraction(extraction, str(out / "extraction.json"))
     click.echo(f"  Extracted {len(extraction.keywords)} keywords")
 
@@ -2505,32 +2585,47 @@ def inspect(artifact: str) -> None:
         data = json.load(f)
 
     # Detect artifact type and display appropriately
+    # Build all lines first and emit them in a single write
     if "videos" in data and "query" in data:
-        click.echo(f"Search Results: {data['query']}")
-        click.echo(f"Videos: {len(data['videos'])}")
-        for v in data["videos"][:10]:
-            click.echo(f"  - {v['title'][:60]}... ({v['duration_seconds'] // 60}m)")
+        lines = [
+            f"Search Results: {data['query']}",
+            f"Videos: {len(data['videos'])}",
+        ]
+        lines.extend(
+            f"  - {v['title'][:60]}... ({v['duration_seconds'] // 60}m)"
+            for v in data["videos"][:10]
+        )
 
     elif "clusters" in data:
-        click.echo(f"Cluster Results (silhouette: {data.get('silhouette_score', 0):.2f})")
-        for c in data["clusters"]:
-            click.echo(f"  [{c['id']}] {c['label']} - {len(c['members'])} members")
+        lines = [f"Cluster Results (silhouette: {data.get('silhouette_score', 0):.2f})"]
+        lines.extend(
+            f"  [{c['id']}] {c['label']} - {len(c['members'])} members"
+            for c in data["clusters"]
+        )
 
     elif "keywords" in data:
-        click.echo("Extraction Results")
-        click.echo(f"  Keywords: {len(data.get('keywords', []))}")
-        click.echo(f"  TF-IDF terms: {len(data.get('tfidf', []))}")
-        click.echo(f"  Phrases: {len(data.get('phrases', []))}")
-        click.echo(f"  Entities: {len(data.get('entities', {}))}")
+        lines = [
+            "Extraction Results",
+            f"  Keywords: {len(data.get('keywords', []))}",
+            f"  TF-IDF terms: {len(data.get('tfidf', []))}",
+            f"  Phrases: {len(data.get('phrases', []))}",
+            f"  Entities: {len(data.get('entities', {}))}",
+        ]
 
     elif "points" in data:
-        click.echo(f"Worldview: {data.get('subject', 'Unknown')}")
-        click.echo(f"Depth: {data.get('depth', 'unknown')}")
-        for i, p in enumerate(data["points"], 1):
-            click.echo(f"  {i}. {p['point']} ({p['confidence']:.0%})")
+        lines = [
+            f"Worldview: {data.get('subject', 'Unknown')}",
+            f"Depth: {data.get('depth', 'unknown')}",
+        ]
+        lines.extend(
+            f"  {i}. {p['point']} ({p['confidence']:.0%})"
+            for i, p in enumerate(data["points"], 1)
+        )
 
     else:
-        click.echo(json.dumps(data, indent=2)[:2000])
+        lines = [json.dumps(data, indent=2)[:2000]]
+
+    click.echo("\n".join(lines))
 
 
 @main.command()
@@ -2609,7 +2704,7 @@ def ask(input: str, question: str, top_k: int, model: str, show_sources: bool, a
     result = ask_corpus(index, question, top_k=top_k, model=model)
 
     if as_json:
-        click.echo(json.dumps(result, indent=2))
+        click.echo(_json_bytes(result))
     else:
         click.echo(f"\n{result['answer']}")
         click.echo(f"\n[Sources: {', '.join(result['sources'])}]", err=True)
@@ -2663,7 +2758,7 @@ def store_save(
         console.print(f"Analyzing transcripts for: {name}")
     
     # Extract quotes and themes
-    collection = extract_quotes_from_dir(input_path, max_quotes=100, min_score=0.2)
+    collection = extract_quotes_from_dir(input_path, max_quotes=100, min_score=0.2, parallel=True)
     
     # Build themes from word frequency
     from collections import Counter
@@ -2763,7 +2858,7 @@ def store_list(as_json: bool) -> None:
     entries = list_entries()
     
     if as_json:
-        click.echo(json.dumps([e.model_dump() for e in entries], indent=2, default=str))
+        click.echo(_json_bytes([e.model_dump() for e in entries]))
     elif not entries:
         console.print("No stored worldviews. Use 'wve store save' to add one.")
     else:
@@ -2833,7 +2928,7 @@ def store_search(query: str, as_json: bool) -> None:
     results = search_entries(query)
     
     if as_json:
-        click.echo(json.dumps([e.model_dump() for e in results], indent=2, default=str))
+        click.echo(_json_bytes([e.model_dump() for e in results]))
     elif not results:
         console.print(f"No matches for: {query}")
     else:
@@ -88,8 +88,8 @@ def show_top_quotes(quotes: list, limit: int = 3) -> str:
     if not quotes:
         return "[dim]No quotes available[/dim]"
     
-    lines = []
-    for i, quote in enumerate(quotes[:limit]):
+    blocks = []
+    for quote in quotes[:limit]:
         if isinstance(quote, dict):
             text = quote.get("text", quote.get("quote", str(quote)))
             source = quote.get("source", "")
@@ -101,14 +101,13 @@ def show_top_quotes(quotes: list, limit: int = 3) -> str:
         if len(text) > 120:
             text = text[:117] + "..."
         
-        lines.append(f"[italic]\"{text}\"[/italic]")
         if source:
-            lines.append(f"  [dim]— {source}[/dim]")
-        
-        if i < min(limit, len(quotes)) - 1:
-            lines.append("")
+            blocks.append(f"[italic]\"{text}\"[/italic]\n  [dim]— {source}[/dim]")
+        else:
+            blocks.append(f"[italic]\"{text}\"[/italic]")
     
-    return "\n".join(lines)
+    # Blank line between quotes
+    return "\n\n".join(blocks)
 
 
 def show_worldview_list(worldviews: list) -> str:
@@ -1,9 +1,16 @@
 """Theme and keyword extraction from transcripts."""
 
+import hashlib
+import os
 import re
+import time
 from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+
+from wve.cache import DEFAULT_TTL_DAYS, get_cache_dir
 from wve.models import (
     CoOccurrence,
     ExtractedEntity,
@@ -14,12 +21,36 @@ from wve.models import (
 )
 
 
+# Below this many texts, process pool start-up costs more than it saves
+YAKE_PARALLEL_MIN_TEXTS = 4
+
+
+@lru_cache(maxsize=4)
+def _yake_extractor(language: str, max_ngram: int, top: int):
+    """Build (once per process) a YAKE extractor for the given settings."""
+    import yake
+
+    return yake.KeywordExtractor(
+        lan=language,
+        n=max_ngram,
+        dedupLim=0.7,
+        top=top,
+        features=None,
+    )
+
+
+def _yake_one(text: str, cfg: tuple[str, int, int]) -> list[tuple[str, float]]:
+    """Run YAKE on a single text. Module-level so worker processes can unpickle it."""
+    return _yake_extractor(*cfg).extract_keywords(text)
+
+
 def extract_keywords_yake(
     texts: list[str],
     source_ids: list[str],
     top_n: int = 50,
     language: str = "en",
     max_ngram: int = 3,
+    parallel: bool = False,
 ) -> list[ExtractedKeyword]:
     """Extract keywords using YAKE (unsupervised keyword extraction).
 
@@ -29,26 +60,37 @@ def extract_keywords_yake(
         top_n: Number of keywords to return
         language: Language code
         max_ngram: Maximum n-gram size
+        parallel: Run YAKE in a process pool for larger corpora. Workers
+            re-import the caller's ``__main__``, so only enable this from
+            scripts guarded by ``if __name__ == "__main__"``
 
     Returns:
         List of extracted keywords with scores
     """
-    import yake
-
-    kw_extractor = yake.KeywordExtractor(
-        lan=language,
-        n=max_ngram,
-        dedupLim=0.7,
-        top=top_n * 2,  # Extract more, then aggregate
-        features=None,
-    )
+    cfg = (language, max_ngram, top_n * 2)  # Extract more, then aggregate
+
+    # Documents are independent, so spread them across processes
+    if parallel and len(texts) >= YAKE_PARALLEL_MIN_TEXTS:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Fork workers from a clean server process: forking a process in
+        # which numba has already compiled (extract_cooccurrences) can hang
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else None)
+        chunksize = max(1, len(texts) // (4 * (os.cpu_count() or 1)))
+        with ProcessPoolExecutor(mp_context=context) as executor:
+            per_doc = list(
+                executor.map(_yake_one, texts, [cfg] * len(texts), chunksize=chunksize)
+            )
+    else:
+        per_doc = [_yake_one(text, cfg) for text in texts]
 
     # Aggregate keywords across all texts
     keyword_scores: dict[str, list[float]] = {}
     keyword_sources: dict[str, set[str]] = {}
 
-    for text, source_id in zip(texts, source_ids):
-        keywords = kw_extractor.extract_keywords(text)
+    for keywords, source_id in zip(per_doc, source_ids):
         for kw, score in keywords:
             kw_lower = kw.lower()
             if kw_lower not in keyword_scores:
@@ -75,10 +117,90 @@ def extract_keywords_yake(
     return results[:top_n]
 
 
+# Pipeline components not needed for NER (only doc.ents is read)
+SPACY_NER_DISABLED = ["tagger", "parser", "attribute_ruler", "lemmatizer"]
+
+
+@lru_cache(maxsize=4)
+def load_spacy_model(model: str = "en_core_web_sm"):
+    """Load a spaCy model once per process with non-NER components disabled."""
+    import spacy
+
+    try:
+        return spacy.load(model, disable=SPACY_NER_DISABLED)
+    except OSError:
+        raise RuntimeError(f"spaCy model '{model}' not found. Run: python -m spacy download {model}")
+
+
+def get_spacy_cache_dir(model: str) -> Path:
+    """Get the on-disk Doc cache directory for a spaCy model.
+
+    Keyed on the model's version as well as its name, so upgrading the
+    model misses the cache instead of serving Docs from the old one.
+    """
+    version = load_spacy_model(model).meta.get("version", "0.0.0")
+    return get_cache_dir() / "spacy" / Path(model).name / version
+
+
+def _spacy_docs(
+    nlp,
+    texts: list[str],
+    cache_dir: Path | None,
+    batch_size: int,
+    n_process: int,
+) -> list:
+    """Run texts through nlp.pipe, reusing cached DocBins keyed by text hash.
+
+    DocBins expire after the same TTL as the JSON artifacts. The cache is
+    best effort: if it cannot be written the Docs are still returned.
+    """
+    from spacy.tokens import DocBin
+
+    docs: list = [None] * len(texts)
+    paths: list[Path | None] = [None] * len(texts)
+    misses: list[int] = []
+    cutoff = time.time() - DEFAULT_TTL_DAYS * 86400
+
+    for i, text in enumerate(texts):
+        if cache_dir is not None:
+            key = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+            paths[i] = cache_dir / f"{key}.docbin"
+            try:
+                # Expired entries fall through and are rewritten below
+                if paths[i].stat().st_mtime > cutoff:
+                    docs[i] = next(DocBin().from_disk(paths[i]).get_docs(nlp.vocab))
+                    continue
+            except Exception:
+                pass  # Missing or corrupt cache entry, reprocess
+        misses.append(i)
+
+    if cache_dir is not None and misses:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            paths = [None] * len(texts)  # Read-only cache location, don't cache
+
+    processed = nlp.pipe((texts[i] for i in misses), batch_size=batch_size, n_process=n_process)
+    for i, doc in zip(misses, processed):
+        docs[i] = doc
+        if paths[i] is not None:
+            # Only entity spans are read back, so keep the stored attributes minimal
+            doc_bin = DocBin(attrs=["ENT_IOB", "ENT_TYPE"], docs=[doc], store_user_data=False)
+            try:
+                doc_bin.to_disk(paths[i])
+            except OSError:
+                pass  # Disk full or permissions; the Doc is still usable
+
+    return docs
+
+
 def extract_entities_spacy(
     texts: list[str],
     source_ids: list[str],
     model: str = "en_core_web_sm",
+    batch_size: int = 32,
+    n_process: int = 1,
+    use_cache: bool = True,
 ) -> dict[str, list[ExtractedEntity]]:
     """Extract named entities using spaCy NER.
 
@@ -86,22 +208,21 @@ def extract_entities_spacy(
         texts: List of transcript texts
         source_ids: Corresponding source identifiers
         model: spaCy model name
+        batch_size: Number of texts per nlp.pipe batch
+        n_process: Worker processes for nlp.pipe (-1 = all cores)
+        use_cache: Reuse processed Docs cached on disk by transcript hash
 
     Returns:
         Dictionary mapping entity types to lists of entities
     """
-    import spacy
-
-    try:
-        nlp = spacy.load(model)
-    except OSError:
-        raise RuntimeError(f"spaCy model '{model}' not found. Run: python -m spacy download {model}")
+    nlp = load_spacy_model(model)
 
     entity_counts: dict[str, dict[str, int]] = {}
     entity_sources: dict[str, dict[str, set[str]]] = {}
 
-    for text, source_id in zip(texts, source_ids):
-        doc = nlp(text)
+    cache_dir = get_spacy_cache_dir(model) if use_cache else None
+    docs = _spacy_docs(nlp, texts, cache_dir, batch_size, n_process)
+    for source_id, doc in zip(source_ids, docs):
         for ent in doc.ents:
             label = ent.label_
             text_norm = ent.text.strip()
@@ -136,6 +257,179 @@ def extract_entities_spacy(
     return results
 
 
+def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, descending, ties in index order.
+
+    Uses an O(V) partition instead of sorting the whole score vector.
+    """
+    if k <= 0 or len(scores) == 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(scores):
+        kth = np.partition(scores, len(scores) - k)[len(scores) - k]
+        candidates = np.flatnonzero(scores >= kth)  # Keeps every tie at the cutoff
+    else:
+        candidates = np.arange(len(scores))
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order][:k]
+
+
+def _intern(tokens: list[bytes], vocab: dict[bytes, int]) -> np.ndarray:
+    """Map tokens to int32 IDs, adding unseen tokens to vocab."""
+    return np.fromiter(
+        (vocab.setdefault(t, len(vocab)) for t in tokens),
+        dtype=np.int32,
+        count=len(tokens),
+    )
+
+
+# scikit-learn's default token_pattern: runs of 2+ word characters, so
+# accented words, numbers and alphanumerics such as "covid19" are all tokens
+_TOKEN_RE = re.compile(r"\b\w\w+\b")
+_ASCII_TOKEN_RE = re.compile(rb"\b\w\w+\b")
+
+
+def _tokenize(text: str) -> list[bytes]:
+    """Lowercase runs of 2+ word characters, as UTF-8 bytes.
+
+    ASCII text (the usual case for English captions) is tokenized at the byte
+    level, skipping Unicode word-class handling; tokens are only decoded once
+    per vocabulary entry.
+    """
+    if text.isascii():
+        return _ASCII_TOKEN_RE.findall(text.encode("ascii").lower())
+    return [t.encode() for t in _TOKEN_RE.findall(text.lower())]
+
+
+def _prepare_corpus(texts: list[str]) -> tuple[list[np.ndarray], list[str]]:
+    """Tokenize and intern every text once for the token-based extractors.
+
+    Tokens follow scikit-learn's default token_pattern. TF-IDF uses all of
+    them; the word-based extractors keep only alphabetic terms (see
+    _vocab_mask with str.isalpha). Returns one int32 ID array per text plus
+    the shared vocabulary (ID -> term).
+    """
+    vocab: dict[bytes, int] = {}
+    docs = [_intern(_tokenize(text), vocab) for text in texts]
+    return docs, [t.decode() for t in vocab]
+
+
+def _vocab_mask(terms: list[str], keep) -> np.ndarray:
+    """Boolean mask over vocabulary IDs for terms satisfying keep(term)."""
+    return np.fromiter((keep(t) for t in terms), dtype=bool, count=len(terms))
+
+
+def _feature_names(keys: np.ndarray, terms: list[str]) -> list[str]:
+    """Decode packed unigram/bigram feature keys back to strings."""
+    vocab_size = len(terms)
+    names = []
+    for key in keys.tolist():
+        if key < vocab_size:
+            names.append(terms[key])
+        else:
+            a, b = divmod(key - vocab_size, vocab_size)
+            names.append(f"{terms[a]} {terms[b]}")
+    return names
+
+
+def _tfidf_single(
+    keys: np.ndarray,
+    terms: list[str],
+    top_n: int,
+    max_features: int,
+) -> list[TfidfTerm]:
+    """TF-IDF for a one-document corpus, where it reduces to normalized TF.
+
+    With N=1 every smoothed idf is 1, so the score is count / ||counts||.
+    Only features tied at or above the top_n cutoff are decoded to strings.
+    """
+    features, counts = np.unique(keys, return_counts=True)
+    if len(features) > max_features:
+        keep = np.sort(_top_k_indices(counts, max_features))
+        features, counts = features[keep], counts[keep]
+
+    tf = counts.astype(np.float32)
+    scores = tf / np.sqrt(np.dot(tf, tf))
+
+    # Candidates include every tie at the cutoff so ties rank alphabetically
+    k = min(top_n, len(counts))
+    if k <= 0:
+        return []
+    kth = np.partition(counts, len(counts) - k)[len(counts) - k]
+    candidates = np.flatnonzero(counts >= kth)
+    names = _feature_names(features[candidates], terms)
+    ranked = sorted(range(len(candidates)), key=lambda i: (-counts[candidates[i]], names[i]))
+    return [
+        TfidfTerm(term=names[i], score=float(scores[candidates[i]])) for i in ranked[:k]
+    ]
+
+
+def _tfidf_from_corpus(
+    docs: list[np.ndarray],
+    terms: list[str],
+    top_n: int,
+    max_features: int,
+) -> list[TfidfTerm]:
+    """Sum of L2-normalized TF-IDF rows over unigrams and bigrams.
+
+    Mirrors TfidfVectorizer(stop_words="english", ngram_range=(1, 2),
+    smooth_idf=True) on the shared token IDs, with max_df=0.95 for
+    multi-document corpora. The tokens use TfidfVectorizer's default
+    token_pattern, so numbers and non-ASCII words are kept as it keeps them.
+    """
+    from scipy.sparse import csr_matrix
+    from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+    n_docs = len(docs)
+    vocab_size = len(terms)
+    keep = _vocab_mask(terms, lambda t: t not in ENGLISH_STOP_WORDS)
+
+    # Unigram u -> u, bigram (a, b) -> V + a * V + b
+    key_parts, row_parts = [], []
+    for row, ids in enumerate(docs):
+        ids = ids[keep[ids]].astype(np.int64)
+        keys = np.concatenate([ids, vocab_size + ids[:-1] * vocab_size + ids[1:]])
+        key_parts.append(keys)
+        row_parts.append(np.full(len(keys), row, dtype=np.int32))
+
+    all_keys = np.concatenate(key_parts)
+    if len(all_keys) == 0:
+        return []
+    if n_docs == 1:
+        return _tfidf_single(all_keys, terms, top_n, max_features)
+    features, columns = np.unique(all_keys, return_inverse=True)
+    rows = np.concatenate(row_parts)
+    counts = csr_matrix(
+        (np.ones(len(rows), dtype=np.float32), (rows, columns)),
+        shape=(n_docs, len(features)),
+    )
+    counts.sum_duplicates()
+
+    df = np.bincount(counts.indices, minlength=len(features))
+    selected = np.arange(len(features))
+    if n_docs > 1:
+        selected = selected[df <= 0.95 * n_docs]
+    if len(selected) > max_features:
+        total_tf = np.asarray(counts.sum(axis=0)).ravel()
+        selected = np.sort(selected[_top_k_indices(total_tf[selected], max_features)])
+    if len(selected) == 0:
+        return []
+
+    # Columns ordered by feature name so ties rank alphabetically
+    names = _feature_names(features[selected], terms)
+    by_name = np.argsort(np.array(names, dtype=object), kind="stable")
+    selected = selected[by_name]
+    names = [names[i] for i in by_name]
+
+    tf = counts[:, selected]
+    idf = (np.log((1 + n_docs) / (1 + df[selected])) + 1).astype(np.float32)
+    tfidf = tf.multiply(idf).tocsr()
+    norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    scores = np.asarray(tfidf.multiply((1 / norms)[:, None]).sum(axis=0)).ravel()
+
+    return [TfidfTerm(term=names[i], score=float(scores[i])) for i in _top_k_indices(scores, top_n)]
+
+
 def extract_tfidf(
     texts: list[str],
     top_n: int = 50,
@@ -151,36 +445,187 @@ def extract_tfidf(
     Returns:
         List of terms with TF-IDF scores
     """
-    from sklearn.feature_extraction.text import TfidfVectorizer
-
     if not texts:
         return []
+    docs, terms = _prepare_corpus(texts)
+    return _tfidf_from_corpus(docs, terms, top_n, max_features)
 
-    # For single document, use simpler settings
-    if len(texts) == 1:
-        vectorizer = TfidfVectorizer(
-            max_features=max_features,
-            stop_words="english",
-            ngram_range=(1, 2),
-        )
+
+def _bm25_from_corpus(
+    docs: list[np.ndarray],
+    terms: list[str],
+    source_ids: list[str],
+    top_n: int,
+    max_ngram: int,
+    k1: float,
+    b: float,
+) -> list[ExtractedKeyword]:
+    """Score 1..max_ngram-grams per document with Okapi BM25 and aggregate.
+
+    Each document contributes its top 2 * top_n n-grams; a keyword's score is
+    the mean over the documents that ranked it, like the YAKE aggregation.
+    """
+    from scipy.sparse import csr_matrix
+    from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+    n_docs = len(docs)
+    keep = _vocab_mask(terms, lambda t: t.isalpha() and t not in ENGLISH_STOP_WORDS)
+    doc_ids = [ids[keep[ids]] + 1 for ids in docs]  # 0 is reserved for padding
+    doc_lengths = np.array([len(ids) for ids in doc_ids], dtype=np.float64)
+
+    row_parts, doc_parts = [], []
+    for doc, ids in enumerate(doc_ids):
+        for n in range(1, max_ngram + 1):
+            if len(ids) < n:
+                continue
+            rows = np.zeros((len(ids) - n + 1, max_ngram), dtype=np.int32)
+            rows[:, :n] = np.lib.stride_tricks.sliding_window_view(ids, n)
+            row_parts.append(rows)
+            doc_parts.append(np.full(len(rows), doc, dtype=np.int32))
+    if not row_parts:
+        return []
+
+    rows = np.concatenate(row_parts)
+    radix = len(terms) + 1
+    if radix**max_ngram < 2**63:
+        keys = np.zeros(len(rows), dtype=np.int64)
+        for col in range(max_ngram):
+            keys = keys * radix + rows[:, col]
     else:
-        vectorizer = TfidfVectorizer(
-            max_features=max_features,
-            stop_words="english",
-            ngram_range=(1, 2),
-            min_df=1,
-            max_df=0.95,
+        keys = rows.view(np.dtype((np.void, rows.itemsize * max_ngram))).ravel()
+    _, first, columns = np.unique(keys, return_index=True, return_inverse=True)
+    tf = csr_matrix(
+        (np.ones(len(rows), dtype=np.float64), (np.concatenate(doc_parts), columns)),
+        shape=(n_docs, len(first)),
+    )
+    tf.sum_duplicates()
+
+    df = np.bincount(tf.indices, minlength=len(first))
+    idf = np.log((n_docs - df + 0.5) / (df + 0.5) + 1)
+    avgdl = doc_lengths.mean() or 1.0
+    row_norm = k1 * (1 - b + b * doc_lengths / avgdl)
+    row_of = np.repeat(np.arange(n_docs), np.diff(tf.indptr))
+    tf.data = idf[tf.indices] * tf.data * (k1 + 1) / (tf.data + row_norm[row_of])
+
+    keyword_scores: dict[int, list[float]] = {}
+    keyword_sources: dict[int, set[str]] = {}
+    for doc in range(n_docs):
+        start, end = tf.indptr[doc], tf.indptr[doc + 1]
+        scores, features = tf.data[start:end], tf.indices[start:end]
+        for i in _top_k_indices(scores, top_n * 2):
+            feature = int(features[i])
+            keyword_scores.setdefault(feature, []).append(float(scores[i]))
+            keyword_sources.setdefault(feature, set()).add(source_ids[doc])
+
+    results = [
+        ExtractedKeyword(
+            term=" ".join(terms[t - 1] for t in rows[first[feature]] if t),
+            score=sum(scores) / len(scores),
+            frequency=len(scores),
+            sources=list(keyword_sources[feature]),
         )
+        for feature, scores in keyword_scores.items()
+    ]
+
+    # BM25: higher score = more relevant
+    results.sort(key=lambda x: (-x.score, x.term))
+    return results[:top_n]
+
+
+def extract_keywords_bm25(
+    texts: list[str],
+    source_ids: list[str],
+    top_n: int = 50,
+    max_ngram: int = 3,
+    k1: float = 1.5,
+    b: float = 0.75,
+) -> list[ExtractedKeyword]:
+    """Extract keywords by BM25 weight, a much faster alternative to YAKE.
+
+    Unlike YAKE, a higher score means a more relevant keyword.
+
+    Args:
+        texts: List of transcript texts
+        source_ids: Corresponding source identifiers
+        top_n: Number of keywords to return
+        max_ngram: Maximum n-gram size
+        k1: Term frequency saturation
+        b: Document length normalization
+
+    Returns:
+        List of extracted keywords with scores
+    """
+    docs, terms = _prepare_corpus(texts)
+    return _bm25_from_corpus(docs, terms, source_ids, top_n, max_ngram, k1, b)
+
+
+def _phrases_from_corpus(
+    docs: list[np.ndarray],
+    terms: list[str],
+    source_ids: list[str],
+    n_range: tuple[int, int],
+    top_n: int,
+) -> list[ExtractedPhrase]:
+    """Count n-grams of alphabetic terms as fixed-width rows of token IDs."""
+    min_n, max_n = n_range
+    row_parts: list[np.ndarray] = []
+    doc_parts: list[np.ndarray] = []
+    words = _vocab_mask(terms, str.isalpha)
+
+    # Rows are emitted in the same (text, n, position) order as a nested loop,
+    # so the first occurrence of a row is also its first-seen position.
+    for doc, doc_ids in enumerate(docs):
+        ids = doc_ids[words[doc_ids]] + 1  # 0 is reserved for padding
+        for n in range(min_n, max_n + 1):
+            if len(ids) < n or n < 1:
+                continue
+            windows = np.lib.stride_tricks.sliding_window_view(ids, n)
+            rows = np.zeros((len(windows), max_n), dtype=np.int32)
+            rows[:, :n] = windows
+            row_parts.append(rows)
+            doc_parts.append(np.full(len(rows), doc, dtype=np.int32))
 
-    tfidf_matrix = vectorizer.fit_transform(texts)
-    feature_names = vectorizer.get_feature_names_out()
+    if not row_parts:
+        return []
 
-    # Aggregate scores across documents
-    scores = tfidf_matrix.sum(axis=0).A1
-    term_scores = list(zip(feature_names, scores))
-    term_scores.sort(key=lambda x: x[1], reverse=True)
+    rows = np.concatenate(row_parts)
+    row_docs = np.concatenate(doc_parts)
+    radix = len(terms) + 1
+    if radix**max_n < 2**63:
+        # Exact base-radix packing into one int64 per n-gram (no collisions)
+        keys = np.zeros(len(rows), dtype=np.int64)
+        for col in range(max_n):
+            keys = keys * radix + rows[:, col]
+    else:
+        keys = rows.view(np.dtype((np.void, rows.itemsize * max_n))).ravel()
+    _, first, inverse, counts = np.unique(
+        keys, return_index=True, return_inverse=True, return_counts=True
+    )
 
-    return [TfidfTerm(term=term, score=float(score)) for term, score in term_scores[:top_n]]
+    # Highest count first, ties in first-seen order (matches Counter.most_common);
+    # only phrases appearing more than once
+    order = np.lexsort((first, -counts))
+    top = order[counts[order] > 1][:top_n]
+    if len(top) == 0:
+        return []
+
+    # Collect sources only for the selected phrases
+    slot = np.full(len(counts), -1, dtype=np.int64)
+    slot[top] = np.arange(len(top))
+    row_slots = slot[inverse]
+    hit = row_slots >= 0
+    phrase_sources: list[dict[str, None]] = [{} for _ in top]
+    for s, doc in np.unique(np.stack([row_slots[hit], row_docs[hit]], axis=1), axis=0):
+        phrase_sources[s][source_ids[doc]] = None
+
+    return [
+        ExtractedPhrase(
+            phrase=" ".join(terms[t - 1] for t in rows[first[u]] if t),
+            count=int(counts[u]),
+            sources=list(phrase_sources[s]),
+        )
+        for s, u in enumerate(top)
+    ]
 
 
 def extract_phrases(
@@ -191,6 +636,9 @@ def extract_phrases(
 ) -> list[ExtractedPhrase]:
     """Extract frequent n-gram phrases.
 
+    N-grams are counted over interned token IDs, so phrase strings are only
+    built for the returned top phrases.
+
     Args:
         texts: List of transcript texts
         source_ids: Corresponding source identifiers
@@ -200,40 +648,157 @@ def extract_phrases(
     Returns:
         List of frequent phrases
     """
-    phrase_counts: Counter[str] = Counter()
-    phrase_sources: dict[str, set[str]] = {}
-
-    # Simple tokenization
-    def tokenize(text: str) -> list[str]:
-        return re.findall(r"\b[a-zA-Z]{2,}\b", text.lower())
-
-    for text, source_id in zip(texts, source_ids):
-        tokens = tokenize(text)
-        for n in range(n_range[0], n_range[1] + 1):
-            for i in range(len(tokens) - n + 1):
-                phrase = " ".join(tokens[i : i + n])
-                phrase_counts[phrase] += 1
-                if phrase not in phrase_sources:
-                    phrase_sources[phrase] = set()
-                phrase_sources[phrase].add(source_id)
+    docs, terms = _prepare_corpus(texts)
+    return _phrases_from_corpus(docs, terms, source_ids, n_range, top_n)
+
+
+# Common stopwords filtered before co-occurrence counting
+COOCCURRENCE_STOPWORDS = frozenset({
+    "the", "and", "that", "this", "with", "for", "are", "was", "were",
+    "been", "have", "has", "had", "will", "would", "could", "should",
+    "can", "may", "might", "must", "shall", "into", "from", "about",
+    "what", "which", "who", "whom", "when", "where", "why", "how",
+    "all", "each", "every", "both", "few", "more", "most", "other",
+    "some", "such", "than", "too", "very", "just", "also", "now",
+    "only", "then", "there", "here", "these", "those", "their", "your",
+    "its", "his", "her", "our", "they", "you", "she", "him", "them",
+})
+
+
+@lru_cache(maxsize=1)
+def _window_pair_kernel():
+    """Compile the co-occurrence pair kernel with Numba, or None if unavailable."""
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    def window_pairs(ids, window_size):
+        # One slot per (position, offset) pair; each slot is written by exactly
+        # one iteration, so the prange loop needs no reduction.
+        n = ids.shape[0]
+        span = window_size - 1
+        last = n - window_size
+        keys = np.zeros(n * span, dtype=np.int64)
+        weights = np.zeros(n * span, dtype=np.int64)
+        ranks = np.zeros(n * span, dtype=np.int64)
+        if last < 0:
+            return keys, weights, ranks
+        for p in prange(n):
+            for d in range(1, window_size):
+                q = p + d
+                if q >= n:
+                    break
+                a = np.int64(ids[p])
+                b = np.int64(ids[q])
+                if a == b:
+                    continue
+                first = max(0, q - span)
+                idx = p * span + d - 1
+                keys[idx] = (min(a, b) << 32) | max(a, b)
+                # Number of sliding windows containing both positions
+                weights[idx] = min(p, last) - first + 1
+                # Order in which the sliding-window loop first sees this pair
+                ranks[idx] = (first * window_size + p - first) * window_size + q - first
+        return keys, weights, ranks
+
+    return njit(parallel=True)(window_pairs)
+
+
+def _count_pairs_jit(
+    kernel,
+    id_lists: list[np.ndarray],
+    terms: list[str],
+    window_size: int,
+    top_n: int,
+) -> list[tuple[tuple[str, str], int]]:
+    """Count window pairs over interned token IDs with the compiled kernel."""
+    key_parts, weight_parts, rank_parts = [], [], []
+    base = 0
+    for tokens in id_lists:
+        keys, weights, ranks = kernel(tokens, window_size)
+        key_parts.append(keys)
+        weight_parts.append(weights)
+        rank_parts.append(ranks + base)
+        base += len(tokens) * window_size * window_size
+
+    if not key_parts:
+        return []
+    keys = np.concatenate(key_parts)
+    weights = np.concatenate(weight_parts)
+    ranks = np.concatenate(rank_parts)
+    mask = weights > 0
+    if not mask.any():
+        return []
+    keys, weights, ranks = keys[mask], weights[mask], ranks[mask]
 
-    results = [
-        ExtractedPhrase(
-            phrase=phrase,
-            count=count,
-            sources=list(phrase_sources[phrase]),
-        )
-        for phrase, count in phrase_counts.most_common(top_n * 2)
-        if count > 1  # Only phrases appearing more than once
-    ]
+    # Group by packed key; the first element of each group has its lowest rank
+    order = np.lexsort((ranks, keys))
+    keys, weights, ranks = keys[order], weights[order], ranks[order]
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    counts = np.add.reduceat(weights, starts)
+    first_seen = ranks[starts]
 
-    return results[:top_n]
+    # Highest count first, ties in first-seen order (matches Counter.most_common)
+    top = np.lexsort((first_seen, -counts))[:top_n]
+    results = []
+    for i in top:
+        key = int(keys[starts[i]])
+        pair = tuple(sorted((terms[key >> 32], terms[key & 0xFFFFFFFF])))
+        results.append((pair, int(counts[i])))
+    return results
+
+
+def _cooccurrences_from_corpus(
+    docs: list[np.ndarray],
+    terms: list[str],
+    window_size: int,
+    top_n: int,
+    use_jit: bool,
+) -> list[CoOccurrence]:
+    """Count window pairs over the shared corpus, minus short tokens and stopwords."""
+    # Tokens are maximal word-character runs, so keeping alphabetic terms of
+    # 3+ letters leaves exactly the 3+ letter word tokenization
+    keep = _vocab_mask(
+        terms, lambda t: len(t) >= 3 and t.isalpha() and t not in COOCCURRENCE_STOPWORDS
+    )
+    id_lists = [ids[keep[ids]] for ids in docs]
+
+    kernel = _window_pair_kernel() if use_jit else None
+    if kernel is not None and window_size > 1:
+        return [
+            CoOccurrence(pair=pair, count=count)
+            for pair, count in _count_pairs_jit(kernel, id_lists, terms, window_size, top_n)
+        ]
+
+    # Pairs are keyed by packed (lo << 32) | hi token IDs, the same key the
+    # kernel uses; strings are only looked up for the top pairs
+    pair_counts: Counter[int] = Counter()
+    for ids in id_lists:
+        tokens = ids.tolist()
+        for i in range(len(tokens) - window_size + 1):
+            end = i + window_size
+            for j in range(i, end):
+                a = tokens[j]
+                for k in range(j + 1, end):
+                    b = tokens[k]
+                    if a != b:
+                        lo = a if a < b else b
+                        pair_counts[(lo << 32) | (a ^ b ^ lo)] += 1
+
+    results = []
+    for key, count in pair_counts.most_common(top_n):
+        pair = tuple(sorted((terms[key >> 32], terms[key & 0xFFFFFFFF])))
+        results.append(CoOccurrence(pair=pair, count=count))
+
+    return results
 
 
 def extract_cooccurrences(
     texts: list[str],
     window_size: int = 5,
     top_n: int = 50,
+    use_jit: bool = True,
 ) -> list[CoOccurrence]:
     """Extract co-occurring term pairs using sliding window.
 
@@ -241,43 +806,13 @@ def extract_cooccurrences(
         texts: List of transcript texts
         window_size: Size of sliding window
         top_n: Number of pairs to return
+        use_jit: Use the Numba kernel when numba is installed
 
     Returns:
         List of co-occurring term pairs
     """
-    pair_counts: Counter[tuple[str, str]] = Counter()
-
-    def tokenize(text: str) -> list[str]:
-        return re.findall(r"\b[a-zA-Z]{3,}\b", text.lower())
-
-    # Common stopwords to filter
-    stopwords = {
-        "the", "and", "that", "this", "with", "for", "are", "was", "were",
-        "been", "have", "has", "had", "will", "would", "could", "should",
-        "can", "may", "might", "must", "shall", "into", "from", "about",
-        "what", "which", "who", "whom", "when", "where", "why", "how",
-        "all", "each", "every", "both", "few", "more", "most", "other",
-        "some", "such", "than", "too", "very", "just", "also", "now",
-        "only", "then", "there", "here", "these", "those", "their", "your",
-        "its", "his", "her", "our", "they", "you", "she", "him", "them",
-    }
-
-    for text in texts:
-        tokens = [t for t in tokenize(text) if t not in stopwords]
-        for i in range(len(tokens) - window_size + 1):
-            window = tokens[i : i + window_size]
-            for j, t1 in enumerate(window):
-                for t2 in window[j + 1 :]:
-                    if t1 != t2:
-                        pair = tuple(sorted([t1, t2]))
-                        pair_counts[pair] += 1
-
-    results = [
-        CoOccurrence(pair=pair, count=count)
-        for pair, count in pair_counts.most_common(top_n)
-    ]
-
-    return results
+    docs, terms = _prepare_corpus(texts)
+    return _cooccurrences_from_corpus(docs, terms, window_size, top_n, use_jit)
 
 
 def extract_all(
@@ -285,6 +820,8 @@ def extract_all(
     source_ids: list[str] | None = None,
     top_n: int = 50,
     skip_ner: bool = False,
+    keyword_backend: str = "yake",
+    parallel: bool = False,
 ) -> Extraction:
     """Run all extraction methods and combine results.
 
@@ -293,10 +830,14 @@ def extract_all(
         source_ids: Optional source identifiers (defaults to indices)
         top_n: Number of items per category
         skip_ner: Skip NER if spaCy model unavailable
+        keyword_backend: "yake" (default) or "bm25" (much faster)
+        parallel: Run YAKE in a process pool (see extract_keywords_yake)
 
     Returns:
         Combined extraction results
     """
+    if keyword_backend not in ("yake", "bm25"):
+        raise ValueError(f"Unknown keyword backend: {keyword_backend}")
     if source_ids is None:
         source_ids = [str(i) for i in range(len(texts))]
 
@@ -308,16 +849,46 @@ def extract_all(
         except RuntimeError:
             pass  # spaCy model not available
 
+    # Tokenize once for phrases, TF-IDF and co-occurrences
+    docs, terms = _prepare_corpus(texts)
+
+    if keyword_backend == "bm25":
+        keywords = _bm25_from_corpus(docs, terms, source_ids, top_n, 3, 1.5, 0.75)
+    else:
+        keywords = extract_keywords_yake(texts, source_ids, top_n=top_n, parallel=parallel)
+
     return Extraction(
-        keywords=extract_keywords_yake(texts, source_ids, top_n=top_n),
+        keywords=keywords,
         entities=entities,
-        phrases=extract_phrases(texts, source_ids, top_n=top_n),
-        tfidf=extract_tfidf(texts, top_n=top_n),
-        co_occurrences=extract_cooccurrences(texts, top_n=top_n),
+        phrases=_phrases_from_corpus(docs, terms, source_ids, (2, 4), top_n),
+        tfidf=_tfidf_from_corpus(docs, terms, top_n, 1000) if texts else [],
+        co_occurrences=_cooccurrences_from_corpus(docs, terms, 5, top_n, True),
         source_transcripts=source_ids,
     )
 
 
+def _read_texts(paths: list[Path], missing_ok: bool = True) -> list[str | None]:
+    """Read files concurrently, preserving order.
+
+    With missing_ok, files that do not exist come back as None.
+    """
+    def read(p: Path) -> str | None:
+        try:
+            return p.read_text()
+        except FileNotFoundError:
+            if missing_ok:
+                return None
+            raise
+
+    if len(paths) < 2:
+        return [read(p) for p in paths]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+        return list(executor.map(read, paths))
+
+
 def load_transcripts(input_path: str | Path) -> tuple[list[str], list[str]]:
     """Load transcripts from a file or directory.
 
@@ -335,12 +906,13 @@ def load_transcripts(input_path: str | Path) -> tuple[list[str], list[str]]:
 
         with open(path) as f:
             manifest = json.load(f)
+        entries = list(manifest.get("transcripts", {}).items())
+        contents = _read_texts([Path(tp) for _, tp in entries])
         texts = []
         source_ids = []
-        for video_id, transcript_path in manifest.get("transcripts", {}).items():
-            tp = Path(transcript_path)
-            if tp.exists():
-                texts.append(tp.read_text())
+        for (video_id, _), text in zip(entries, contents):
+            if text is not None:
+                texts.append(text)
                 source_ids.append(video_id)
         return texts, source_ids
 
@@ -350,12 +922,8 @@ def load_transcripts(input_path: str | Path) -> tuple[list[str], list[str]]:
 
     elif path.is_dir():
         # Directory of transcripts
-        texts = []
-        source_ids = []
-        for f in sorted(path.glob("*.txt")):
-            texts.append(f.read_text())
-            source_ids.append(f.stem)
-        return texts, source_ids
+        paths = sorted(path.glob("*.txt"))
+        return _read_texts(paths, missing_ok=False), [f.stem for f in paths]
 
     raise ValueError(f"Invalid input path: {input_path}")
 
@@ -2,7 +2,9 @@
 
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -11,6 +13,33 @@ from pydantic import BaseModel, Field
 # Default storage location
 DEFAULT_IDENTITY_DIR = Path.home() / ".wve" / "identities"
 
+# Slug normalisation. ASCII characters outside [\w\s-] are deleted with a
+# translate table; the regex is only needed for non-ASCII names.
+_SLUG_DELETE = {
+    c: None
+    for c in range(128)
+    if not (chr(c).isalnum() or chr(c).isspace() or chr(c) in "-_")
+}
+_SLUG_NONWORD = re.compile(r"[^\w\s-]")
+_SLUG_WS = re.compile(r"[\s_]+")
+_SLUG_DASHES = re.compile(r"-+")
+
+# YouTube channel URL patterns
+_CHANNEL_PATTERNS = (
+    (re.compile(r"youtube\.com/@([^/?\s]+)"), "youtube"),
+    (re.compile(r"youtube\.com/channel/([^/?\s]+)"), "youtube"),
+    (re.compile(r"youtube\.com/c/([^/?\s]+)"), "youtube"),
+    (re.compile(r"youtube\.com/user/([^/?\s]+)"), "youtube"),
+)
+
+# YouTube video URL patterns (watch, short and embed links), one alternation
+# so each URL is scanned once
+_VIDEO_ID_RE = re.compile(
+    r"youtube\.com/watch\?v=(?P<watch>[^&\s]+)"
+    r"|youtu\.be/(?P<short>[^?\s]+)"
+    r"|youtube\.com/embed/(?P<embed>[^?\s]+)"
+)
+
 
 class Channel(BaseModel):
     """A YouTube/video channel belonging to a subject."""
@@ -38,20 +67,27 @@ class Identity(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.now)
 
 
+@lru_cache(maxsize=1024)
 def slugify(name: str) -> str:
     """Convert a display name to a slug."""
-    slug = name.lower()
-    slug = re.sub(r"[^\w\s-]", "", slug)
-    slug = re.sub(r"[\s_]+", "-", slug)
-    slug = re.sub(r"-+", "-", slug).strip("-")
+    slug = name.lower().translate(_SLUG_DELETE)
+    if not slug.isascii():
+        slug = _SLUG_NONWORD.sub("", slug)
+    slug = _SLUG_WS.sub("-", slug)
+    slug = _SLUG_DASHES.sub("-", slug).strip("-")
     return slug
 
 
+@lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """Create a directory once per process."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 def get_identity_dir() -> Path:
     """Get the identity storage directory, creating if needed."""
-    identity_dir = DEFAULT_IDENTITY_DIR
-    identity_dir.mkdir(parents=True, exist_ok=True)
-    return identity_dir
+    return _ensure_dir(DEFAULT_IDENTITY_DIR)
 
 
 def get_identity_path(slug: str) -> Path:
@@ -83,15 +119,32 @@ def load_identity(slug: str) -> Identity:
 def list_identities() -> list[Identity]:
     """List all stored identities."""
     identity_dir = get_identity_dir()
+    paths = sorted(identity_dir.glob("*.json"))
+    if not paths:
+        return []
+
+    # Overlap file reads in threads; validation stays serial
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        blobs = list(executor.map(_read_bytes, paths))
+
     identities = []
-    for path in sorted(identity_dir.glob("*.json")):
+    for blob in blobs:
+        if blob is None:
+            continue
         try:
-            identities.append(Identity.model_validate_json(path.read_text()))
+            identities.append(Identity.model_validate_json(blob))
         except Exception:
             continue
     return identities
 
 
+def _read_bytes(path: Path) -> bytes | None:
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
 def delete_identity(slug: str) -> bool:
     """Delete an identity."""
     path = get_identity_path(slug)
@@ -131,16 +184,8 @@ def create_identity(
 
 def parse_channel_url(url: str) -> Channel:
     """Parse a channel URL into a Channel object."""
-    # YouTube patterns
-    patterns = [
-        (r"youtube\.com/@([^/?\s]+)", "youtube"),
-        (r"youtube\.com/channel/([^/?\s]+)", "youtube"),
-        (r"youtube\.com/c/([^/?\s]+)", "youtube"),
-        (r"youtube\.com/user/([^/?\s]+)", "youtube"),
-    ]
-
-    for pattern, platform in patterns:
-        match = re.search(pattern, url)
+    for pattern, platform in _CHANNEL_PATTERNS:
+        match = pattern.search(url)
         if match:
             channel_id = match.group(1)
             return Channel(
@@ -195,15 +240,11 @@ def add_video_to_identity(slug: str, video_id: str, confirmed: bool = True) -> I
 
 def extract_video_id(url_or_id: str) -> str:
     """Extract video ID from URL or return as-is."""
-    patterns = [
-        r"youtube\.com/watch\?v=([^&\s]+)",
-        r"youtu\.be/([^?\s]+)",
-        r"youtube\.com/embed/([^?\s]+)",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url_or_id)
-        if match:
-            return match.group(1)
+    if "/" not in url_or_id:
+        return url_or_id  # Bare ID, nothing to scan
+
+    match = _VIDEO_ID_RE.search(url_or_id)
+    if match:
+        return match.group(match.lastindex)
 
     return url_or_id  # Assume it's already an ID
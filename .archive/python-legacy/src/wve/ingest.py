@@ -24,6 +24,8 @@ from pydantic import BaseModel, Field
 
 from wve.transcripts import download_transcript
 
+_WATCH_ID_RE = re.compile(r"v=([a-zA-Z0-9_-]{11})")
+
 
 class Source(BaseModel):
     """A textual source to be woven into worldview."""
@@ -92,7 +94,7 @@ class YouTubeIngester(Ingester):
         if "youtu.be/" in url:
             video_id = url.split("youtu.be/")[-1].split("?")[0]
         elif "youtube.com/watch" in url:
-            video_id = re.search(r"v=([a-zA-Z0-9_-]{11})", url)
+            video_id = _WATCH_ID_RE.search(url)
             if not video_id:
                 return []
             video_id = video_id.group(1)
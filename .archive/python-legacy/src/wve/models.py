@@ -116,6 +116,35 @@ class WorldviewPoint(BaseModel):
     sources: list[str]
 
 
+class LLMWorldviewPoint(BaseModel):
+    """A worldview point as the deep-synthesis prompt asks the LLM to emit it."""
+
+    point: str
+    elaboration: str
+    confidence: float = Field(ge=0.0, le=1.0)
+    supporting_evidence: list[str]
+
+
+class LLMWorldviewResponse(BaseModel):
+    """LLM response shape for deep synthesis of one subject."""
+
+    worldview_points: list[LLMWorldviewPoint]
+
+
+class LLMSubjectWorldview(BaseModel):
+    """One subject's entry in a batched deep-synthesis response."""
+
+    subject_index: int
+    subject: str
+    worldview_points: list[LLMWorldviewPoint]
+
+
+class LLMBatchedWorldviewResponse(BaseModel):
+    """LLM response shape for batched deep synthesis of several subjects."""
+
+    results: list[LLMSubjectWorldview]
+
+
 class Worldview(BaseModel):
     """Synthesized worldview from extracted themes."""
 
@@ -8,20 +8,49 @@ from textual.message import Message
 from textual.widget import Widget
 from textual.widgets import Static, Input
 
+# Candidate lists at least this long are mask-filtered with NumPy in one
+# vectorized pass; below it the import and array setup cost more than the loop
+VECTORIZE_MIN_ITEMS = 512
+
 
 def fuzzy_match(query: str, text: str) -> bool:
     """Simple fuzzy matching - all query chars must appear in order."""
-    if not query:
-        return True
-    query = query.lower()
-    text = text.lower()
-    qi = 0
-    for char in text:
-        if char == query[qi]:
-            qi += 1
-            if qi == len(query):
-                return True
-    return False
+    return _match_lower(query.lower(), text.lower())
+
+
+def _match_lower(query: str, text: str) -> bool:
+    """fuzzy_match for a query and text that are already lowercased."""
+    return _match_end(query, text) >= 0
+
+
+def _char_mask(text: str) -> int:
+    """64-bit set of the characters in text, hashed by code point mod 64.
+
+    If a query's mask has a bit the text's mask lacks, some query character
+    is missing from the text and it cannot match. Collisions only let
+    non-matches through to the full check.
+    """
+    mask = 0
+    for char in set(text):
+        mask |= 1 << (ord(char) & 63)
+    return mask
+
+
+def _match_end(query: str, text: str, start: int = 0) -> int:
+    """Index just past the leftmost in-order match of query in text[start:].
+
+    Returns -1 if query's characters do not all appear in order. The
+    leftmost (greedy) match ends as early as possible, so a longer query
+    matches iff its extra characters match from this end position.
+    """
+    pos = start
+    find = text.find
+    for char in query:
+        pos = find(char, pos)
+        if pos < 0:
+            return -1
+        pos += 1
+    return pos
 
 
 class FuzzySelect(Widget):
@@ -52,21 +81,45 @@ class FuzzySelect(Widget):
         items: list[tuple[str, Any]],
         prompt: str = ">",
         max_visible: int = 10,
+        search_keys: list[str] | None = None,
     ) -> None:
         """
         Args:
             items: list of (display_text, value) tuples
             prompt: prompt character
             max_visible: max items to show at once
+            search_keys: lowercased text to match per item; defaults to
+                the lowercased display text
         """
         super().__init__()
         self.all_items = items
+        self._search_keys = search_keys or [text.lower() for text, _ in items]
+        self._key_masks = [_char_mask(key) for key in self._search_keys]
+        self._mask_array = None
+        # (lowercased query, [(item index, match end)]) for each prefix of
+        # the current query that has been filtered, shortest first
+        self._match_stack: list[tuple[str, list[tuple[int, int]]]] = []
         self.filtered_items = list(items)
         self.prompt = prompt
         self.max_visible = max_visible
         self.cursor = 0
         self.query = ""
     
+    def set_items(
+        self,
+        items: list[tuple[str, Any]],
+        search_keys: list[str] | None = None,
+    ) -> None:
+        """Replace the candidate items, keeping the current query."""
+        self.all_items = items
+        self._search_keys = search_keys or [text.lower() for text, _ in items]
+        self._key_masks = [_char_mask(key) for key in self._search_keys]
+        self._mask_array = None
+        self._match_stack = []
+        self._filter_items()
+        if self.is_mounted:
+            self._update_display()
+    
     def compose(self) -> ComposeResult:
         with Vertical():
             yield Input(placeholder="type to filter...", id="fuzzy-input")
@@ -87,15 +140,50 @@ class FuzzySelect(Widget):
         self._update_display()
     
     def _filter_items(self) -> None:
-        if not self.query:
-            self.filtered_items = list(self.all_items)
-        else:
-            self.filtered_items = [
-                item for item in self.all_items
-                if fuzzy_match(self.query, item[0])
-            ]
+        # Typing a character only narrows the previous matches, resuming each
+        # from where its match ended; backspace returns to a stored prefix.
+        # Keys are lowercased once up front; only the query is per keystroke.
+        query = self.query.lower()
+        stack = self._match_stack
+        if not stack:
+            stack.append(("", [(i, 0) for i in range(len(self.all_items))]))
+        while not query.startswith(stack[-1][0]):
+            stack.pop()
+        
+        prefix, matches = stack[-1]
+        if len(query) > len(prefix):
+            suffix = query[len(prefix):]
+            keys = self._search_keys
+            suffix_mask = _char_mask(suffix)
+            narrowed = []
+            for i, pos in self._mask_candidates(matches, suffix_mask):
+                end = _match_end(suffix, keys[i], pos)
+                if end >= 0:
+                    narrowed.append((i, end))
+            matches = narrowed
+            stack.append((query, matches))
+        
+        items = self.all_items
+        self.filtered_items = [items[i] for i, _ in matches]
         self.cursor = 0
     
+    def _mask_candidates(
+        self, matches: list[tuple[int, int]], query_mask: int
+    ) -> list[tuple[int, int]]:
+        """Matches whose key contains every character bit in query_mask."""
+        if len(matches) < VECTORIZE_MIN_ITEMS:
+            masks = self._key_masks
+            return [m for m in matches if not query_mask & ~masks[m[0]]]
+        
+        import numpy as np
+        
+        if self._mask_array is None:
+            self._mask_array = np.array(self._key_masks, dtype=np.uint64)
+        idx = np.fromiter((i for i, _ in matches), dtype=np.intp, count=len(matches))
+        required = np.uint64(query_mask)
+        keep = np.flatnonzero((self._mask_array[idx] & required) == required)
+        return [matches[j] for j in keep.tolist()]
+    
     def _update_display(self) -> None:
         count_widget = self.query_one("#fuzzy-count", Static)
         count_widget.update(f"  {len(self.filtered_items)}/{len(self.all_items)}")
@@ -1,7 +1,13 @@
 """Quote extraction from transcripts (v0.2)."""
 
+import heapq
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
 
 from pydantic import BaseModel, Field
@@ -55,13 +61,27 @@ SPECIFICITY_PATTERNS = [
     r"(first|second|third|specifically|exactly)",
 ]
 
+# Compiled once; a sentence is specific if any of the patterns matches
+_SPECIFICITY_RE = re.compile("|".join(f"(?:{p})" for p in SPECIFICITY_PATTERNS))
+_OPINION_STARTERS = tuple(OPINION_STARTERS)
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?]) ")
+_CAPITALISED_RE = re.compile(r"(?<!\. )\b[A-Z][a-z]+\b")
+
+# Below this many transcripts, process pool start-up costs more than it saves
+QUOTES_PARALLEL_MIN_FILES = 8
+
 
 def split_sentences(text: str) -> list[str]:
     """Split text into sentences."""
-    # Basic sentence splitting - handles common cases
-    text = re.sub(r"\s+", " ", text)
-    sentences = re.split(r"(?<=[.!?])\s+", text)
-    return [s.strip() for s in sentences if s.strip()]
+    # Basic sentence splitting - handles common cases. split() and join
+    # collapse every whitespace run (same characters as \s) in one C pass,
+    # so sentences end at a single space and need no stripping
+    text = " ".join(text.split())
+    # Single sentences (or none) skip the regex engine altogether
+    if ". " not in text and "! " not in text and "? " not in text:
+        return [text] if text else []
+    sentences = _SENTENCE_END_RE.split(text)
+    return [s for s in sentences if s]
 
 
 def score_sentence(sentence: str) -> tuple[float, list[str], bool]:
@@ -70,17 +90,27 @@ def score_sentence(sentence: str) -> tuple[float, list[str], bool]:
     
     Returns (score, reasons, is_contrarian).
     """
+    score, reasons, is_contrarian = _score_sentence_cached(sentence)
+    return score, list(reasons), is_contrarian
+
+
+@lru_cache(maxsize=16384)
+def _score_sentence_cached(sentence: str) -> tuple[float, tuple[str, ...], bool]:
+    """score_sentence with hashable output, memoised by sentence.
+
+    Intros, outros and sponsor reads repeat verbatim across a channel's
+    transcripts, so the same sentences come up again and again.
+    """
     score = 0.0
     reasons = []
     is_contrarian = False
     sentence_lower = sentence.lower()
 
-    # Opinion starters
-    for starter in OPINION_STARTERS:
-        if sentence_lower.startswith(starter):
-            score += 0.3
-            reasons.append(f"opinion_starter:{starter}")
-            break
+    # Opinion starters; one startswith over the tuple, then find which one
+    if sentence_lower.startswith(_OPINION_STARTERS):
+        starter = next(s for s in _OPINION_STARTERS if sentence_lower.startswith(s))
+        score += 0.3
+        reasons.append(f"opinion_starter:{starter}")
 
     # Contrarian phrases
     for phrase in CONTRARIAN_PHRASES:
@@ -91,11 +121,9 @@ def score_sentence(sentence: str) -> tuple[float, list[str], bool]:
             break
 
     # Specificity (numbers, percentages, etc.)
-    for pattern in SPECIFICITY_PATTERNS:
-        if re.search(pattern, sentence_lower):
-            score += 0.15
-            reasons.append("specific")
-            break
+    if _SPECIFICITY_RE.search(sentence_lower):
+        score += 0.15
+        reasons.append("specific")
 
     # Quotable structure (shorter, punchier)
     words = sentence.split()
@@ -104,12 +132,12 @@ def score_sentence(sentence: str) -> tuple[float, list[str], bool]:
         reasons.append("good_length")
 
     # Named entities (capitalized words that aren't sentence starts)
-    caps = re.findall(r"(?<!\. )\b[A-Z][a-z]+\b", sentence)
+    caps = _CAPITALISED_RE.findall(sentence)
     if len(caps) >= 2:
         score += 0.1
         reasons.append("named_entities")
 
-    return score, reasons, is_contrarian
+    return score, tuple(reasons), is_contrarian
 
 
 def extract_quotes(
@@ -125,11 +153,12 @@ def extract_quotes(
     quotes = []
 
     for i, sentence in enumerate(sentences):
-        words = sentence.split()
-        if not (min_words <= len(words) <= max_words):
+        # split_sentences leaves exactly one space between words, so the
+        # word count needs no list of words
+        if not (min_words <= sentence.count(" ") + 1 <= max_words):
             continue
 
-        score, reasons, is_contrarian = score_sentence(sentence)
+        score, _, is_contrarian = _score_sentence_cached(sentence)
 
         if score >= min_score:
             # Estimate timestamp (rough approximation)
@@ -160,37 +189,114 @@ def extract_quotes(
     return quotes
 
 
+def _read_text(path: str) -> str:
+    with open(path) as f:
+        return f.read()
+
+
+def _score_transcript(path: str, text: str, min_score: float, max_quotes: int) -> list[Quote]:
+    """Quotes from one transcript, keeping only its best max_quotes.
+
+    A file's quotes past its own top max_quotes can never reach the
+    overall top max_quotes, so they are dropped straight away.
+    """
+    source_id = os.path.splitext(os.path.basename(path))[0]
+    quotes = extract_quotes(text, source_id=source_id, source_title=source_id, min_score=min_score)
+    return quotes[:max_quotes]
+
+
+def _quotes_for_file(path: str, min_score: float, max_quotes: int) -> list[Quote]:
+    """Read and score one transcript. Module-level so worker processes can unpickle it."""
+    return _score_transcript(path, _read_text(path), min_score, max_quotes)
+
+
 def extract_quotes_from_dir(
     transcript_dir: Path,
     max_quotes: int = 50,
     min_score: float = 0.3,
+    parallel: bool = False,
 ) -> QuoteCollection:
-    """Extract quotes from all transcripts in a directory."""
-    all_quotes = []
-    source_count = 0
-
-    # Load transcripts
-    for txt_file in transcript_dir.glob("*.txt"):
-        if txt_file.name == "manifest.json":
-            continue
-
-        source_id = txt_file.stem
-        text = txt_file.read_text()
-        source_count += 1
-
-        quotes = extract_quotes(
-            text,
-            source_id=source_id,
-            source_title=source_id,
-            min_score=min_score,
+    """Extract quotes from all transcripts in a directory.
+
+    Args:
+        transcript_dir: Directory of .txt transcripts
+        max_quotes: Number of top-scoring quotes to keep
+        min_score: Minimum score for a sentence to count as a quote
+        parallel: Score files in a process pool for larger directories.
+            Workers re-import the caller's ``__main__``, so only enable this
+            from scripts guarded by ``if __name__ == "__main__"``
+
+    Returns:
+        The best quotes across all transcripts, highest score first
+    """
+    # One scandir pass lists the directory with file types already known;
+    # like the *.txt glob directory_fingerprint uses, dotfiles are included
+    with os.scandir(transcript_dir) as it:
+        paths = sorted(
+            entry.path for entry in it if entry.name.endswith(".txt") and entry.is_file()
         )
-        all_quotes.extend(quotes)
 
-    # Sort all by score and limit
-    all_quotes.sort(key=lambda q: q.score, reverse=True)
-    all_quotes = all_quotes[:max_quotes]
+    # Files are independent and scoring is pure Python, so spread them
+    # across processes; otherwise files are read on threads while earlier
+    # ones are scored
+    n_cpus = os.cpu_count() or 1
+    if parallel and n_cpus > 1 and len(paths) >= QUOTES_PARALLEL_MIN_FILES:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Workers come from a clean server process rather than a fork of
+        # this one; forking after numba has compiled kernels can leave the
+        # parent hanging at interpreter exit
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else None)
+        chunksize = max(1, len(paths) // (4 * n_cpus))
+        with ProcessPoolExecutor(mp_context=context) as executor:
+            per_file = list(executor.map(
+                _quotes_for_file,
+                paths,
+                [min_score] * len(paths),
+                [max_quotes] * len(paths),
+                chunksize=chunksize,
+            ))
+    else:
+        with ThreadPoolExecutor(max_workers=max(1, min(32, len(paths)))) as executor:
+            per_file = [
+                _score_transcript(path, text, min_score, max_quotes)
+                for path, text in zip(paths, executor.map(_read_text, paths))
+            ]
+
+    # nlargest orders ties the same way a stable sort would
+    all_quotes = heapq.nlargest(max_quotes, chain.from_iterable(per_file), key=attrgetter("score"))
 
     return QuoteCollection(
         quotes=all_quotes,
-        source_count=source_count,
+        source_count=len(paths),
+    )
+
+
+@lru_cache(maxsize=16)
+def cached_quotes_from_dir(
+    transcript_dir: str,
+    fingerprint: tuple,
+    max_quotes: int = 50,
+    min_score: float = 0.3,
+    parallel: bool = False,
+) -> QuoteCollection:
+    """extract_quotes_from_dir, memoised in memory and on disk.
+
+    fingerprint is the directory_fingerprint of transcript_dir, so edits to
+    the transcripts miss both caches. The returned collection is shared and
+    must not be mutated.
+    """
+    from wve.cache import cache_key, get_cached, set_cached
+
+    key = cache_key("quotes", fingerprint, max_quotes, min_score)
+    cached = get_cached(key)
+    if cached is not None:
+        return QuoteCollection.model_validate(cached)
+
+    collection = extract_quotes_from_dir(
+        Path(transcript_dir), max_quotes=max_quotes, min_score=min_score, parallel=parallel
     )
+    set_cached(key, collection.model_dump(mode="json"))
+    return collection
@@ -131,7 +131,7 @@ def ask_corpus(
 
     Returns dict with 'answer' and 'sources'.
     """
-    import ollama
+    from wve.synthesize import get_ollama_client
 
     results = search_index(index, question, top_k)
 
@@ -155,8 +155,7 @@ Cite specific sources when possible. If the answer isn't in the excerpts, say so
 
 Provide a clear, specific answer based on the evidence above."""
 
-    client = ollama.Client(host=ollama_host)
-    response = client.generate(model=model, prompt=prompt)
+    response = get_ollama_client(ollama_host).generate(model=model, prompt=prompt)
 
     return {
         "answer": response.get("response", ""),
@@ -2,17 +2,49 @@
 
 import json
 import subprocess
+import tempfile
+import threading
 from datetime import datetime
 
 from wve.models import SearchResult, VideoMetadata
 
 
+# Seconds before a running yt-dlp search is killed
+SEARCH_TIMEOUT = 60
+
+
 class SearchError(Exception):
     """Error during video search."""
 
     pass
 
 
+def _parse_video(data: dict, min_duration: int, max_duration: int) -> VideoMetadata | None:
+    """Build VideoMetadata from one yt-dlp JSON record, or None if out of range."""
+    duration = data.get("duration") or 0
+    duration_minutes = duration / 60
+
+    if duration_minutes < min_duration or duration_minutes > max_duration:
+        return None
+
+    # Parse upload date
+    upload_date = data.get("upload_date", "")
+    if upload_date and len(upload_date) == 8:
+        published = datetime.strptime(upload_date, "%Y%m%d")
+    else:
+        published = datetime.now()
+
+    return VideoMetadata(
+        id=data.get("id", ""),
+        title=data.get("title", ""),
+        channel=data.get("channel", data.get("uploader", "")),
+        channel_id=data.get("channel_id", data.get("uploader_id", "")),
+        duration_seconds=duration,
+        url=data.get("webpage_url", f"https://www.youtube.com/watch?v={data.get('id', '')}"),
+        published=published,
+    )
+
+
 def search_videos(
     query: str,
     max_results: int = 10,
@@ -50,50 +82,64 @@ def search_videos(
         "--no-warnings",
     ]
 
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False, timeout=60)
-    except subprocess.TimeoutExpired:
-        raise SearchError(f"Search timed out for query: {query}")
-    except OSError as e:
-        raise SearchError(f"yt-dlp not found or failed to run: {e}")
-
-    if result.returncode != 0:
-        if "No video found" in result.stderr or not result.stdout.strip():
-            return SearchResult(query=query, max_results=max_results, videos=[])
-        raise SearchError(f"yt-dlp failed: {result.stderr}")
-
-    videos: list[VideoMetadata] = []
-    for line in result.stdout.strip().split("\n"):
-        if not line:
-            continue
+    # Stream yt-dlp output so each video is parsed as it arrives; stderr goes to
+    # a temp file so a chatty stderr can never block the stdout pipe
+    with tempfile.TemporaryFile(mode="w+") as stderr:
+        try:
+            proc = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=stderr, text=True, bufsize=1
+            )
+        except OSError as e:
+            raise SearchError(f"yt-dlp not found or failed to run: {e}")
+
+        timed_out = threading.Event()
+
+        def kill_on_timeout() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(SEARCH_TIMEOUT, kill_on_timeout)
+        timer.start()
+        videos: list[VideoMetadata] = []
+        got_output = False
         try:
-            data = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-
-        duration = data.get("duration") or 0
-        duration_minutes = duration / 60
-
-        if duration_minutes < min_duration or duration_minutes > max_duration:
-            continue
-
-        # Parse upload date
-        upload_date = data.get("upload_date", "")
-        if upload_date and len(upload_date) == 8:
-            published = datetime.strptime(upload_date, "%Y%m%d")
-        else:
-            published = datetime.now()
-
-        video = VideoMetadata(
-            id=data.get("id", ""),
-            title=data.get("title", ""),
-            channel=data.get("channel", data.get("uploader", "")),
-            channel_id=data.get("channel_id", data.get("uploader_id", "")),
-            duration_seconds=duration,
-            url=data.get("webpage_url", f"https://www.youtube.com/watch?v={data.get('id', '')}"),
-            published=published,
-        )
-        videos.append(video)
+            for line in proc.stdout:
+                line = line.strip()
+                if not line:
+                    continue
+                got_output = True
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                video = _parse_video(data, min_duration, max_duration)
+                if video is None:
+                    continue
+                videos.append(video)
+                if len(videos) >= max_results:
+                    # Enough results; stop yt-dlp fetching more
+                    proc.terminate()
+                    break
+        except BaseException:
+            proc.kill()
+            raise
+        finally:
+            timer.cancel()
+            proc.stdout.close()
+            returncode = proc.wait()
+
+        if len(videos) >= max_results:
+            return SearchResult(query=query, max_results=max_results, videos=videos)
+        if timed_out.is_set():
+            raise SearchError(f"Search timed out for query: {query}")
+
+        if returncode != 0:
+            stderr.seek(0)
+            error = stderr.read()
+            if "No video found" in error or not got_output:
+                return SearchResult(query=query, max_results=max_results, videos=[])
+            raise SearchError(f"yt-dlp failed: {error}")
 
     return SearchResult(
         query=query,
@@ -2,14 +2,26 @@
 
 import json
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Iterator, Literal, NamedTuple
 
 from pydantic import BaseModel, Field
 
 # Storage location
 DEFAULT_STORE_DIR = Path.home() / ".wve" / "store"
 
+# The index is append-only JSONL: the last line for a slug wins and deletes
+# are tombstone lines. It is compacted once lines outnumber live entries by
+# this factor.
+INDEX_COMPACT_RATIO = 2
+INDEX_COMPACT_MIN_LINES = 32
+
+# Parsed index per path, keyed by file (mtime_ns, size) so repeated reads in
+# one process skip re-parsing an unchanged file. Holds (key, entries by slug,
+# line count).
+_INDEX_CACHE: dict[Path, tuple[tuple[int, int], dict[str, "WorldviewEntry"], int]] = {}
+
 
 class WorldviewEntry(BaseModel):
     """A stored worldview extraction."""
@@ -29,11 +41,16 @@ class WorldviewEntry(BaseModel):
     tags: list[str] = Field(default_factory=list)
 
 
+@lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """Create a directory once per process."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 def get_store_dir() -> Path:
     """Get store directory, creating if needed."""
-    store_dir = DEFAULT_STORE_DIR
-    store_dir.mkdir(parents=True, exist_ok=True)
-    return store_dir
+    return _ensure_dir(DEFAULT_STORE_DIR)
 
 
 def get_index_path() -> Path:
@@ -43,9 +60,7 @@ def get_index_path() -> Path:
 
 def get_entry_dir(slug: str) -> Path:
     """Get directory for a specific entry."""
-    entry_dir = get_store_dir() / slug
-    entry_dir.mkdir(parents=True, exist_ok=True)
-    return entry_dir
+    return _ensure_dir(get_store_dir() / slug)
 
 
 def save_entry(entry: WorldviewEntry) -> Path:
@@ -61,24 +76,40 @@ def save_entry(entry: WorldviewEntry) -> Path:
 
 
 def _update_index(entry: WorldviewEntry) -> None:
-    """Update or append entry in index."""
+    """Append entry to index, superseding any earlier line for its slug."""
+    _append_index(entry.slug, entry.model_dump_json(), entry)
+
+
+def _append_index(slug: str, line: str, entry: WorldviewEntry | None) -> None:
+    """Append one index line and keep the in-memory index in step.
+
+    A None entry records a deletion.
+    """
     index_path = get_index_path()
-    entries = load_index()
-    
-    # Replace or append
-    found = False
-    for i, e in enumerate(entries):
-        if e.slug == entry.slug:
-            entries[i] = entry
-            found = True
-            break
-    if not found:
-        entries.append(entry)
-    
-    # Write back
-    with open(index_path, "w") as f:
-        for e in entries:
+    entries, n_lines = _read_index(index_path)
+    with open(index_path, "a") as f:
+        f.write(line + "\n")
+
+    entries = dict(entries)
+    if entry is None:
+        entries.pop(slug, None)
+    else:
+        entries[slug] = entry.model_copy(deep=True)  # The caller may keep mutating theirs
+    n_lines += 1
+    _INDEX_CACHE[index_path] = (_stat_key(index_path), entries, n_lines)
+    _maybe_compact(index_path, entries, n_lines)
+
+
+def _maybe_compact(index_path: Path, entries: dict[str, WorldviewEntry], n_lines: int) -> None:
+    """Rewrite the index with one line per live entry once it has bloated."""
+    if n_lines < INDEX_COMPACT_MIN_LINES or n_lines <= INDEX_COMPACT_RATIO * len(entries):
+        return
+    tmp_path = index_path.with_suffix(".jsonl.tmp")
+    with open(tmp_path, "w") as f:
+        for e in entries.values():
             f.write(e.model_dump_json() + "\n")
+    tmp_path.replace(index_path)
+    _INDEX_CACHE[index_path] = (_stat_key(index_path), entries, len(entries))
 
 
 def load_entry(slug: str) -> WorldviewEntry:
@@ -89,20 +120,64 @@ def load_entry(slug: str) -> WorldviewEntry:
     return WorldviewEntry.model_validate_json(entry_path.read_text())
 
 
-def load_index() -> list[WorldviewEntry]:
-    """Load all entries from index."""
-    index_path = get_index_path()
-    if not index_path.exists():
-        return []
-    
-    entries = []
-    for line in index_path.read_text().strip().split("\n"):
-        if line:
+def _stat_key(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _iter_jsonl(path: Path) -> Iterator[dict]:
+    """Yield JSON objects from a JSONL file one line at a time.
+
+    Blank and malformed lines are skipped.
+    """
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
             try:
-                entries.append(WorldviewEntry.model_validate_json(line))
-            except Exception:
+                record = json.loads(line)
+            except json.JSONDecodeError:
                 continue
-    return entries
+            if isinstance(record, dict):
+                yield record
+
+
+def _read_index(index_path: Path) -> tuple[dict[str, WorldviewEntry], int]:
+    """Replay the index log into live entries by slug, plus its line count."""
+    try:
+        key = _stat_key(index_path)
+    except FileNotFoundError:
+        return {}, 0
+
+    cached = _INDEX_CACHE.get(index_path)
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2]
+
+    entries: dict[str, WorldviewEntry] = {}
+    n_lines = 0
+    for record in _iter_jsonl(index_path):
+        n_lines += 1
+        if record.get("_deleted"):
+            entries.pop(record.get("slug"), None)
+            continue
+        try:
+            entry = WorldviewEntry.model_validate(record)
+        except Exception:
+            continue
+        # Re-saves keep their original position
+        entries[entry.slug] = entry
+    _INDEX_CACHE[index_path] = (key, entries, n_lines)
+    return entries, n_lines
+
+
+def load_index() -> list[WorldviewEntry]:
+    """Load all entries from index.
+
+    Returns copies, so callers can modify them without touching the cached
+    index.
+    """
+    entries, _ = _read_index(get_index_path())
+    return [e.model_copy(deep=True) for e in entries.values()]
 
 
 def list_entries() -> list[WorldviewEntry]:
@@ -110,6 +185,57 @@ def list_entries() -> list[WorldviewEntry]:
     return load_index()
 
 
+class EntrySummary(NamedTuple):
+    """The few fields needed to list an entry."""
+
+    slug: str
+    display_name: str
+    source_count: int
+    updated_at: datetime | None
+
+
+def list_entry_summaries() -> list[EntrySummary]:
+    """List stored entries without validating their full records.
+
+    Reuses the parsed index when it is already cached; otherwise replays the
+    index log keeping only the listing fields, so themes and quotes are never
+    turned into models. Use load_entry for the full record.
+    """
+    index_path = get_index_path()
+    try:
+        key = _stat_key(index_path)
+    except FileNotFoundError:
+        return []
+
+    cached = _INDEX_CACHE.get(index_path)
+    if cached is not None and cached[0] == key:
+        return [
+            EntrySummary(e.slug, e.display_name, e.source_count, e.updated_at)
+            for e in cached[1].values()
+        ]
+
+    summaries: dict[str, EntrySummary] = {}
+    for record in _iter_jsonl(index_path):
+        slug = record.get("slug")
+        if not isinstance(slug, str):
+            continue
+        if record.get("_deleted"):
+            summaries.pop(slug, None)
+            continue
+        display_name = record.get("display_name")
+        if not isinstance(display_name, str):
+            continue
+        try:
+            source_count = int(record.get("source_count") or 0)
+            updated_at = record.get("updated_at")
+            updated_at = datetime.fromisoformat(updated_at) if updated_at else None
+        except (TypeError, ValueError):
+            continue
+        # Re-saves keep their original position
+        summaries[slug] = EntrySummary(slug, display_name, source_count, updated_at)
+    return list(summaries.values())
+
+
 def search_entries(query: str) -> list[WorldviewEntry]:
     """Search entries by name, slug, or tags."""
     query_lower = query.lower()
@@ -128,12 +254,9 @@ def delete_entry(slug: str) -> bool:
     entry_dir = get_store_dir() / slug
     if entry_dir.exists():
         shutil.rmtree(entry_dir)
-        # Update index
-        entries = [e for e in load_index() if e.slug != slug]
-        index_path = get_index_path()
-        with open(index_path, "w") as f:
-            for e in entries:
-                f.write(e.model_dump_json() + "\n")
+        _ensure_dir.cache_clear()
+        # Record the deletion in the index
+        _append_index(slug, json.dumps({"slug": slug, "_deleted": True}), None)
         return True
     return False
 
@@ -1,36 +1,203 @@
 """Worldview synthesis from extracted and clustered data."""
 
+import heapq
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterable, Iterator
 
-from wve.models import ClusterResult, Extraction, Worldview, WorldviewPoint
-from wve.quotes import QuoteCollection, extract_quotes_from_dir
+from pydantic import TypeAdapter
+
+from wve.models import (
+    ClusterResult,
+    Extraction,
+    LLMBatchedWorldviewResponse,
+    LLMWorldviewResponse,
+    Worldview,
+    WorldviewPoint,
+)
+from wve.quotes import cached_quotes_from_dir, extract_quotes_from_dir
+
+
+@lru_cache(maxsize=8)
+def get_ollama_client(host: str):
+    """Get a shared Ollama client per host so its HTTP connections are reused."""
+    import ollama
+
+    return ollama.Client(host=host)
 
 
 def check_ollama(host: str = "http://localhost:11434") -> bool:
     """Check if Ollama is available and running."""
     try:
-        import ollama
-
-        client = ollama.Client(host=host)
-        client.list()
+        get_ollama_client(host).list()
         return True
     except Exception:
         return False
 
 
+def _prompt_cache(use_cache: bool):
+    """The prompt cache for this call, or None if caching is off."""
+    from wve.cache import PromptCache, prompt_cache_mode
+
+    mode = prompt_cache_mode() if use_cache else "off"
+    if mode == "off":
+        return None
+    return PromptCache(semantic=mode == "semantic")
+
+
 def ollama_generate(
     prompt: str,
     model: str = "llama3",
     host: str = "http://localhost:11434",
+    use_cache: bool = True,
+    schema: dict | None = None,
+    n_points: int | None = None,
 ) -> dict:
-    """Generate response from Ollama and parse as JSON."""
+    """Generate response from Ollama and parse as JSON.
+
+    Responses are cached per model in the prompt cache (see PromptCache);
+    repeated prompts are answered without calling the LLM. Pass a JSON
+    schema to constrain decoding to that shape instead of free JSON, and
+    the number of points the prompt asks for so cached answers are only
+    reused for the same count.
+    """
     import json
 
-    import ollama
+    cache = _prompt_cache(use_cache)
+    if cache is not None:
+        cached = cache.get(prompt, model, n_points=n_points, schema=schema)
+        if cached is not None:
+            return cached
+
+    response = get_ollama_client(host).generate(
+        model=model, prompt=prompt, format=schema or "json"
+    )
+
+    # Constrained output can still be cut short by the context or token limit
+    try:
+        data = json.loads(response["response"])
+    except (json.JSONDecodeError, KeyError):
+        return {}
+
+    # Empty or failed responses are not cached so they can be retried
+    if cache is not None and data:
+        cache.put(prompt, model, data, n_points=n_points, schema=schema)
+    return data
+
+
+def iter_json_array_items(chunks: Iterable[str], key: str) -> Iterator[dict]:
+    """Yield objects of a top-level JSON array as soon as each one closes.
+
+    Parses text arriving in arbitrary chunks, e.g. streamed LLM tokens for
+    {"<key>": [{...}, {...}]}, with a bracket counter that is aware of
+    strings and escapes. Elements that are not valid JSON objects are skipped.
+    """
+    import json
+
+    text = ""
+    pos = 0
+    stack: list[str] = []
+    in_string = escaped = False
+    string_start = 0
+    last_string = None
+    current_key = None
+    in_target = False
+    item_start = None
+
+    for chunk in chunks:
+        text += chunk
+        while pos < len(text):
+            c = text[pos]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif c == "\\":
+                    escaped = True
+                elif c == '"':
+                    in_string = False
+                    last_string = text[string_start + 1 : pos]
+            elif c == '"':
+                in_string = True
+                string_start = pos
+            elif c == ":" and len(stack) == 1:
+                current_key = last_string
+            elif c in "{[":
+                if c == "[" and stack == ["{"] and current_key == key:
+                    in_target = True
+                elif c == "{" and in_target and len(stack) == 2:
+                    item_start = pos
+                stack.append(c)
+            elif c in "}]":
+                if stack:
+                    stack.pop()
+                if c == "}" and in_target and len(stack) == 2 and item_start is not None:
+                    try:
+                        item = json.loads(text[item_start : pos + 1])
+                    except json.JSONDecodeError:
+                        item = None
+                    if isinstance(item, dict):
+                        yield item
+                    item_start = None
+                elif c == "]" and in_target and len(stack) == 1:
+                    in_target = False
+            pos += 1
+
+
+def ollama_generate_items(
+    prompt: str,
+    key: str,
+    model: str = "llama3",
+    host: str = "http://localhost:11434",
+    use_cache: bool = True,
+    schema: dict | None = None,
+    n_points: int | None = None,
+) -> Iterator[dict]:
+    """Stream a JSON response from Ollama, yielding items of its `key` array.
+
+    Each element is yielded as soon as the model finishes emitting it, so
+    callers can process early items while later ones are still decoding.
+    Fully consumed responses are stored in the prompt cache like
+    ollama_generate.
+    """
+    cache = _prompt_cache(use_cache)
+    if cache is not None:
+        cached = cache.get(prompt, model, n_points=n_points, schema=schema)
+        if cached is not None:
+            yield from (item for item in cached.get(key, []) if isinstance(item, dict))
+            return
+
+    stream = get_ollama_client(host).generate(
+        model=model, prompt=prompt, format=schema or "json", stream=True
+    )
+    items = []
+    for item in iter_json_array_items((chunk["response"] for chunk in stream), key):
+        items.append(item)
+        yield item
+
+    if cache is not None and items:
+        cache.put(prompt, model, {key: items}, n_points=n_points, schema=schema)
 
-    client = ollama.Client(host=host)
-    response = client.generate(model=model, prompt=prompt, format="json")
+
+async def ollama_generate_async(
+    prompt: str,
+    model: str = "llama3",
+    host: str = "http://localhost:11434",
+    client=None,
+    schema: dict | None = None,
+) -> dict:
+    """Async variant of ollama_generate.
+
+    Pass a shared ollama.AsyncClient to reuse its connections across requests.
+    """
+    import json
+
+    if client is None:
+        import ollama
+
+        client = ollama.AsyncClient(host=host)
+    response = await client.generate(model=model, prompt=prompt, format=schema or "json")
 
     try:
         return json.loads(response["response"])
@@ -38,6 +205,60 @@ def ollama_generate(
         return {}
 
 
+def ollama_generate_many(
+    prompts: list[str],
+    model: str = "llama3",
+    host: str = "http://localhost:11434",
+    schema: dict | None = None,
+) -> list[dict]:
+    """Generate responses for several prompts concurrently.
+
+    Requests are issued together over one AsyncClient, so they overlap up to
+    the server's parallelism (OLLAMA_NUM_PARALLEL on the Ollama side; extra
+    requests queue there). Results are returned in prompt order.
+    """
+    import asyncio
+
+    async def run() -> list[dict]:
+        import ollama
+
+        client = ollama.AsyncClient(host=host)
+        return await asyncio.gather(
+            *(
+                ollama_generate_async(p, model=model, host=host, client=client, schema=schema)
+                for p in prompts
+            )
+        )
+
+    return asyncio.run(run())
+
+
+# Per-section cap on deep-prompt context; ~4 chars per token puts the four
+# sections at roughly 1500 prompt tokens in total
+DEEP_SECTION_CHAR_BUDGET = 1500
+
+
+@lru_cache(maxsize=1)
+def deep_response_schema() -> dict:
+    """JSON schema Ollama constrains deep-synthesis output to."""
+    return LLMWorldviewResponse.model_json_schema()
+
+
+@lru_cache(maxsize=1)
+def batched_deep_response_schema() -> dict:
+    """JSON schema Ollama constrains batched deep-synthesis output to."""
+    return LLMBatchedWorldviewResponse.model_json_schema()
+
+
+def _top_clusters(clusters: ClusterResult, n: int) -> list:
+    """The n clusters with the highest coherence * member count (impact score).
+
+    heapq.nlargest keeps ties in input order, exactly like a stable sort
+    followed by [:n], without sorting every cluster.
+    """
+    return heapq.nlargest(n, clusters.clusters, key=lambda c: c.coherence * len(c.members))
+
+
 def synthesize_quick(
     clusters: ClusterResult,
     extraction: Extraction | None = None,
@@ -57,14 +278,7 @@ def synthesize_quick(
     """
     points: list[WorldviewPoint] = []
 
-    # Sort clusters by coherence * member count (impact score)
-    sorted_clusters = sorted(
-        clusters.clusters,
-        key=lambda c: c.coherence * len(c.members),
-        reverse=True,
-    )
-
-    for cluster in sorted_clusters[:n_points]:
+    for cluster in _top_clusters(clusters, n_points):
         # Generate point from cluster label and top terms
         point_text = cluster.label.replace(" / ", " and ")
         if len(cluster.centroid_terms) > 2:
@@ -90,6 +304,59 @@ def synthesize_quick(
     )
 
 
+def _phrase_matches(
+    term_groups: list[tuple[str, ...]],
+    phrases: list[str],
+) -> list[list[int]]:
+    """For each group of terms, indices of phrases containing any of its terms.
+
+    Uses a single Aho-Corasick automaton over all terms when pyahocorasick is
+    installed (the "fast" extra), so each phrase is scanned once; otherwise
+    falls back to substring checks.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return _phrase_matches_scan(term_groups, phrases)
+
+    groups_by_term: dict[str, list[int]] = {}
+    matches: list[list[int]] = [[] for _ in term_groups]
+    for gi, terms in enumerate(term_groups):
+        if "" in terms:
+            # The empty string is a substring of every phrase
+            matches[gi] = list(range(len(phrases)))
+            continue
+        for term in terms:
+            groups_by_term.setdefault(term, []).append(gi)
+    if not groups_by_term:
+        return matches
+
+    automaton = ahocorasick.Automaton()
+    for term, groups in groups_by_term.items():
+        automaton.add_word(term, groups)
+    automaton.make_automaton()
+
+    for pi, phrase in enumerate(phrases):
+        seen: set[int] = set()
+        for _, groups in automaton.iter(phrase):
+            for gi in groups:
+                if gi not in seen:
+                    seen.add(gi)
+                    matches[gi].append(pi)
+    return matches
+
+
+def _phrase_matches_scan(
+    term_groups: list[tuple[str, ...]],
+    phrases: list[str],
+) -> list[list[int]]:
+    """Substring-scan fallback for _phrase_matches."""
+    return [
+        [pi for pi, phrase in enumerate(phrases) if any(t in phrase for t in terms)]
+        for terms in term_groups
+    ]
+
+
 def synthesize_medium(
     clusters: ClusterResult,
     extraction: Extraction,
@@ -109,28 +376,23 @@ def synthesize_medium(
     """
     points: list[WorldviewPoint] = []
 
-    # Build keyword lookup for scoring
-    keyword_scores = {kw.term.lower(): kw.score for kw in extraction.keywords}
+    # Build TF-IDF lookup for scoring
     tfidf_scores = {tf.term.lower(): tf.score for tf in extraction.tfidf}
 
-    sorted_clusters = sorted(
-        clusters.clusters,
-        key=lambda c: c.coherence * len(c.members),
-        reverse=True,
-    )
+    # Match every cluster's top terms against the candidate phrases in one pass
+    selected = _top_clusters(clusters, n_points)
+    phrase_objs = extraction.phrases[:20]
+    phrase_lowers = [p.phrase.lower() for p in phrase_objs]
+    term_groups = [tuple(t.lower() for t in c.centroid_terms[:3]) for c in selected]
+    phrase_matches = _phrase_matches(term_groups, phrase_lowers)
+    tfidf_get = tfidf_scores.get
 
-    for cluster in sorted_clusters[:n_points]:
+    for cluster, top_lowers, matches in zip(selected, term_groups, phrase_matches):
         # Enhance label with TF-IDF context
         top_terms = cluster.centroid_terms[:3]
 
-        # Find related phrases
-        related_phrases = []
-        for phrase in extraction.phrases[:20]:
-            phrase_lower = phrase.phrase.lower()
-            if any(t.lower() in phrase_lower for t in top_terms):
-                related_phrases.append(phrase.phrase)
-                if len(related_phrases) >= 2:
-                    break
+        # Related phrases: the first two containing any top term
+        related_phrases = [phrase_objs[i].phrase for i in matches[:2]]
 
         # Build point description
         if related_phrases:
@@ -143,7 +405,7 @@ def synthesize_medium(
         evidence.extend(related_phrases[:2])
 
         # Calculate enhanced confidence
-        avg_tfidf = sum(tfidf_scores.get(t.lower(), 0) for t in top_terms) / len(top_terms)
+        avg_tfidf = sum(tfidf_get(tl, 0) for tl in top_lowers) / len(top_terms)
         confidence = (cluster.coherence + min(avg_tfidf, 1.0)) / 2
 
         points.append(
@@ -191,32 +453,94 @@ def synthesize_deep(
     except ImportError:
         raise RuntimeError("Deep synthesis requires ollama package. Install with: pip install ollama")
 
-    # Build context for LLM
-    cluster_summary = "\n".join(
-        f"- {c.label}: {', '.join(m.term for m in c.members[:5])}"
-        for c in clusters.clusters[:10]
+    # Points are built as each one streams in, while the rest still decode
+    prompt = _deep_prompt(clusters, extraction, subject, n_points)
+    points = [
+        _llm_point(p, extraction)
+        for p in ollama_generate_items(
+            prompt,
+            "worldview_points",
+            model=model,
+            host=ollama_host,
+            schema=deep_response_schema(),
+            n_points=n_points,
+        )
+    ]
+    return _deep_result(points[:n_points], clusters, extraction, subject, n_points)
+
+
+def _prune_context(items: list[str], budget_chars: int, sep_len: int = 2) -> list[str]:
+    """Keep items, in order, until their joined length would exceed budget_chars."""
+    kept = []
+    used = 0
+    for item in items:
+        used += len(item) + (sep_len if kept else 0)
+        if used > budget_chars:
+            break
+        kept.append(item)
+    return kept
+
+
+def _deep_context(clusters: ClusterResult, extraction: Extraction) -> str:
+    """Summarize clusters, key terms, phrases and entities for a deep prompt.
+
+    Each section is capped at DEEP_SECTION_CHAR_BUDGET characters, and terms
+    or phrases already shown in an earlier section are not repeated, to keep
+    prefill short.
+    """
+    budget = DEEP_SECTION_CHAR_BUDGET
+    kept_clusters = clusters.clusters[:10]
+    theme_lines = _prune_context(
+        [
+            f"- {c.label}: {', '.join([m.term for m in c.members[:5]])}"
+            for c in kept_clusters
+        ],
+        budget,
+        sep_len=1,
     )
 
-    top_tfidf = ", ".join(t.term for t in extraction.tfidf[:20])
-    top_phrases = ", ".join(p.phrase for p in extraction.phrases[:15])
-    entities = []
-    for label, ents in list(extraction.entities.items())[:5]:
-        entities.append(f"{label}: {', '.join(e.text for e in ents[:5])}")
-    entities_summary = "\n".join(entities) if entities else "None extracted"
+    # Terms the themes section already lists
+    shown = {m.term.lower() for c in kept_clusters[: len(theme_lines)] for m in c.members[:5]}
+    terms = _prune_context(
+        [t.term for t in extraction.tfidf[:20] if t.term.lower() not in shown], budget
+    )
+    shown.update(t.lower() for t in terms)
+    phrases = _prune_context(
+        [p.phrase for p in extraction.phrases[:15] if p.phrase.lower() not in shown], budget
+    )
+    entity_lines = _prune_context(
+        [
+            f"{label}: {', '.join([e.text for e in ents[:5]])}"
+            for label, ents in list(extraction.entities.items())[:5]
+        ],
+        budget,
+        sep_len=1,
+    )
 
-    prompt = f"""You are analyzing transcripts from video appearances of {subject} to extract their DISTINCTIVE worldview.
+    # One flat list and a single join, rather than nested per-section joins
+    parts: list[str] = ["## Extracted Themes\n"]
+    append = parts.append
+    append("\n".join(theme_lines))
+    append("\n\n## Key Terms (by TF-IDF)\n")
+    append(", ".join(terms))
+    append("\n\n## Frequent Phrases\n")
+    append(", ".join(phrases))
+    append("\n\n## Named Entities Mentioned\n")
+    append("\n".join(entity_lines) if entity_lines else "None extracted")
 
-## Extracted Themes
-{cluster_summary}
+    return "".join(parts)
 
-## Key Terms (by TF-IDF)
-{top_tfidf}
 
-## Frequent Phrases
-{top_phrases}
+def _deep_prompt(
+    clusters: ClusterResult,
+    extraction: Extraction,
+    subject: str,
+    n_points: int,
+) -> str:
+    """Build the deep synthesis prompt."""
+    prompt = f"""You are analyzing transcripts from video appearances of {subject} to extract their DISTINCTIVE worldview.
 
-## Named Entities Mentioned
-{entities_summary}
+{_deep_context(clusters, extraction)}
 
 ---
 
@@ -250,24 +574,43 @@ Format as JSON:
   ]
 }}"""
 
-    data = ollama_generate(prompt, model=model, host=ollama_host)
-    llm_points = data.get("worldview_points", [])
+    return prompt
+
+
+def _llm_point_fields(p: dict, sources: list[str]) -> dict:
+    """WorldviewPoint fields for one LLM worldview_points entry."""
+    return {
+        "point": p.get("point", ""),
+        "elaboration": p.get("elaboration"),
+        "confidence": float(p.get("confidence", 0.5)),
+        "evidence": p.get("supporting_evidence", []),
+        "sources": sources,
+    }
+
+
+def _llm_point(p: dict, extraction: Extraction) -> WorldviewPoint:
+    """Build a WorldviewPoint from one LLM worldview_points entry."""
+    return WorldviewPoint(**_llm_point_fields(p, extraction.source_transcripts[:3]))
 
-    if not llm_points:
+
+@lru_cache(maxsize=1)
+def _points_adapter() -> TypeAdapter:
+    """Validator for a whole list of WorldviewPoints in one call."""
+    return TypeAdapter(list[WorldviewPoint])
+
+
+def _deep_result(
+    points: list[WorldviewPoint],
+    clusters: ClusterResult,
+    extraction: Extraction,
+    subject: str,
+    n_points: int,
+) -> Worldview:
+    """Wrap LLM points in a Worldview, falling back to medium synthesis."""
+    if not points:
         # Fall back to medium synthesis if LLM fails
         return synthesize_medium(clusters, extraction, subject, n_points)
 
-    points = [
-        WorldviewPoint(
-            point=p.get("point", ""),
-            elaboration=p.get("elaboration"),
-            confidence=float(p.get("confidence", 0.5)),
-            evidence=p.get("supporting_evidence", []),
-            sources=extraction.source_transcripts[:3],
-        )
-        for p in llm_points[:n_points]
-    ]
-
     return Worldview(
         subject=subject,
         points=points,
@@ -277,6 +620,170 @@ Format as JSON:
     )
 
 
+def _deep_worldview(
+    data: dict,
+    clusters: ClusterResult,
+    extraction: Extraction,
+    subject: str,
+    n_points: int,
+) -> Worldview:
+    """Build a Worldview from the LLM's JSON, falling back to medium synthesis."""
+    llm_points = data.get("worldview_points", [])
+    sources = extraction.source_transcripts[:3]
+    # One validator call for the whole list rather than a model init per point
+    points = _points_adapter().validate_python(
+        [_llm_point_fields(p, sources) for p in llm_points[:n_points]]
+    )
+    return _deep_result(points, clusters, extraction, subject, n_points)
+
+
+def synthesize_deep_many(
+    jobs: list[tuple[ClusterResult, Extraction, str]],
+    n_points: int | list[int] = 5,
+    model: str = "llama3",
+    ollama_host: str = "http://localhost:11434",
+) -> list[Worldview]:
+    """Deep synthesis for several subjects with concurrent LLM requests.
+
+    Completion length grows with n_points, so when subjects ask for
+    different numbers of points the jobs are grouped into bins of equal
+    n_points and each bin is issued concurrently on its own. Short requests
+    then never wait on a long one in the same wave.
+
+    Args:
+        jobs: (clusters, extraction, subject) per subject
+        n_points: Number of worldview points, for all subjects or per job
+        model: Ollama model name
+        ollama_host: Ollama API endpoint
+
+    Returns:
+        One Worldview per job, in order
+    """
+    try:
+        import ollama  # noqa: F401
+    except ImportError:
+        raise RuntimeError("Deep synthesis requires ollama package. Install with: pip install ollama")
+
+    counts = [n_points] * len(jobs) if isinstance(n_points, int) else list(n_points)
+    if len(counts) != len(jobs):
+        raise ValueError("n_points must be an int or have one entry per job")
+
+    bins: dict[int, list[int]] = defaultdict(list)
+    for i, n in enumerate(counts):
+        bins[n].append(i)
+
+    results: list[Worldview | None] = [None] * len(jobs)
+    for n, indices in sorted(bins.items()):
+        prompts = [_deep_prompt(*jobs[i], n) for i in indices]
+        responses = ollama_generate_many(
+            prompts, model=model, host=ollama_host, schema=deep_response_schema()
+        )
+        for i, data in zip(indices, responses):
+            results[i] = _deep_worldview(data, *jobs[i], n)
+    return results
+
+
+BATCHED_DEEP_PROMPT = """You are analyzing transcripts from video appearances of {n_subjects} different people to extract each person's DISTINCTIVE worldview.
+
+{subjects_section}
+
+---
+
+Your task: For EACH subject above, independently identify {n_points} beliefs or positions that make that subject's worldview DISTINCTIVE. Use only the data listed under that subject.
+
+CRITICAL REQUIREMENTS:
+- Focus on what each subject believes that MOST PEOPLE DON'T
+- Identify CONTRARIAN or UNCONVENTIONAL positions
+- Be SPECIFIC: use proper nouns, specific claims, named concepts, concrete examples
+- AVOID platitudes like "X is important", "Y matters", "believes in Z"
+
+For each point:
+1. State a specific, distinctive belief (not a generic observation)
+2. Elaborate with concrete details or named concepts they reference
+3. List specific evidence (exact terms, phrases, entities from that subject's data)
+4. Confidence score (0.0-1.0) - higher if multiple sources support this distinctive view
+
+Return one entry per subject, in the same order, with its subject number.
+
+Format as JSON:
+{{
+  "results": [
+    {{
+      "subject_index": 1,
+      "subject": "...",
+      "worldview_points": [
+        {{
+          "point": "...",
+          "elaboration": "...",
+          "confidence": 0.0,
+          "supporting_evidence": ["...", "..."]
+        }}
+      ]
+    }}
+  ]
+}}"""
+
+
+def synthesize_deep_batched(
+    jobs: list[tuple[ClusterResult, Extraction, str]],
+    n_points: int = 5,
+    model: str = "llama3",
+    ollama_host: str = "http://localhost:11434",
+) -> list[Worldview]:
+    """Deep synthesis for several subjects in a single LLM call.
+
+    All subjects share one prompt (and one instruction prefill), trading
+    per-subject focus for fewer round trips. Subjects the model skips fall
+    back to medium synthesis.
+
+    Args:
+        jobs: (clusters, extraction, subject) per subject
+        n_points: Number of worldview points per subject
+        model: Ollama model name
+        ollama_host: Ollama API endpoint
+
+    Returns:
+        One Worldview per job, in order
+    """
+    try:
+        import ollama  # noqa: F401
+    except ImportError:
+        raise RuntimeError("Deep synthesis requires ollama package. Install with: pip install ollama")
+
+    if not jobs:
+        return []
+
+    subjects_section = "\n\n".join(
+        f"# Subject {k}: {subject}\n\n{_deep_context(clusters, extraction)}"
+        for k, (clusters, extraction, subject) in enumerate(jobs, 1)
+    )
+    prompt = BATCHED_DEEP_PROMPT.format(
+        n_subjects=len(jobs),
+        subjects_section=subjects_section,
+        n_points=n_points,
+    )
+    data = ollama_generate(
+        prompt,
+        model=model,
+        host=ollama_host,
+        schema=batched_deep_response_schema(),
+        n_points=n_points,
+    )
+
+    # Match results by subject number, falling back to position
+    by_index: dict[int, dict] = {}
+    for pos, result in enumerate(data.get("results", []), 1):
+        if not isinstance(result, dict):
+            continue
+        index = result.get("subject_index", pos)
+        by_index.setdefault(index if isinstance(index, int) else pos, result)
+
+    return [
+        _deep_worldview(by_index.get(k, {}), clusters, extraction, subject, n_points)
+        for k, (clusters, extraction, subject) in enumerate(jobs, 1)
+    ]
+
+
 def synthesize(
     clusters: ClusterResult,
     extraction: Extraction | None = None,
@@ -313,9 +820,18 @@ def synthesize(
 
 
 def save_worldview(worldview: Worldview, output_path: str) -> None:
-    """Save worldview to JSON."""
-    with open(output_path, "w") as f:
-        f.write(worldview.model_dump_json(indent=2))
+    """Save worldview to JSON.
+
+    Encodes with orjson when installed (the `fast` extra); the output is
+    byte-identical to pydantic's own indented JSON.
+    """
+    try:
+        import orjson
+    except ImportError:
+        data = worldview.model_dump_json(indent=2).encode()
+    else:
+        data = orjson.dumps(worldview.model_dump(mode="json"), option=orjson.OPT_INDENT_2)
+    Path(output_path).write_bytes(data)
 
 
 # === Quote-Grounded Synthesis (v0.2) ===
@@ -361,6 +877,7 @@ def synthesize_grounded(
     n_points: int = 5,
     model: str = "llama3",
     ollama_host: str = "http://localhost:11434",
+    use_cache: bool = True,
 ) -> dict:
     """Quote-grounded synthesis using actual quotes from transcripts.
     
@@ -372,14 +889,28 @@ def synthesize_grounded(
         n_points: Number of worldview points
         model: Ollama model name
         ollama_host: Ollama API endpoint
+        use_cache: Reuse quotes and results while the transcripts are unchanged
         
     Returns:
         Dict with worldview points, each backed by exact quotes
     """
+    from wve.cache import cache_key, directory_fingerprint, get_cached, set_cached
+
     transcript_path = Path(transcript_dir)
-    
+
+    # Both cache keys change whenever a transcript is added, removed or edited
+    fingerprint = tuple(directory_fingerprint(transcript_path)) if use_cache else None
+    result_key = cache_key("grounded", fingerprint, subject, n_points, model, ollama_host)
+    if use_cache:
+        cached = get_cached(result_key)
+        if cached is not None:
+            return cached
+
     # Extract quotes first
-    collection = extract_quotes_from_dir(transcript_path, max_quotes=100, min_score=0.25)
+    if use_cache:
+        collection = cached_quotes_from_dir(str(transcript_path), fingerprint, 100, 0.25)
+    else:
+        collection = extract_quotes_from_dir(transcript_path, max_quotes=100, min_score=0.25)
     
     if not collection.quotes:
         return {
@@ -401,7 +932,7 @@ def synthesize_grounded(
     )
     
     try:
-        data = ollama_generate(prompt, model=model, host=ollama_host)
+        data = ollama_generate(prompt, model=model, host=ollama_host, n_points=n_points)
         points = data.get("worldview_points", [])
     except Exception as e:
         # Return quotes without synthesis if LLM fails
@@ -413,9 +944,13 @@ def synthesize_grounded(
             "source_count": collection.source_count,
         }
     
-    return {
+    result = {
         "subject": subject,
         "worldview_points": points,
         "source_count": collection.source_count,
         "total_quotes_analyzed": len(collection.quotes),
     }
+    # An unparsable or empty LLM answer is not cached, so the next run retries
+    if use_cache and points:
+        set_cached(result_key, result)
+    return result
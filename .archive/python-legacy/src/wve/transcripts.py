@@ -1,43 +1,38 @@
 """Transcript download and preprocessing via yt-dlp."""
 
 import json
+import os
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Iterable, Iterator
 
 from wve.models import TranscriptManifest, VideoMetadata
 
+_TS_RE = re.compile(r"^\d{2}:\d{2}:\d{2}")
+_TAG_RE = re.compile(r"<[^>]+>")
+_VIDEO_ID_RE = re.compile(r"(?:v=|youtu\.be/)([a-zA-Z0-9_-]{11})")
 
-def download_transcript(
-    video_url: str,
-    output_dir: Path,
-    lang: str = "en",
-) -> Path | None:
-    """Download transcript for a single video.
-
-    Args:
-        video_url: YouTube video URL or ID
-        output_dir: Directory to save transcript
-        lang: Preferred language code
+# Maximum concurrent yt-dlp processes used by download_transcripts
+DOWNLOAD_WORKERS = 8
 
-    Returns:
-        Path to transcript file, or None if unavailable
-    """
-    output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Extract video ID for filename
-    video_id = video_url
+def _video_id(video_url: str) -> str:
+    """Extract the YouTube video ID from a URL, or return the input unchanged."""
     if "youtube.com" in video_url or "youtu.be" in video_url:
-        match = re.search(r"(?:v=|youtu\.be/)([a-zA-Z0-9_-]{11})", video_url)
+        match = _VIDEO_ID_RE.search(video_url)
         if match:
-            video_id = match.group(1)
+            return match.group(1)
+    return video_url
 
-    output_template = str(output_dir / f"{video_id}")
 
-    cmd = [
+def _yt_dlp_subs_cmd(urls: list[str], output_template: str, lang: str) -> list[str]:
+    """yt-dlp command that fetches auto-subs for `urls` without the media."""
+    return [
         "yt-dlp",
-        video_url,
+        *urls,
         "--write-auto-sub",
         "--sub-lang", lang,
         "--skip-download",
@@ -45,8 +40,9 @@ def download_transcript(
         "--no-warnings",
     ]
 
-    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
 
+def _vtt_to_txt(video_id: str, output_dir: Path) -> Path | None:
+    """Convert a downloaded VTT file to plain text, or None if there is none."""
     # Look for downloaded VTT file
     vtt_files = list(output_dir.glob(f"{video_id}*.vtt"))
     if not vtt_files:
@@ -55,9 +51,20 @@ def download_transcript(
     vtt_path = vtt_files[0]
     txt_path = output_dir / f"{video_id}.txt"
 
-    # Convert VTT to plain text
-    clean_text = vtt_to_text(vtt_path.read_text())
-    txt_path.write_text(clean_text)
+    # Convert VTT to plain text, streaming line by line into a partial file
+    # that is renamed into place, so an interrupted conversion never leaves
+    # a truncated .txt that resume would take for a finished transcript
+    part_path = output_dir / f"{video_id}.txt.part"
+    try:
+        with open(part_path, "w") as out:
+            for i, line in enumerate(vtt_to_text_path(vtt_path)):
+                if i:
+                    out.write(" ")
+                out.write(line)
+        os.replace(part_path, txt_path)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
 
     # Remove VTT file
     vtt_path.unlink()
@@ -65,19 +72,78 @@ def download_transcript(
     return txt_path
 
 
+def download_transcript(
+    video_url: str,
+    output_dir: Path,
+    lang: str = "en",
+) -> Path | None:
+    """Download transcript for a single video.
+
+    Args:
+        video_url: YouTube video URL or ID
+        output_dir: Directory to save transcript
+        lang: Preferred language code
+
+    Returns:
+        Path to transcript file, or None if unavailable
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Extract video ID for filename
+    video_id = _video_id(video_url)
+    cmd = _yt_dlp_subs_cmd([video_url], str(output_dir / video_id), lang)
+    subprocess.run(cmd, capture_output=True, text=True, check=False)
+
+    return _vtt_to_txt(video_id, output_dir)
+
+
+def _download_batch(
+    metas: list[VideoMetadata],
+    output_dir: Path,
+    lang: str,
+) -> list[Path | None]:
+    """Download transcripts for several videos with a single yt-dlp process.
+
+    One invocation reuses yt-dlp's startup and HTTP session across all the
+    URLs; --ignore-errors keeps one unavailable video from aborting the rest.
+    """
+    cmd = _yt_dlp_subs_cmd([m.url for m in metas], str(output_dir / "%(id)s"), lang)
+    cmd.append("--ignore-errors")
+    subprocess.run(cmd, capture_output=True, text=True, check=False)
+
+    return [_vtt_to_txt(m.id, output_dir) for m in metas]
+
+
 def vtt_to_text(vtt_content: str) -> str:
     """Convert VTT subtitle content to clean plain text.
 
     Handles YouTube's rolling caption deduplication.
     """
-    lines = []
-    seen_lines: set[str] = set()
+    return " ".join(_vtt_lines(vtt_content.split("\n")))
+
+
+def vtt_to_text_path(vtt_path: Path) -> Iterator[str]:
+    """Stream clean caption lines from a VTT file.
+
+    Same output as vtt_to_text, but reads the file line by line so the
+    whole subtitle file is never held in memory.
+    """
+    with open(vtt_path) as f:
+        yield from _vtt_lines(f)
+
+
+def _vtt_lines(raw_lines: Iterable[str]) -> Iterator[str]:
+    """Yield deduplicated caption text from raw VTT lines."""
+    # Only 64-bit hashes are kept, not the caption strings themselves
+    seen_hashes: set[int] = set()
+    ts_match = _TS_RE.match
+    strip_tags = _TAG_RE.sub
 
-    for line in vtt_content.split("\n"):
+    for line in raw_lines:
         # Skip VTT headers and timestamps
         if line.startswith("WEBVTT") or line.startswith("Kind:") or line.startswith("Language:"):
             continue
-        if re.match(r"^\d{2}:\d{2}:\d{2}", line):
+        if ts_match(line):
             continue
         if "-->" in line:
             continue
@@ -85,24 +151,24 @@ def vtt_to_text(vtt_content: str) -> str:
             continue
 
         # Remove VTT formatting tags
-        clean = re.sub(r"<[^>]+>", "", line)
+        clean = strip_tags("", line)
         clean = clean.strip()
 
         if not clean:
             continue
 
         # Deduplicate (YouTube rolling captions repeat lines)
-        if clean not in seen_lines:
-            seen_lines.add(clean)
-            lines.append(clean)
-
-    return " ".join(lines)
+        h = hash(clean)
+        if h not in seen_hashes:
+            seen_hashes.add(h)
+            yield clean
 
 
 def download_transcripts(
     videos: list[VideoMetadata] | list[str],
     output_dir: str | Path,
     lang: str = "en",
+    max_workers: int = DOWNLOAD_WORKERS,
 ) -> TranscriptManifest:
     """Download transcripts for multiple videos.
 
@@ -110,6 +176,7 @@ def download_transcripts(
         videos: List of VideoMetadata objects or video URLs
         output_dir: Directory to save transcripts
         lang: Preferred language code
+        max_workers: Maximum number of concurrent yt-dlp processes
 
     Returns:
         TranscriptManifest with paths to downloaded transcripts
@@ -117,20 +184,13 @@ def download_transcripts(
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    transcripts: dict[str, Path] = {}
-    video_metadata: list[VideoMetadata] = []
-
+    metas: list[VideoMetadata] = []
     for video in videos:
         if isinstance(video, str):
             url = video
-            video_id = url
-            if "youtube.com" in url or "youtu.be" in url:
-                match = re.search(r"(?:v=|youtu\.be/)([a-zA-Z0-9_-]{11})", url)
-                if match:
-                    video_id = match.group(1)
             # Create minimal metadata for URL-only input
             meta = VideoMetadata(
-                id=video_id,
+                id=_video_id(url),
                 title="",
                 channel="",
                 channel_id="",
@@ -140,9 +200,34 @@ def download_transcripts(
             )
         else:
             meta = video
-            url = meta.url
+        metas.append(meta)
+
+    # A repeated video would land in a second batch that finds its VTT
+    # already converted and removed; the first occurrence wins
+    unique: dict[str, VideoMetadata] = {}
+    for meta in metas:
+        unique.setdefault(meta.id, meta)
+    metas = list(unique.values())
+
+    # Split the videos across at most max_workers yt-dlp processes; each
+    # process downloads its whole batch, and the threads overlap their waits
+    n_batches = min(max_workers, len(metas))
+    batches = [metas[i::n_batches] for i in range(n_batches)]
+    paths: dict[str, Path | None] = {}
+    if batches:
+        with ThreadPoolExecutor(max_workers=n_batches) as executor:
+            for batch, batch_paths in zip(
+                batches,
+                executor.map(lambda batch: _download_batch(batch, output_path, lang), batches),
+            ):
+                for meta, path in zip(batch, batch_paths):
+                    if path is not None:
+                        paths[meta.id] = path
 
-        transcript_path = download_transcript(url, output_path, lang)
+    transcripts: dict[str, Path] = {}
+    video_metadata: list[VideoMetadata] = []
+    for meta in metas:
+        transcript_path = paths.get(meta.id)
         if transcript_path:
             transcripts[meta.id] = transcript_path
             video_metadata.append(meta)
@@ -162,5 +247,5 @@ def download_transcripts(
 
 def load_manifest(manifest_path: str | Path) -> TranscriptManifest:
     """Load a transcript manifest from JSON."""
-    with open(manifest_path) as f:
+    with open(manifest_path, "rb") as f:
         return TranscriptManifest.model_validate_json(f.read())
@@ -1,5 +1,8 @@
 """Library browser for wve TUI."""
 
+import subprocess
+from collections import OrderedDict
+
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
@@ -7,6 +10,27 @@ from textual.screen import Screen
 from textual.widgets import Static, ListView, ListItem, Label
 
 from wve.prompts.fuzzy_select import FuzzySelect
+from wve.store import delete_entry, list_entry_summaries, load_entry
+
+# Rendered detail panels kept per slug in BrowserScreen
+DETAIL_CACHE_SIZE = 64
+
+
+def _open_report(path: str) -> None:
+    """Open a report with the system viewer without waiting for it.
+
+    The viewer is detached so the TUI keeps handling input while the
+    launcher resolves a handler.
+    """
+    try:
+        subprocess.Popen(
+            ["open", path],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
 
 
 class WorldviewItem(ListItem):
@@ -19,7 +43,19 @@ class WorldviewItem(ListItem):
         self.source_count = source_count
     
     def compose(self) -> ComposeResult:
-        yield Label(f"{self.display_name} [dim]({self.source_count})[/dim]")
+        yield Label(self._label_text())
+    
+    def _label_text(self) -> str:
+        return f"{self.display_name} [dim]({self.source_count})[/dim]"
+    
+    def update_entry(self, display_name: str, source_count: int) -> None:
+        """Refresh the row in place if the entry's name or count changed."""
+        if (display_name, source_count) == (self.display_name, self.source_count):
+            return
+        self.display_name = display_name
+        self.source_count = source_count
+        if self.is_mounted:
+            self.query_one(Label).update(self._label_text())
 
 
 class BrowserApp(App):
@@ -66,6 +102,9 @@ class BrowserApp(App):
         super().__init__()
         self.entries = []
         self.selected_entry = None
+        self._entries_by_slug: dict = {}
+        # slug -> (index updated_at, entry, rendered detail), oldest first
+        self._detail_cache: OrderedDict[str, tuple] = OrderedDict()
     
     def compose(self) -> ComposeResult:
         with Vertical(id="browser-main"):
@@ -75,21 +114,23 @@ class BrowserApp(App):
         yield Static("[q] quit  [n] new  [a] ask  [d] delete  [enter] view", id="footer")
     
     def on_mount(self) -> None:
+        self._detail_pane = self.query_one("#detail-pane", Static)
         self._load_entries()
     
-    def _load_entries(self) -> None:
-        """Load worldview entries and create fuzzy selector."""
-        try:
-            from wve.store import list_entries
-            self.entries = list_entries()
-        except Exception:
-            self.entries = []
-        
-        container = self.query_one("#fuzzy-container", Static)
-        
-        if not self.entries:
-            container.update("[dim]No worldviews stored yet. Run 'wve run' to create one.[/dim]")
-            return
+    def _load_entries(self, entries: list | None = None) -> None:
+        """Load worldview entries and create fuzzy selector.
+
+        Pass entries to re-render a list already in hand (e.g. after a
+        delete) without going back to the store.
+        """
+        if entries is not None:
+            self.entries = entries
+        else:
+            try:
+                self.entries = list_entry_summaries()
+            except Exception:
+                self.entries = []
+        self._entries_by_slug = {entry.slug: entry for entry in self.entries}
         
         # Build items for FuzzySelect: (display_text, value)
         items = [
@@ -97,6 +138,18 @@ class BrowserApp(App):
             for e in self.entries
         ]
         
+        # Already showing a selector: swap its items in place
+        existing = self.query(FuzzySelect)
+        if existing:
+            existing.first().set_items(items)
+            return
+        
+        container = self.query_one("#fuzzy-container", Static)
+        
+        if not self.entries:
+            container.update("[dim]No worldviews stored yet. Run 'wve run' to create one.[/dim]")
+            return
+        
         # Mount FuzzySelect
         fuzzy = FuzzySelect(items, prompt=">", max_visible=15)
         container.remove()
@@ -107,15 +160,33 @@ class BrowserApp(App):
         self._show_entry(event.value)
     
     def _show_entry(self, slug: str) -> None:
-        """Show details for selected entry."""
-        try:
-            from wve.store import load_entry
-            entry = load_entry(slug)
-            self.selected_entry = entry
-        except Exception:
-            return
+        """Show details for selected entry.
+
+        The rendered detail is memoised per slug, as in BrowserScreen, and
+        reused until the entry's updated_at in the index changes.
+        """
+        listed = self._entries_by_slug.get(slug)
+        stamp = listed.updated_at if listed is not None else None
+        cached = self._detail_cache.get(slug)
+        if cached is not None and cached[0] == stamp:
+            self._detail_cache.move_to_end(slug)
+            _, entry, detail = cached
+        else:
+            try:
+                entry = load_entry(slug)
+            except Exception:
+                return
+            detail = self._render_detail(entry)
+            self._detail_cache[slug] = (stamp, entry, detail)
+            if len(self._detail_cache) > DETAIL_CACHE_SIZE:
+                self._detail_cache.popitem(last=False)
+        self.selected_entry = entry
         
-        # Build detail view
+        self._detail_pane.update(detail)
+    
+    @staticmethod
+    def _render_detail(entry) -> str:
+        """Detail pane text for an entry."""
         lines = [
             f"[bold cyan]{entry.display_name}[/bold cyan]",
             "",
@@ -124,24 +195,24 @@ class BrowserApp(App):
         ]
         
         if entry.themes:
-            theme_names = [t.get('name', '') for t in entry.themes[:5]]
-            lines.append(f"[bold]Themes:[/bold] {', '.join(theme_names)}")
+            theme_names = ', '.join(name for t in entry.themes[:5] if (name := t.get('name')))
+            lines.append(f"[bold]Themes:[/bold] {theme_names}")
         
         if entry.top_quotes:
             quote = entry.top_quotes[0]
-            quote_text = quote.get('text', '')[:120]
-            if len(quote.get('text', '')) > 120:
+            text = quote.get('text', '')
+            quote_text = text[:120]
+            if len(text) > 120:
                 quote_text += "..."
             lines.append("")
             lines.append(f"[italic]\"{quote_text}\"[/italic]")
         
-        self.query_one("#detail-pane", Static).update("\n".join(lines))
+        return "\n".join(lines)
     
     def action_view(self) -> None:
         """Open full report."""
         if self.selected_entry and self.selected_entry.report_path:
-            import subprocess
-            subprocess.run(["open", self.selected_entry.report_path], check=False)
+            _open_report(self.selected_entry.report_path)
     
     def action_ask(self) -> None:
         """Placeholder for ask functionality."""
@@ -150,10 +221,12 @@ class BrowserApp(App):
     def action_delete(self) -> None:
         """Delete the selected entry."""
         if self.selected_entry:
-            from wve.store import delete_entry
-            delete_entry(self.selected_entry.slug)
+            slug = self.selected_entry.slug
+            delete_entry(slug)
             self.selected_entry = None
-            self._load_entries()
+            self._detail_cache.pop(slug, None)
+            # Drop the one entry locally instead of re-reading the store
+            self._load_entries([e for e in self.entries if e.slug != slug])
     
     def action_new(self) -> None:
         """Placeholder for new worldview creation."""
@@ -212,6 +285,11 @@ class BrowserScreen(Screen):
         super().__init__()
         self.selected_entry = None
         self.entries = []
+        self._item_widgets: dict[str, WorldviewItem] = {}
+        self._placeholder: ListItem | None = None
+        self._entries_by_slug: dict = {}
+        # slug -> (index updated_at, entry, rendered panels), oldest first
+        self._detail_cache: OrderedDict[str, tuple] = OrderedDict()
     
     def compose(self) -> ComposeResult:
         with Horizontal(id="browser-container"):
@@ -226,30 +304,71 @@ class BrowserScreen(Screen):
         yield Static("[q] back  [n] new  [a] ask  [d] delete  [enter] view")
     
     def on_mount(self) -> None:
+        # Widgets touched on every selection or reload, looked up once
+        self._list_view = self.query_one("#entry-list", ListView)
+        self._detail_widgets = tuple(
+            self.query_one(selector, Static)
+            for selector in ("#detail-title", "#stats", "#themes", "#quote-section")
+        )
         self._load_entries()
-        list_view = self.query_one("#entry-list", ListView)
-        list_view.focus()
-    
-    def _load_entries(self) -> None:
-        """Load worldview entries from store."""
-        try:
-            from wve.store import list_entries
-            self.entries = list_entries()
-        except Exception:
-            self.entries = []
+        self._list_view.focus()
+    
+    def _load_entries(self, entries: list | None = None) -> None:
+        """Load worldview entries from store, or re-render the given ones."""
+        if entries is not None:
+            self.entries = entries
+        else:
+            try:
+                self.entries = list_entry_summaries()
+            except Exception:
+                self.entries = []
         
-        list_view = self.query_one("#entry-list", ListView)
-        list_view.clear()
+        # One repaint for the whole diff rather than one per changed row
+        with self.app.batch_update():
+            self._sync_rows(self._list_view)
+    
+    def _sync_rows(self, list_view: ListView) -> None:
+        """Diff self.entries against the rows already shown.
+
+        Only removed rows are unmounted and only new ones are created, all
+        in a single extend.
+        """
+        current = {entry.slug: entry for entry in self.entries}
+        self._entries_by_slug = current
+        stale = [
+            item for slug, item in self._item_widgets.items() if slug not in current
+        ]
+        if self.entries and self._placeholder is not None:
+            stale.append(self._placeholder)
+            self._placeholder = None
+        if stale:
+            rows = list(list_view.query(ListItem))
+            list_view.remove_items([rows.index(item) for item in stale])
+            for item in stale:
+                if isinstance(item, WorldviewItem):
+                    del self._item_widgets[item.slug]
         
         if not self.entries:
-            list_view.append(ListItem(Label("[dim]No worldviews yet[/dim]")))
-        else:
-            for entry in self.entries:
-                list_view.append(WorldviewItem(
-                    slug=entry.slug,
-                    display_name=entry.display_name,
-                    source_count=entry.source_count,
-                ))
+            if self._placeholder is None:
+                self._placeholder = ListItem(Label("[dim]No worldviews yet[/dim]"))
+                list_view.append(self._placeholder)
+            return
+        
+        added = []
+        for entry in self.entries:
+            item = self._item_widgets.get(entry.slug)
+            if item is not None:
+                item.update_entry(entry.display_name, entry.source_count)
+                continue
+            item = WorldviewItem(
+                slug=entry.slug,
+                display_name=entry.display_name,
+                source_count=entry.source_count,
+            )
+            self._item_widgets[entry.slug] = item
+            added.append(item)
+        if added:
+            list_view.extend(added)
     
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle selection change."""
@@ -257,42 +376,60 @@ class BrowserScreen(Screen):
             self._show_entry(event.item.slug)
     
     def _show_entry(self, slug: str) -> None:
-        """Show details for selected entry."""
-        try:
-            from wve.store import load_entry
-            entry = load_entry(slug)
-            self.selected_entry = entry
-        except Exception:
-            return
+        """Show details for selected entry.
+
+        Rendered panels are memoised per slug and reused until the entry's
+        updated_at in the index changes.
+        """
+        listed = self._entries_by_slug.get(slug)
+        stamp = listed.updated_at if listed is not None else None
+        cached = self._detail_cache.get(slug)
+        if cached is not None and cached[0] == stamp:
+            self._detail_cache.move_to_end(slug)
+            _, entry, panels = cached
+        else:
+            try:
+                entry = load_entry(slug)
+            except Exception:
+                return
+            panels = self._render_detail(entry)
+            self._detail_cache[slug] = (stamp, entry, panels)
+            if len(self._detail_cache) > DETAIL_CACHE_SIZE:
+                self._detail_cache.popitem(last=False)
+        self.selected_entry = entry
         
-        # Update detail pane
-        self.query_one("#detail-title", Static).update(
-            f"[bold cyan]{entry.display_name}[/bold cyan]"
-        )
+        # Update detail pane: title, stats, themes, quote
+        for widget, text in zip(self._detail_widgets, panels):
+            widget.update(text)
+    
+    @staticmethod
+    def _render_detail(entry) -> tuple[str, str, str, str]:
+        """Title, stats, themes and quote panel text for an entry."""
+        title = f"[bold cyan]{entry.display_name}[/bold cyan]"
         
         stats = f"""[bold]Sources:[/bold] {entry.source_count} transcripts
 [bold]Quotes:[/bold] {entry.quote_count} notable"""
         if hasattr(entry, 'updated_at') and entry.updated_at:
             stats += f"\n[bold]Updated:[/bold] {entry.updated_at.strftime('%Y-%m-%d')}"
-        self.query_one("#stats", Static).update(stats)
         
         # Themes
+        themes_text = ""
         if entry.themes:
-            theme_names = [t.get('name', '') for t in entry.themes[:5]]
             themes_text = "[bold]Top Themes[/bold]\n" + "\n".join(
-                f"  • {name}" for name in theme_names if name
+                f"  • {name}" for t in entry.themes[:5] if (name := t.get('name'))
             )
-            self.query_one("#themes", Static).update(themes_text)
         
         # Sample quote
+        quote_section = ""
         if entry.top_quotes:
             quote = entry.top_quotes[0]
-            quote_text = quote.get('text', '')[:150]
-            if len(quote.get('text', '')) > 150:
+            text = quote.get('text', '')
+            quote_text = text[:150]
+            if len(text) > 150:
                 quote_text += "..."
-            self.query_one("#quote-section", Static).update(
-                f"[bold]Sample Quote[/bold]\n[italic]\"{quote_text}\"[/italic]"
-            )
+            quote_section = f"[bold]Sample Quote[/bold]\n[italic]\"{quote_text}\"[/italic]"
+        
+        return title, stats, themes_text, quote_section
     
     def action_back(self) -> None:
         self.app.pop_screen()
@@ -300,8 +437,7 @@ class BrowserScreen(Screen):
     def action_view(self) -> None:
         """Open full report."""
         if self.selected_entry and self.selected_entry.report_path:
-            import subprocess
-            subprocess.run(["open", self.selected_entry.report_path], check=False)
+            _open_report(self.selected_entry.report_path)
     
     def action_ask(self) -> None:
         """Switch to ask screen for this entry."""
@@ -311,10 +447,12 @@ class BrowserScreen(Screen):
     def action_delete(self) -> None:
         """Delete the selected entry."""
         if self.selected_entry:
-            from wve.store import delete_entry
-            delete_entry(self.selected_entry.slug)
+            slug = self.selected_entry.slug
+            delete_entry(slug)
             self.selected_entry = None
-            self._load_entries()
+            self._detail_cache.pop(slug, None)
+            # Drop the one entry locally instead of re-reading the store
+            self._load_entries([e for e in self.entries if e.slug != slug])
     
     def action_new(self) -> None:
         self.app.push_screen("wizard")
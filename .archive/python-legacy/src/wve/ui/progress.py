@@ -1,7 +1,9 @@
 """Multi-stage progress tracking for wve operations."""
 
+import threading
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import ClassVar, Literal
 
 from rich.console import Console, Group
 from rich.live import Live
@@ -18,29 +20,54 @@ ItemStatus = Literal["pending", "active", "done", "failed", "skipped"]
 class StageProgress:
     """Track multi-stage operations with nested progress items."""
     
+    # Icon and color for each item status
+    _STATUS_STYLES: ClassVar[dict[str, tuple[str, str]]] = {
+        "pending": ("○", "dim"),
+        "active": ("◉", "cyan"),
+        "done": ("✓", "green"),
+        "failed": ("✗", "red"),
+        "skipped": ("⊘", "yellow"),
+    }
+    # Markup before and after an item name, formatted once from the styles
+    _STATUS_MARKUP: ClassVar[dict[str, tuple[str, str]]] = {
+        status: (f"  [{color}]{icon} ", f"[/{color}]")
+        for status, (icon, color) in _STATUS_STYLES.items()
+    }
+    
     stages: list[str]
     title: str = "Processing"
     current_stage: int = 0
-    sub_items: list[tuple[str, ItemStatus]] = field(default_factory=list)
+    # Item name -> status, in insertion order
+    sub_items: dict[str, ItemStatus] = field(default_factory=dict)
     _max_visible_items: int = 6
     
+    def __post_init__(self) -> None:
+        # Names of the most recently added items, i.e. the visible tail
+        self._recent: deque[str] = deque(self.sub_items, maxlen=self._max_visible_items)
+        # Parsed row cells, keyed by the state they show, so unchanged rows
+        # skip markup parsing on every frame
+        self._stage_rows: dict[tuple[str, int], tuple[Text, Text]] = {}
+        self._item_rows: dict[tuple[str, ItemStatus], Text] = {}
+    
     def advance_stage(self) -> None:
         """Move to the next stage."""
         if self.current_stage < len(self.stages):
             self.current_stage += 1
         self.sub_items.clear()
+        self._recent.clear()
+        self._item_rows.clear()
     
     def add_item(self, name: str, status: ItemStatus = "pending") -> None:
-        """Add a sub-item to track."""
-        self.sub_items.append((name, status))
+        """Add a sub-item to track; an existing item keeps its status."""
+        if name not in self.sub_items:
+            self.sub_items[name] = status
+            self._recent.append(name)
     
     def update_item(self, name: str, status: ItemStatus) -> None:
-        """Update status of an existing item."""
-        for i, (item_name, _) in enumerate(self.sub_items):
-            if item_name == name:
-                self.sub_items[i] = (name, status)
-                return
-        self.sub_items.append((name, status))
+        """Update status of an existing item, adding it if new."""
+        if name not in self.sub_items:
+            self._recent.append(name)
+        self.sub_items[name] = status
     
     def render(self) -> Panel:
         """Render the current progress state."""
@@ -50,53 +77,71 @@ class StageProgress:
         
         # Render stages
         for i, stage in enumerate(self.stages):
-            if i < self.current_stage:
-                table.add_row("[green]✓[/green]", f"[green]{stage}[/green]")
-            elif i == self.current_stage:
-                table.add_row("[cyan]◉[/cyan]", f"[cyan bold]{stage}[/cyan bold]")
-            else:
-                table.add_row("[dim]○[/dim]", f"[dim]{stage}[/dim]")
+            position = (i > self.current_stage) - (i < self.current_stage)
+            table.add_row(*self._stage_row(stage, position))
         
         # Render sub-items (show last N)
         if self.sub_items:
             table.add_row("", "")
-            visible = self.sub_items[-self._max_visible_items:]
-            
             if len(self.sub_items) > self._max_visible_items:
                 hidden = len(self.sub_items) - self._max_visible_items
                 table.add_row("", f"[dim]  ... {hidden} more above[/dim]")
             
-            for name, status in visible:
-                icon, color = self._status_style(status)
-                table.add_row("", f"  [{color}]{icon} {name}[/{color}]")
+            for name in self._recent:
+                table.add_row("", self._item_row(name, self.sub_items[name]))
         
         return Panel(table, title=f"[bold]{self.title}[/bold]", border_style="cyan")
     
+    def _stage_row(self, stage: str, position: int) -> tuple[Text, Text]:
+        """Icon and label cells for a stage that is done (-1), current (0) or ahead (1)."""
+        key = (stage, position)
+        row = self._stage_rows.get(key)
+        if row is None:
+            if position < 0:
+                markup = ("[green]✓[/green]", f"[green]{stage}[/green]")
+            elif position == 0:
+                markup = ("[cyan]◉[/cyan]", f"[cyan bold]{stage}[/cyan bold]")
+            else:
+                markup = ("[dim]○[/dim]", f"[dim]{stage}[/dim]")
+            row = self._stage_rows[key] = (Text.from_markup(markup[0]), Text.from_markup(markup[1]))
+        return row
+    
+    def _item_row(self, name: str, status: ItemStatus) -> Text:
+        """Label cell for a sub-item in the given status."""
+        key = (name, status)
+        row = self._item_rows.get(key)
+        if row is None:
+            prefix, suffix = self._STATUS_MARKUP.get(status, ("  [white]? ", "[/white]"))
+            row = self._item_rows[key] = Text.from_markup(prefix + name + suffix)
+        return row
+    
     def _status_style(self, status: ItemStatus) -> tuple[str, str]:
         """Get icon and color for status."""
-        return {
-            "pending": ("○", "dim"),
-            "active": ("◉", "cyan"),
-            "done": ("✓", "green"),
-            "failed": ("✗", "red"),
-            "skipped": ("⊘", "yellow"),
-        }.get(status, ("?", "white"))
+        return self._STATUS_STYLES.get(status, ("?", "white"))
 
 
 class ProgressContext:
-    """Context manager for live progress display."""
+    """Context manager for live progress display.
+
+    Changes only mark the panel dirty; Live's own refresh thread re-renders
+    it at most ``refresh_per_second`` times, so a tight loop of updates
+    costs one render per frame instead of one per call.
+    """
     
     def __init__(self, progress: StageProgress, console: Console | None = None):
         self.progress = progress
         self.console = console or Console(stderr=True)
         self._live: Live | None = None
+        self._lock = threading.Lock()
+        self._dirty = True
+        self._panel: Panel | None = None
     
     def __enter__(self) -> "ProgressContext":
         self._live = Live(
-            self.progress.render(),
             console=self.console,
             refresh_per_second=4,
             transient=True,
+            get_renderable=self._renderable,
         )
         self._live.__enter__()
         return self
@@ -105,22 +150,32 @@ class ProgressContext:
         if self._live:
             self._live.__exit__(*args)
     
+    def _renderable(self) -> Panel:
+        """Current panel, re-rendered only if something changed since the last frame."""
+        with self._lock:
+            if self._dirty or self._panel is None:
+                self._panel = self.progress.render()
+                self._dirty = False
+            return self._panel
+    
     def update(self) -> None:
-        """Refresh the display."""
-        if self._live:
-            self._live.update(self.progress.render())
+        """Mark the display stale; it is redrawn on the next frame."""
+        self._dirty = True
     
     def advance_stage(self) -> None:
         """Move to next stage and refresh."""
-        self.progress.advance_stage()
-        self.update()
+        with self._lock:
+            self.progress.advance_stage()
+            self._dirty = True
     
     def add_item(self, name: str, status: ItemStatus = "active") -> None:
         """Add item and refresh."""
-        self.progress.add_item(name, status)
-        self.update()
+        with self._lock:
+            self.progress.add_item(name, status)
+            self._dirty = True
     
     def update_item(self, name: str, status: ItemStatus) -> None:
         """Update item and refresh."""
-        self.progress.update_item(name, status)
-        self.update()
+        with self._lock:
+            self.progress.update_item(name, status)
+            self._dirty = True
@@ -1,12 +1,25 @@
 """Pytest configuration and shared fixtures for Weave tests."""
 
+import copy
 import json
+from functools import cache
 from pathlib import Path
 from typing import Any
 import pytest
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
+# Patch targets for the external-tool mocks
+YT_DLP_TARGET = "subprocess.run"
+OLLAMA_TARGET = "wve.synthesize.ollama_generate"
+
+
+@cache
+def _load_json_fixture(name: str) -> Any:
+    """Parse a JSON fixture once per session; callers get copies."""
+    with open(FIXTURES_DIR / name, "rb") as f:
+        return json.load(f)
+
 
 @pytest.fixture
 def fixtures_dir() -> Path:
@@ -14,13 +27,13 @@ def fixtures_dir() -> Path:
     return FIXTURES_DIR
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_transcript() -> str:
     """Load sample transcript text."""
     return (FIXTURES_DIR / "sample_transcript.txt").read_text()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_transcript_noisy() -> str:
     """Load noisy sample transcript (encoding issues, repetition)."""
     return (FIXTURES_DIR / "sample_transcript_noisy.txt").read_text()
@@ -54,13 +67,13 @@ def sample_video_metadata() -> list[dict[str, Any]]:
 @pytest.fixture
 def sample_extraction() -> dict[str, Any]:
     """Load sample extraction results."""
-    return json.loads((FIXTURES_DIR / "sample_extraction.json").read_text())
+    return copy.deepcopy(_load_json_fixture("sample_extraction.json"))
 
 
 @pytest.fixture
 def sample_clusters() -> dict[str, Any]:
     """Load sample cluster results."""
-    return json.loads((FIXTURES_DIR / "sample_clusters.json").read_text())
+    return copy.deepcopy(_load_json_fixture("sample_clusters.json"))
 
 
 @pytest.fixture
@@ -94,14 +107,14 @@ def tmp_cache_dir(tmp_path: Path) -> Path:
 @pytest.fixture
 def mock_yt_dlp(mocker):
     """Mock yt-dlp subprocess calls."""
-    mock = mocker.patch("subprocess.run")
+    mock = mocker.patch(YT_DLP_TARGET)
     return mock
 
 
 @pytest.fixture
 def mock_ollama(mocker):
     """Mock Ollama client."""
-    mock = mocker.patch("wve.synthesize.ollama_generate")
+    mock = mocker.patch(OLLAMA_TARGET)
     mock.return_value = {
         "worldview_points": [
             {
@@ -0,0 +1,123 @@
+"""Tests for the LLM prompt cache."""
+
+import numpy as np
+import pytest
+
+from wve.cache import PromptCache
+
+
+class FakeEmbedder:
+    """Bag-of-letters embedding: prompts with similar letters are similar."""
+
+    def encode(self, texts, normalize_embeddings=True):
+        vectors = []
+        for text in texts:
+            v = np.zeros(26, dtype=np.float32)
+            for ch in text.lower():
+                if "a" <= ch <= "z":
+                    v[ord(ch) - 97] += 1
+            vectors.append(v / (np.linalg.norm(v) or 1))
+        return np.array(vectors)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr("wve.cache._prompt_embedder", lambda name: FakeEmbedder())
+    return PromptCache(path=tmp_path / "prompts.sqlite", semantic=True)
+
+
+class TestPromptCache:
+    def test_exact_hit(self, cache):
+        cache.put("what does alice believe", "llama3", {"answer": 1})
+        assert cache.get("what does alice believe", "llama3") == {"answer": 1}
+
+    def test_keyed_by_model(self, cache):
+        cache.put("prompt", "llama3", {"answer": 1})
+        assert cache.get("prompt", "mistral") is None
+
+    def test_semantic_hit_on_small_edit(self, cache):
+        cache.put("what does alice believe about money and the state", "llama3", {"answer": 1})
+        assert cache.get("what does alice believe about money and the states", "llama3") == {"answer": 1}
+        assert cache.get("zzz qqq", "llama3") is None
+
+    def test_exact_only(self, tmp_path):
+        cache = PromptCache(path=tmp_path / "prompts.sqlite", semantic=False)
+        cache.put("what does alice believe", "llama3", {"answer": 1})
+        assert cache.get("what does alice believe?", "llama3") is None
+
+    def test_params_must_match(self, cache):
+        cache.put("what does alice believe", "llama3", {"answer": 5}, n_points=5)
+        assert cache.get("what does alice believe", "llama3", n_points=10) is None
+        assert cache.get("what does alice believe", "llama3", n_points=5) == {"answer": 5}
+        assert cache.get("what does alice believe", "llama3", n_points=5, schema={"type": "object"}) is None
+
+    def test_drops_entries_without_params(self, tmp_path):
+        import sqlite3
+
+        path = tmp_path / "prompts.sqlite"
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE prompts (model, prompt_hash, embedding, response, created_at)")
+        cache = PromptCache(path=path)
+        cache.put("prompt", "llama3", {"answer": 1})
+        assert cache.get("prompt", "llama3") == {"answer": 1}
+
+    def test_clear_by_model(self, cache):
+        cache.put("prompt", "llama3", {"answer": 1})
+        cache.put("prompt", "mistral", {"answer": 2})
+        assert cache.clear("llama3") == 1
+        assert cache.get("prompt", "llama3") is None
+        assert cache.get("prompt", "mistral") == {"answer": 2}
+
+    def test_ollama_generate_uses_cache(self, tmp_path, monkeypatch, mocker):
+        from wve.synthesize import ollama_generate
+
+        monkeypatch.setenv("WVE_CACHE_DIR", str(tmp_path))
+        monkeypatch.setenv("WVE_PROMPT_CACHE", "exact")
+        client = mocker.Mock()
+        client.generate.return_value = {"response": '{"worldview_points": []}'}
+        mocker.patch("wve.synthesize.get_ollama_client", return_value=client)
+
+        assert ollama_generate("prompt") == {"worldview_points": []}
+        assert ollama_generate("prompt") == {"worldview_points": []}
+        client.generate.assert_called_once()
+
+    def test_exact_by_default(self, tmp_path, monkeypatch):
+        from wve.cache import prompt_cache_mode
+
+        monkeypatch.delenv("WVE_PROMPT_CACHE", raising=False)
+        assert prompt_cache_mode() == "exact"
+        assert not PromptCache(path=tmp_path / "prompts.sqlite").semantic
+
+    def test_semantic_hit_requires_same_n_points(self, tmp_path, monkeypatch, mocker):
+        """Prompts differing only in n_points embed alike but must not share answers."""
+        from wve.synthesize import ollama_generate
+
+        monkeypatch.setenv("WVE_CACHE_DIR", str(tmp_path))
+        monkeypatch.setenv("WVE_PROMPT_CACHE", "semantic")
+        monkeypatch.setattr("wve.cache._prompt_embedder", lambda name: FakeEmbedder())
+        client = mocker.Mock()
+        client.generate.side_effect = [
+            {"response": '{"worldview_points": [1, 2, 3, 4, 5]}'},
+            {"response": '{"worldview_points": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]}'},
+        ]
+        mocker.patch("wve.synthesize.get_ollama_client", return_value=client)
+
+        assert len(ollama_generate("identify 5 points", n_points=5)["worldview_points"]) == 5
+        assert len(ollama_generate("identify 10 points", n_points=10)["worldview_points"]) == 10
+        assert client.generate.call_count == 2
+
+    def test_cache_errors_do_not_fail_generate(self, tmp_path, monkeypatch, mocker):
+        from wve.synthesize import ollama_generate
+
+        def broken_embedder(name):
+            raise OSError("couldn't connect to huggingface.co")
+
+        monkeypatch.setenv("WVE_CACHE_DIR", str(tmp_path))
+        monkeypatch.setenv("WVE_PROMPT_CACHE", "semantic")
+        monkeypatch.setattr("wve.cache._prompt_embedder", broken_embedder)
+        client = mocker.Mock()
+        client.generate.return_value = {"response": '{"worldview_points": []}'}
+        mocker.patch("wve.synthesize.get_ollama_client", return_value=client)
+
+        assert ollama_generate("prompt") == {"worldview_points": []}
+        assert ollama_generate("prompt") == {"worldview_points": []}
@@ -2,6 +2,7 @@
 
 import json
 from datetime import datetime
+from functools import cache
 
 import pytest
 from click.testing import CliRunner
@@ -9,6 +10,7 @@ from click.testing import CliRunner
 from wve.classify import (
     CandidateSet,
     VideoCandidate,
+    candidates_from_videos,
     classify_candidate,
     classify_candidates,
     update_identity_from_feedback,
@@ -16,6 +18,15 @@ from wve.classify import (
 from wve.cli import main
 from wve.identity import Channel, Identity
 
+# Fixed publish date for candidates whose date does not matter
+_NOW = datetime(2024, 6, 1)
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """CliRunner shared by the CLI tests; invoke() keeps no state between calls."""
+    return CliRunner()
+
 
 @pytest.fixture
 def sample_candidate():
@@ -60,7 +71,7 @@ class TestVideoCandidateModel:
             channel_id="UC123",
             duration_seconds=600,
             url="https://example.com",
-            published=datetime.now(),
+            published=_NOW,
             classification="likely",
             classification_reason="test reason",
             confidence=0.9,
@@ -69,6 +80,27 @@ class TestVideoCandidateModel:
         assert c.confidence == 0.9
 
 
+    def test_from_videos(self):
+        from wve.models import VideoMetadata
+
+        videos = [
+            VideoMetadata(
+                id=f"v{i}",
+                title=f"Video {i}",
+                channel="Chan",
+                channel_id="UC123",
+                duration_seconds=600 + i,
+                url=f"https://example.com/{i}",
+                published=datetime(2024, 1, i + 1),
+            )
+            for i in range(3)
+        ]
+        candidates = candidates_from_videos(videos)
+
+        assert candidates == [VideoCandidate(**v.model_dump()) for v in videos]
+        assert candidates[0].model_fields_set == VideoCandidate(**videos[0].model_dump()).model_fields_set
+
+
 class TestCandidateSetModel:
     def test_create(self, sample_candidate):
         cs = CandidateSet(
@@ -79,6 +111,22 @@ class TestCandidateSetModel:
         assert cs.query == "Skinner Layne"
         assert len(cs.candidates) == 1
 
+    def test_cli_json_matches_pydantic(self, sample_candidate):
+        from wve.cli import _model_json
+
+        sample_candidate.title = "Zoë – Interview"
+        sample_candidate.confidence = 0.85
+        cs = CandidateSet(query="Zoë", candidates=[sample_candidate])
+        assert _model_json(cs) == cs.model_dump_json(indent=2).encode()
+
+    def test_cli_json_matches_json_dumps(self):
+        from pathlib import Path
+
+        from wve.cli import _json_bytes
+
+        data = {"when": datetime(2024, 1, 2, 3, 4), "path": Path("a/b"), 3: "Zoë", "scores": [0.1, 2]}
+        assert json.loads(_json_bytes(data)) == json.loads(json.dumps(data, indent=2, default=str))
+
 
 class TestClassifyCandidate:
     def test_full_name_in_title(self):
@@ -89,7 +137,7 @@ class TestClassifyCandidate:
             channel_id="UC123",
             duration_seconds=600,
             url="https://example.com",
-            published=datetime.now(),
+            published=_NOW,
         )
         classification, reason, confidence = classify_candidate(c, "Skinner Layne")
         assert classification == "likely"
@@ -104,7 +152,7 @@ class TestClassifyCandidate:
             channel_id="UC123",
             duration_seconds=600,
             url="https://example.com",
-            published=datetime.now(),
+            published=_NOW,
         )
         classification, reason, confidence = classify_candidate(c, "Skinner Layne")
         assert classification == "likely"
@@ -118,7 +166,7 @@ class TestClassifyCandidate:
             channel_id="UC123",
             duration_seconds=600,
             url="https://example.com",
-            published=datetime.now(),
+            published=_NOW,
         )
         classification, reason, confidence = classify_candidate(c, "Skinner Layne")
         assert classification == "uncertain"
@@ -132,7 +180,7 @@ class TestClassifyCandidate:
             channel_id="UC123",
             duration_seconds=300,
             url="https://example.com",
-            published=datetime.now(),
+            published=_NOW,
         )
         classification, reason, confidence = classify_candidate(c, "Skinner Layne")
         assert classification == "false_positive"
@@ -146,7 +194,7 @@ class TestClassifyCandidate:
             channel_id="UC123",
             duration_seconds=600,
             url="https://example.com",
-            published=datetime.now(),
+            published=_NOW,
         )
         classification, reason, confidence = classify_candidate(c, "Skinner Layne")
         assert classification == "false_positive"
@@ -160,7 +208,7 @@ class TestClassifyCandidate:
             channel_id="UC123",
             duration_seconds=3600,
             url="https://example.com",
-            published=datetime.now(),
+            published=_NOW,
         )
         classification, reason, confidence = classify_candidate(c, "Skinner Layne")
         assert classification == "uncertain"
@@ -176,7 +224,7 @@ class TestClassifyWithIdentity:
             channel_id="exikiex",
             duration_seconds=600,
             url="https://example.com",
-            published=datetime.now(),
+            published=_NOW,
         )
         classification, reason, confidence = classify_candidate(
             c, "Skinner Layne", sample_identity
@@ -193,7 +241,7 @@ class TestClassifyWithIdentity:
             channel_id="UC_trusted",
             duration_seconds=600,
             url="https://example.com",
-            published=datetime.now(),
+            published=_NOW,
         )
         classification, reason, confidence = classify_candidate(
             c, "Skinner Layne", sample_identity
@@ -209,7 +257,7 @@ class TestClassifyWithIdentity:
             channel_id="UC123",
             duration_seconds=600,
             url="https://example.com",
-            published=datetime.now(),
+            published=_NOW,
         )
         classification, reason, confidence = classify_candidate(
             c, "Skinner Layne", sample_identity
@@ -226,7 +274,7 @@ class TestClassifyWithIdentity:
             channel_id="UC123",
             duration_seconds=600,
             url="https://example.com",
-            published=datetime.now(),
+            published=_NOW,
         )
         classification, reason, confidence = classify_candidate(
             c, "Skinner Layne", sample_identity
@@ -242,7 +290,7 @@ class TestClassifyWithIdentity:
             channel_id="UC123",
             duration_seconds=300,
             url="https://example.com",
-            published=datetime.now(),
+            published=_NOW,
         )
         classification, reason, confidence = classify_candidate(
             c, "Skinner Layne", sample_identity
@@ -250,6 +298,44 @@ class TestClassifyWithIdentity:
         assert classification == "false_positive"
         assert "suspicious pattern" in reason or "cover" in reason.lower()
 
+    def test_suspicious_pattern_reports_first_listed(self, sample_identity):
+        """The reason names the earliest pattern in the list, not in the title."""
+        sample_identity.suspicious_patterns = ["Tribute", "reaction", "cover"]
+        c = VideoCandidate(
+            id="test",
+            title="Cover of a reaction",
+            channel="Music",
+            channel_id="UC123",
+            duration_seconds=300,
+            url="https://example.com",
+            published=_NOW,
+        )
+        _, reason, _ = classify_candidate(c, "Skinner Layne", sample_identity)
+        assert reason == "matches suspicious pattern: reaction"
+
+
+    def test_title_cache_does_not_leak_identity_state(self, sample_identity):
+        """Repeated titles hit the cache; ID-based decisions are still per call."""
+        from wve.classify import _classify_title
+
+        c = VideoCandidate(
+            id="rejected1",
+            title="Skinner Layne on Education",
+            channel="Podcast",
+            channel_id="UC123",
+            duration_seconds=600,
+            url="https://example.com",
+            published=_NOW,
+        )
+        assert classify_candidate(c, "Skinner Layne")[1] == "full name in title"
+        hits = _classify_title.cache_info().hits
+        assert classify_candidate(c, "Skinner Layne")[1] == "full name in title"
+        assert _classify_title.cache_info().hits == hits + 1
+        info = _classify_title.cache_info()
+        assert classify_candidate(c, "Skinner Layne", sample_identity)[1] == "previously rejected"
+        assert _classify_title.cache_info() == info  # Decided before any title work
+        assert classify_candidate(c, "Layne Staley")[0] == "uncertain"
+
 
 class TestClassifyCandidates:
     def test_bulk_classify(self):
@@ -261,7 +347,7 @@ class TestClassifyCandidates:
                 channel_id="UC1",
                 duration_seconds=600,
                 url="https://example.com/1",
-                published=datetime.now(),
+                published=_NOW,
             ),
             VideoCandidate(
                 id="2",
@@ -270,7 +356,7 @@ class TestClassifyCandidates:
                 channel_id="UC2",
                 duration_seconds=600,
                 url="https://example.com/2",
-                published=datetime.now(),
+                published=_NOW,
             ),
         ]
 
@@ -279,6 +365,60 @@ class TestClassifyCandidates:
         assert candidates[0].classification == "likely"
         assert candidates[1].classification == "false_positive"
 
+    def test_bulk_matches_single_with_identity(self, sample_identity):
+        candidates = [
+            VideoCandidate(
+                id=video_id,
+                title=title,
+                channel="Chan",
+                channel_id=channel_id,
+                duration_seconds=600,
+                url="https://example.com",
+                published=_NOW,
+            )
+            for video_id, title, channel_id in [
+                ("confirmed1", "Whatever", "UC1"),
+                ("rejected1", "Skinner Layne Interview", "UC1"),
+                ("new1", "Anything", "UC_trusted"),
+                ("new2", "Skinner Layne reaction", "UC1"),
+                ("new3", "Skinner Layne Interview", "exikiex"),
+            ]
+        ]
+        expected = [classify_candidate(c, "Skinner Layne", sample_identity) for c in candidates]
+
+        classify_candidates(candidates, "Skinner Layne", sample_identity)
+
+        assert [
+            (c.classification, c.classification_reason, c.confidence) for c in candidates
+        ] == expected
+
+
+class TestMultiIdentityClassifier:
+    def test_matches_per_subject_classification(self, sample_identity):
+        from wve.classify import MultiIdentityClassifier
+
+        subjects = [(sample_identity, "Skinner Layne"), (None, "Layne Staley"), (None, "Test Person")]
+        classifier = MultiIdentityClassifier(subjects)
+        titles = [
+            "Skinner Layne on Education",
+            "Layne Staley Cover - Best Tribute",
+            "Podcast Episode #45: Layne discusses startups",
+            "Test Person reaction video",
+            "Completely unrelated video about cooking",
+        ]
+        for i, title in enumerate(titles):
+            c = VideoCandidate(
+                id="rejected1" if i == 3 else f"v{i}",
+                title=title,
+                channel="Podcast",
+                channel_id="UC123",
+                duration_seconds=600,
+                url="https://example.com",
+                published=_NOW,
+            )
+            expected = [classify_candidate(c, query, identity) for identity, query in subjects]
+            assert classifier.classify(c) == expected
+
 
 class TestUpdateIdentityFromFeedback:
     def test_confirm_adds_to_confirmed(self, sample_identity):
@@ -289,7 +429,7 @@ class TestUpdateIdentityFromFeedback:
             channel_id="UC123",
             duration_seconds=600,
             url="https://example.com",
-            published=datetime.now(),
+            published=_NOW,
         )
         update_identity_from_feedback(sample_identity, c, confirmed=True)
         assert "new_video" in sample_identity.confirmed_videos
@@ -302,7 +442,7 @@ class TestUpdateIdentityFromFeedback:
             channel_id="UC123",
             duration_seconds=600,
             url="https://example.com",
-            published=datetime.now(),
+            published=_NOW,
         )
         update_identity_from_feedback(sample_identity, c, confirmed=False)
         assert "new_video" in sample_identity.rejected_videos
@@ -315,7 +455,7 @@ class TestUpdateIdentityFromFeedback:
             channel_id="UC123",
             duration_seconds=600,
             url="https://example.com",
-            published=datetime.now(),
+            published=_NOW,
         )
         assert "rejected1" in sample_identity.rejected_videos
         update_identity_from_feedback(sample_identity, c, confirmed=True)
@@ -324,10 +464,6 @@ class TestUpdateIdentityFromFeedback:
 
 
 class TestDiscoverCLI:
-    @pytest.fixture
-    def runner(self):
-        return CliRunner()
-
     @pytest.fixture
     def mock_search(self, mocker):
         """Mock search_videos to avoid network calls."""
@@ -405,59 +541,58 @@ class TestDiscoverCLI:
         assert data["candidates"][0]["id"] == "vid1"
 
 
-class TestConfirmCLI:
-    @pytest.fixture
-    def runner(self):
-        return CliRunner()
+@cache
+def _candidates_json() -> str:
+    """Serialised candidate set shared by the confirm tests."""
+    return CandidateSet(
+        query="Test Person",
+        candidates=[
+            VideoCandidate(
+                id="vid1",
+                title="Interview with Test Person",
+                channel="Podcast",
+                channel_id="UC1",
+                duration_seconds=1800,
+                url="https://youtube.com/watch?v=vid1",
+                published=datetime(2024, 1, 1),
+                classification="likely",
+                classification_reason="full name in title",
+                confidence=0.85,
+            ),
+            VideoCandidate(
+                id="vid2",
+                title="Test Song Cover",
+                channel="Music",
+                channel_id="UC2",
+                duration_seconds=300,
+                url="https://youtube.com/watch?v=vid2",
+                published=datetime(2024, 1, 2),
+                classification="false_positive",
+                classification_reason="entertainment content",
+                confidence=0.8,
+            ),
+            VideoCandidate(
+                id="vid3",
+                title="Maybe Test Person",
+                channel="Unknown",
+                channel_id="UC3",
+                duration_seconds=600,
+                url="https://youtube.com/watch?v=vid3",
+                published=datetime(2024, 1, 3),
+                classification="uncertain",
+                classification_reason="partial match",
+                confidence=0.5,
+            ),
+        ],
+    ).model_dump_json(indent=2)
 
+
+class TestConfirmCLI:
     @pytest.fixture
     def candidates_file(self, tmp_path):
         """Create a candidates.json file for testing."""
-        from wve.classify import CandidateSet, VideoCandidate
-
-        candidates = CandidateSet(
-            query="Test Person",
-            candidates=[
-                VideoCandidate(
-                    id="vid1",
-                    title="Interview with Test Person",
-                    channel="Podcast",
-                    channel_id="UC1",
-                    duration_seconds=1800,
-                    url="https://youtube.com/watch?v=vid1",
-                    published=datetime(2024, 1, 1),
-                    classification="likely",
-                    classification_reason="full name in title",
-                    confidence=0.85,
-                ),
-                VideoCandidate(
-                    id="vid2",
-                    title="Test Song Cover",
-                    channel="Music",
-                    channel_id="UC2",
-                    duration_seconds=300,
-                    url="https://youtube.com/watch?v=vid2",
-                    published=datetime(2024, 1, 2),
-                    classification="false_positive",
-                    classification_reason="entertainment content",
-                    confidence=0.8,
-                ),
-                VideoCandidate(
-                    id="vid3",
-                    title="Maybe Test Person",
-                    channel="Unknown",
-                    channel_id="UC3",
-                    duration_seconds=600,
-                    url="https://youtube.com/watch?v=vid3",
-                    published=datetime(2024, 1, 3),
-                    classification="uncertain",
-                    classification_reason="partial match",
-                    confidence=0.5,
-                ),
-            ],
-        )
         path = tmp_path / "candidates.json"
-        path.write_text(candidates.model_dump_json(indent=2))
+        path.write_text(_candidates_json())
         return path
 
     def test_confirm_batch_accept(self, runner, candidates_file):
@@ -508,6 +643,23 @@ class TestConfirmCLI:
         data = json.loads(result.output)
         assert data["count"]["confirmed"] == 3
 
+    def test_parse_selection(self):
+        import click
+
+        from wve.cli import _parse_selection
+
+        assert _parse_selection("1,3", "--accept") == {1, 3}
+        assert _parse_selection("2", "--accept") == {2}
+        assert _parse_selection(" 1 - 3 , 7", "--accept") == {1, 2, 3, 7}
+        assert _parse_selection(None, "--accept") == set()
+        with pytest.raises(click.BadParameter):
+            _parse_selection("1,x", "--accept")
+
+    def test_confirm_bad_selection(self, runner, candidates_file):
+        result = runner.invoke(main, ["confirm", str(candidates_file), "--accept", "1-", "--json"])
+        assert result.exit_code == 2
+        assert "--accept" in result.output
+
     def test_confirm_updates_identity(self, runner, candidates_file, tmp_path, monkeypatch):
         """Test that confirmations update the identity."""
         from wve.identity import create_identity, load_identity
@@ -537,43 +689,42 @@ class TestConfirmCLI:
         assert "vid2" in identity.rejected_videos
 
 
-class TestFetchCLI:
-    @pytest.fixture
-    def runner(self):
-        return CliRunner()
+@cache
+def _confirmed_json() -> str:
+    """Serialised confirmed set shared by the fetch tests."""
+    return CandidateSet(
+        query="Test Person",
+        candidates=[
+            VideoCandidate(
+                id="vid1",
+                title="Interview with Test Person",
+                channel="Podcast",
+                channel_id="UC1",
+                duration_seconds=1800,
+                url="https://youtube.com/watch?v=vid1",
+                published=datetime(2024, 1, 1),
+                confirmed=True,
+            ),
+            VideoCandidate(
+                id="vid2",
+                title="Another Video",
+                channel="Channel",
+                channel_id="UC2",
+                duration_seconds=600,
+                url="https://youtube.com/watch?v=vid2",
+                published=datetime(2024, 1, 2),
+                confirmed=True,
+            ),
+        ],
+    ).model_dump_json(indent=2)
 
+
+class TestFetchCLI:
     @pytest.fixture
     def confirmed_file(self, tmp_path):
         """Create a confirmed.json file for testing."""
-        from wve.classify import CandidateSet, VideoCandidate
-
-        candidates = CandidateSet(
-            query="Test Person",
-            candidates=[
-                VideoCandidate(
-                    id="vid1",
-                    title="Interview with Test Person",
-                    channel="Podcast",
-                    channel_id="UC1",
-                    duration_seconds=1800,
-                    url="https://youtube.com/watch?v=vid1",
-                    published=datetime(2024, 1, 1),
-                    confirmed=True,
-                ),
-                VideoCandidate(
-                    id="vid2",
-                    title="Another Video",
-                    channel="Channel",
-                    channel_id="UC2",
-                    duration_seconds=600,
-                    url="https://youtube.com/watch?v=vid2",
-                    published=datetime(2024, 1, 2),
-                    confirmed=True,
-                ),
-            ],
-        )
         path = tmp_path / "confirmed.json"
-        path.write_text(candidates.model_dump_json(indent=2))
+        path.write_text(_confirmed_json())
         return path
 
     @pytest.fixture
@@ -621,16 +772,71 @@ class TestFetchCLI:
         data = json.loads(result.output)
         assert data["fetched"] == 2
 
+    def test_fetch_concurrent_keeps_order(self, runner, confirmed_file, mocker, tmp_path):
+        """Downloads overlap, but results are reported in input order."""
+        import threading
+
+        both_started = threading.Barrier(2, timeout=5)
+
+        def slow_download(url, output_dir, lang="en"):
+            both_started.wait()  # Deadlocks unless the two run concurrently
+            vid_id = url.rsplit("=", 1)[1]
+            if vid_id == "vid2":
+                return None
+            path = output_dir / f"{vid_id}.txt"
+            path.write_text(f"Transcript for {vid_id}")
+            return path
+
+        mocker.patch("wve.transcripts.download_transcript", side_effect=slow_download)
+        output_dir = tmp_path / "transcripts"
+        result = runner.invoke(
+            main, ["fetch", str(confirmed_file), "-o", str(output_dir), "--workers", "2", "--json"]
+        )
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert [t["id"] for t in data["transcripts"]] == ["vid1"]
+        assert data["failed"] == 1
+
+    def test_fetch_skips_existing(self, runner, confirmed_file, mock_download, tmp_path):
+        """Transcripts already on disk are reused unless --force is given."""
+        output_dir = tmp_path / "transcripts"
+        output_dir.mkdir()
+        (output_dir / "vid1.txt").write_text("Earlier transcript")
+
+        result = runner.invoke(main, ["fetch", str(confirmed_file), "-o", str(output_dir), "--json"])
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert [t["id"] for t in data["transcripts"]] == ["vid1", "vid2"]
+        assert data["skipped"] == 1
+        assert data["fetched"] == 1
+        assert mock_download.call_count == 1
+
+        result = runner.invoke(
+            main, ["fetch", str(confirmed_file), "-o", str(output_dir), "--force", "--json"]
+        )
+        assert json.loads(result.output)["skipped"] == 0
+        assert mock_download.call_count == 3
+
+    def test_fetch_dedupes_repeated_ids(self, runner, confirmed_file, mock_download, tmp_path):
+        """A video listed twice is downloaded once."""
+        candidate_set = CandidateSet.model_validate_json(confirmed_file.read_text())
+        candidate_set.candidates.append(candidate_set.candidates[0].model_copy())
+        confirmed_file.write_text(candidate_set.model_dump_json())
+
+        result = runner.invoke(
+            main, ["fetch", str(confirmed_file), "-o", str(tmp_path / "transcripts"), "--json"]
+        )
+        data = json.loads(result.output)
+        assert [t["id"] for t in data["transcripts"]] == ["vid1", "vid2"]
+        assert data["fetched"] == 2
+        assert mock_download.call_count == 2
+
     def test_fetch_no_input(self, runner):
         result = runner.invoke(main, ["fetch", "--json"])
         assert result.exit_code == 1
 
 
 class TestFromUrlsCLI:
-    @pytest.fixture
-    def runner(self):
-        return CliRunner()
-
     @pytest.fixture
     def mock_download(self, mocker, tmp_path):
         """Mock download_transcript to avoid network calls."""
@@ -49,6 +49,45 @@ class TestKeywordExtraction:
         # TODO: Verify no crash on "hello"
         pass
 
+    def test_parallel_matches_serial(self, sample_transcript, sample_transcript_noisy):
+        """Process-pool YAKE aggregates to the same keywords as the serial path."""
+        from wve.extract import extract_keywords_yake
+
+        texts = [sample_transcript, sample_transcript_noisy] * 2
+        ids = ["a", "b", "c", "d"]
+        serial = extract_keywords_yake(texts, ids, top_n=20, parallel=False)
+        parallel = extract_keywords_yake(texts, ids, top_n=20, parallel=True)
+        assert [(k.term, k.score, sorted(k.sources)) for k in serial] == [
+            (k.term, k.score, sorted(k.sources)) for k in parallel
+        ]
+
+
+class TestBM25Keywords:
+    """Tests for the BM25 keyword backend."""
+
+    def test_ranks_distinctive_terms(self):
+        """Terms frequent in one document and rare elsewhere rank first."""
+        from wve.extract import extract_keywords_bm25
+
+        texts = [
+            "bitcoin bitcoin bitcoin money energy",
+            "gardening soil compost gardening money",
+            "money markets inflation money",
+        ]
+        keywords = extract_keywords_bm25(texts, ["a", "b", "c"], top_n=5)
+
+        assert keywords[0].term == "bitcoin"
+        assert keywords[0].sources == ["a"]
+        assert [k.score for k in keywords] == sorted((k.score for k in keywords), reverse=True)
+
+    def test_extract_all_backend(self, sample_transcript):
+        from wve.extract import extract_all
+
+        extraction = extract_all([sample_transcript], ["a"], top_n=10, skip_ner=True, keyword_backend="bm25")
+        assert len(extraction.keywords) == 10
+        with pytest.raises(ValueError):
+            extract_all([sample_transcript], keyword_backend="nope")
+
 
 class TestEntityExtraction:
     """Tests for spaCy NER."""
@@ -94,6 +133,73 @@ class TestEntityExtraction:
         pass
 
 
+class TestEntityDocCache:
+    """Tests for the on-disk spaCy Doc cache."""
+
+    @pytest.fixture
+    def ruler_model(self, tmp_path):
+        """Tiny spaCy pipeline that tags a fixed set of entities."""
+        spacy = pytest.importorskip("spacy")
+        nlp = spacy.blank("en")
+        ruler = nlp.add_pipe("entity_ruler")
+        ruler.add_patterns([
+            {"label": "GPE", "pattern": "Venice"},
+            {"label": "PERSON", "pattern": "Stalin"},
+        ])
+        model_dir = tmp_path / "ruler_model"
+        nlp.to_disk(model_dir)
+        return str(model_dir)
+
+    def test_cache_roundtrip(self, ruler_model, tmp_path, monkeypatch):
+        """Cached Docs yield the same entities as a fresh run."""
+        from wve.extract import extract_entities_spacy, get_spacy_cache_dir
+
+        monkeypatch.setenv("WVE_CACHE_DIR", str(tmp_path / "cache"))
+        texts = ["Venice traded with Venice.", "Stalin never visited Venice."]
+
+        first = extract_entities_spacy(texts, ["a", "b"], model=ruler_model)
+        assert len(list(get_spacy_cache_dir(ruler_model).glob("*.docbin"))) == 2
+
+        second = extract_entities_spacy(texts, ["a", "b"], model=ruler_model)
+        assert second == first
+        assert second["GPE"][0].text == "Venice"
+        assert second["GPE"][0].frequency == 3
+
+    def test_cache_disabled(self, ruler_model, tmp_path, monkeypatch):
+        """use_cache=False writes nothing to disk."""
+        from wve.extract import extract_entities_spacy, get_spacy_cache_dir
+
+        monkeypatch.setenv("WVE_CACHE_DIR", str(tmp_path / "cache"))
+        extract_entities_spacy(["Stalin"], ["a"], model=ruler_model, use_cache=False)
+        assert not get_spacy_cache_dir(ruler_model).exists()
+
+    def test_cache_write_failure(self, ruler_model, tmp_path, monkeypatch):
+        """An unwritable cache location still returns entities."""
+        from wve.extract import extract_entities_spacy
+
+        blocker = tmp_path / "cache"
+        blocker.write_text("not a directory")
+        monkeypatch.setenv("WVE_CACHE_DIR", str(blocker))
+        entities = extract_entities_spacy(["Stalin"], ["a"], model=ruler_model)
+        assert entities["PERSON"][0].text == "Stalin"
+
+    def test_cache_expires(self, ruler_model, tmp_path, monkeypatch):
+        """DocBins older than the TTL are reprocessed and cleared with the cache."""
+        import os
+
+        from wve.cache import clear_cache
+        from wve.extract import extract_entities_spacy, get_spacy_cache_dir
+
+        monkeypatch.setenv("WVE_CACHE_DIR", str(tmp_path / "cache"))
+        extract_entities_spacy(["Stalin"], ["a"], model=ruler_model)
+        (path,) = get_spacy_cache_dir(ruler_model).glob("*.docbin")
+        os.utime(path, (0, 0))
+
+        extract_entities_spacy(["Stalin"], ["a"], model=ruler_model)
+        assert path.stat().st_mtime > 0  # Rewritten
+        assert clear_cache() == 1
+
+
 class TestPhraseExtraction:
     """Tests for n-gram phrase extraction."""
 
@@ -112,6 +218,21 @@ class TestPhraseExtraction:
         # TODO: Verify sort order
         pass
 
+    def test_counts_and_sources(self):
+        """Phrase counts aggregate across texts and record each source once."""
+        from wve.extract import extract_phrases
+
+        texts = ["the nation state is the nation state", "a nation state again"]
+        phrases = extract_phrases(texts, ["v1", "v2"], n_range=(2, 3))
+        by_phrase = {p.phrase: p for p in phrases}
+
+        assert phrases[0].phrase == "nation state"
+        assert by_phrase["nation state"].count == 3
+        assert sorted(by_phrase["nation state"].sources) == ["v1", "v2"]
+        assert by_phrase["the nation state"].count == 2
+        assert by_phrase["the nation state"].sources == ["v1"]
+        assert "state again" not in by_phrase  # Singletons are dropped
+
 
 class TestTfIdf:
     """Tests for TF-IDF extraction."""
@@ -124,6 +245,31 @@ class TestTfIdf:
         # TODO: Verify TF-IDF distinguishes document-specific terms
         pass
 
+    def test_matches_sklearn_on_non_ascii_and_numbers(self):
+        """Accented, numeric and alphanumeric terms are kept as TfidfVectorizer keeps them."""
+        import numpy as np
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from wve.extract import extract_phrases, extract_tfidf
+
+        texts = [
+            "The café opened in 2024 and python3 code ran. Café culture shaped 2024 politics.",
+            "Python3 scripts track covid19 data since 2020; the café owner talks politics.",
+            "Nothing here but naïve déjà vu and policy talk about café prices.",
+        ]
+        vectorizer = TfidfVectorizer(stop_words="english", ngram_range=(1, 2), max_df=0.95)
+        sums = np.asarray(vectorizer.fit_transform(texts).sum(axis=0)).ravel()
+        expected = dict(zip(vectorizer.get_feature_names_out(), sums))
+
+        terms = {t.term: t.score for t in extract_tfidf(texts, top_n=len(expected))}
+        assert {"2024", "python3", "covid19", "naïve", "déjà vu"} <= terms.keys()
+        assert terms.keys() == expected.keys()
+        assert all(terms[t] == pytest.approx(expected[t], rel=1e-5) for t in terms)
+
+        # Word-based extractors keep accented words but not numbers
+        phrases = {p.phrase for p in extract_phrases(texts, ["a", "b", "c"], n_range=(1, 1))}
+        assert "café" in phrases
+        assert "2024" not in phrases
+
     def test_tfidf_removes_stopwords(self, sample_transcript):
         """TF-IDF excludes common stopwords."""
         # TODO: Verify "the", "a", "is" not in top results
@@ -145,6 +291,17 @@ class TestCoOccurrence:
         # TODO: Verify symmetry
         pass
 
+    def test_jit_matches_python(self, sample_transcript, sample_transcript_noisy):
+        """Numba kernel produces the same pairs, counts and order as the Python loop."""
+        pytest.importorskip("numba")
+        from wve.extract import extract_cooccurrences
+
+        texts = [sample_transcript, sample_transcript_noisy]
+        for window_size in (2, 5):
+            expected = extract_cooccurrences(texts, window_size=window_size, use_jit=False)
+            actual = extract_cooccurrences(texts, window_size=window_size, use_jit=True)
+            assert actual == expected
+
 
 class TestExtractionCombined:
     """Tests for combined extraction output."""
@@ -164,3 +321,30 @@ class TestExtractionCombined:
         """Extraction tracks source video for each term."""
         # TODO: Verify source tracking when multiple transcripts
         pass
+
+
+class TestLoadTranscripts:
+    """Tests for loading transcripts from disk."""
+
+    def test_directory_sorted(self, tmp_path):
+        from wve.extract import load_transcripts
+
+        for name in ["c", "a", "b"]:
+            (tmp_path / f"{name}.txt").write_text(f"text {name}")
+        texts, ids = load_transcripts(tmp_path)
+        assert ids == ["a", "b", "c"]
+        assert texts == ["text a", "text b", "text c"]
+
+    def test_manifest_skips_missing(self, tmp_path):
+        import json
+        from wve.extract import load_transcripts
+
+        (tmp_path / "v1.txt").write_text("one")
+        (tmp_path / "v3.txt").write_text("three")
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(json.dumps({"transcripts": {
+            "v1": str(tmp_path / "v1.txt"),
+            "v2": str(tmp_path / "v2.txt"),
+            "v3": str(tmp_path / "v3.txt"),
+        }}))
+        assert load_transcripts(manifest) == (["one", "three"], ["v1", "v3"])
@@ -0,0 +1,53 @@
+"""Tests for the fuzzy select prompt."""
+
+import random
+import string
+
+import pytest
+
+from wve.prompts.fuzzy_select import FuzzySelect, fuzzy_match
+
+
+def _names(n: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + "  -'é"
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 24))) for _ in range(n)]
+
+
+def _filtered(select: FuzzySelect, query: str) -> list[str]:
+    select.query = query
+    select._filter_items()
+    return [value for _, value in select.filtered_items]
+
+
+class TestFuzzySelectFilter:
+    def test_matches_subsequence(self):
+        assert fuzzy_match("wvx", "WorldView eXtractor")
+        assert not fuzzy_match("xw", "WorldView eXtractor")
+        assert fuzzy_match("", "anything")
+
+    @pytest.mark.parametrize("vectorize_min", [10_000, 0])
+    def test_filter_agrees_with_fuzzy_match(self, vectorize_min, monkeypatch):
+        """Typing, backspacing and pasting all give the brute-force result."""
+        monkeypatch.setattr("wve.prompts.fuzzy_select.VECTORIZE_MIN_ITEMS", vectorize_min)
+        names = _names(300)
+        select = FuzzySelect([(name, i) for i, name in enumerate(names)])
+        rng = random.Random(1)
+
+        query = ""
+        for _ in range(200):
+            action = rng.random()
+            if action < 0.6:
+                query += rng.choice("aeiourstlnAE -")
+            elif action < 0.85:
+                query = query[:-1]
+            else:
+                query = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(0, 3)))
+            expected = [i for i, name in enumerate(names) if fuzzy_match(query, name)]
+            assert _filtered(select, query) == expected
+
+    def test_set_items_refilters(self):
+        select = FuzzySelect([("Alice", "a"), ("Bob", "b")])
+        assert _filtered(select, "b") == ["b"]
+        select.set_items([("Bob", "b"), ("Barbara", "c")])
+        assert [value for _, value in select.filtered_items] == ["b", "c"]
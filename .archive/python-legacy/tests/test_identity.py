@@ -84,6 +84,14 @@ class TestExtractVideoId:
     def test_with_params(self):
         assert extract_video_id("https://www.youtube.com/watch?v=abc123&t=100") == "abc123"
 
+    def test_short_and_embed_with_params(self):
+        assert extract_video_id("https://youtu.be/abc123def?t=42") == "abc123def"
+        assert extract_video_id("https://youtube.com/embed/abc123def?start=5") == "abc123def"
+
+    def test_unrecognised_url(self):
+        url = "https://vimeo.com/12345"
+        assert extract_video_id(url) == url
+
 
 class TestIdentityModel:
     def test_create_minimal(self):
@@ -0,0 +1,61 @@
+"""Tests for multi-stage progress display."""
+
+import io
+
+from rich.console import Console
+
+from wve.ui.progress import ProgressContext, StageProgress
+
+
+def _console() -> Console:
+    return Console(file=io.StringIO(), force_terminal=True, width=80)
+
+
+class TestProgressContext:
+    def test_updates_are_coalesced(self, mocker):
+        """A burst of item updates renders once per frame, not once per call."""
+        progress = StageProgress(stages=["Download", "Extract"])
+        render = mocker.spy(progress, "render")
+
+        with ProgressContext(progress, console=_console()) as ctx:
+            for i in range(200):
+                ctx.add_item(f"video {i}")
+                ctx.update_item(f"video {i}", "done")
+
+        assert render.call_count < 10
+
+    def test_renders_latest_state(self):
+        progress = StageProgress(stages=["Download", "Extract"])
+        ctx = ProgressContext(progress, console=_console())
+
+        ctx.add_item("video 1")
+        first = ctx._renderable()
+        assert ctx._renderable() is first  # Nothing changed, reuse the panel
+        ctx.update_item("video 1", "done")
+        assert ctx._renderable() is not first
+
+
+class TestStageProgress:
+    def test_items_keep_order_and_latest_status(self):
+        progress = StageProgress(stages=["Download"], _max_visible_items=2)
+        for name in ["a", "b", "c"]:
+            progress.add_item(name)
+        progress.update_item("a", "done")
+        progress.update_item("d", "failed")
+        progress.add_item("d")
+
+        assert progress.sub_items == {"a": "done", "b": "pending", "c": "pending", "d": "failed"}
+        assert list(progress._recent) == ["c", "d"]
+
+        progress.advance_stage()
+        assert not progress.sub_items and not progress._recent
+
+    def test_row_cells_reused_until_state_changes(self):
+        progress = StageProgress(stages=["Download", "Extract"])
+        progress.add_item("a", "active")
+        assert progress._item_row("a", "active") is progress._item_row("a", "active")
+        assert progress._stage_row("Download", 0) is progress._stage_row("Download", 0)
+
+        progress.advance_stage()
+        assert not progress._item_rows
+        assert progress._stage_row("Download", -1)[1].plain == "Download"
@@ -29,6 +29,10 @@ class TestSplitSentences:
         sentences = split_sentences(text)
         assert "Hello world" in sentences[0]
 
+    def test_single_and_empty(self):
+        assert split_sentences("  Just one\nsentence.  ") == ["Just one sentence."]
+        assert split_sentences(" \n ") == []
+
 
 class TestScoreSentence:
     def test_opinion_starter(self):
@@ -51,6 +55,11 @@ class TestScoreSentence:
         score, _, _ = score_sentence("It was nice.")
         assert score < 0.3
 
+    def test_repeat_returns_fresh_reasons(self):
+        first = score_sentence("I think the truth is simple.")
+        first[1].append("mutated")
+        assert score_sentence("I think the truth is simple.") == (0.3, ["opinion_starter:i think"], False)
+
 
 class TestExtractQuotes:
     def test_basic(self):
@@ -104,6 +113,36 @@ class TestExtractQuotesFromDir:
         assert collection.source_count == 2
         assert len(collection.quotes) >= 2
 
+    def test_parallel_matches_serial(self, transcript_dir, monkeypatch):
+        """Process-pool scoring keeps the same quotes, in the same order."""
+        for i in range(3):
+            (transcript_dir / f"video{i + 3}.txt").write_text(
+                (transcript_dir / "video1.txt").read_text() + f" I think {i} people agree with this exactly."
+            )
+        monkeypatch.setattr("wve.quotes.QUOTES_PARALLEL_MIN_FILES", 2)
+        monkeypatch.setattr("wve.quotes.os.cpu_count", lambda: 2)
+
+        serial = extract_quotes_from_dir(transcript_dir, max_quotes=4, parallel=False)
+        parallel = extract_quotes_from_dir(transcript_dir, max_quotes=4, parallel=True)
+        assert parallel.source_count == serial.source_count == 5
+        assert [(q.source_id, q.text) for q in parallel.quotes] == [(q.source_id, q.text) for q in serial.quotes]
+
+    def test_ignores_other_files(self, transcript_dir):
+        (transcript_dir / "manifest.json").write_text("{}")
+        (transcript_dir / "video3.txt.part").write_text("I believe this half-written file is skipped entirely.")
+        (transcript_dir / "nested.txt").mkdir()
+        collection = extract_quotes_from_dir(transcript_dir)
+        assert collection.source_count == 2
+        assert {q.source_id for q in collection.quotes} <= {"video1", "video2"}
+
+    def test_lists_same_files_as_fingerprint(self, transcript_dir):
+        """Every file the cache fingerprint covers is scored, dotfiles included."""
+        from wve.cache import directory_fingerprint
+
+        (transcript_dir / ".hidden.txt").write_text("I believe hidden transcripts still count here.")
+        collection = extract_quotes_from_dir(transcript_dir)
+        assert collection.source_count == len(directory_fingerprint(transcript_dir)) == 3
+
 
 class TestQuotesCLI:
     @pytest.fixture
@@ -15,6 +15,12 @@ def runner():
     return CliRunner()
 
 
+@pytest.fixture(autouse=True)
+def temp_cache_dir(tmp_path, monkeypatch):
+    """Keep the quote cache written by run out of the user's cache directory."""
+    monkeypatch.setenv("WVE_CACHE_DIR", str(tmp_path / "cache"))
+
+
 @pytest.fixture
 def transcript_dir(tmp_path, sample_transcript):
     """Create a temp directory with sample transcripts."""
@@ -84,6 +90,23 @@ class TestRunInputClassification:
         assert result.exit_code == 0
         assert (output_dir / "transcripts" / "local.txt").exists()
 
+    def test_classify_input_kinds(self, transcript_dir, url_list_file, tmp_path):
+        """Each input kind is told apart with a single stat."""
+        from wve.cli import _classify_input
+
+        assert _classify_input("https://youtu.be/abc") == "url"
+        assert _classify_input(str(transcript_dir)) == "dir"
+        assert _classify_input(str(url_list_file)) == "url_list"
+        assert _classify_input(str(transcript_dir / "video1.txt")) == "file"
+        assert _classify_input(str(tmp_path / "nope.txt")) == "missing"
+
+    def test_url_list_parsing(self):
+        """Comments, blank lines and surrounding whitespace are dropped."""
+        from wve.cli import _URL_LINE_RE
+
+        text = "# header\n\n  https://youtu.be/a  \n#https://youtu.be/skip\nhttps://youtu.be/b\r\n"
+        assert _URL_LINE_RE.findall(text) == ["https://youtu.be/a", "https://youtu.be/b"]
+
 
 class TestRunReportOnly:
     """Tests for --report-only mode."""
@@ -119,6 +142,24 @@ class TestRunReportOnly:
         report = (tmp_path / "report.md").read_text()
         assert "## Themes" in report
 
+    def test_rerun_reuses_quotes(self, runner, transcript_dir, tmp_path, mocker):
+        """Regenerating a report skips quote extraction until a transcript changes."""
+        import wve.quotes
+
+        extract = mocker.spy(wve.quotes, "extract_quotes_from_dir")
+        args = ["run", str(transcript_dir), "-s", "Test", "-o", str(tmp_path), "--report-only"]
+        first = runner.invoke(main, args, catch_exceptions=False)
+        report = (tmp_path / "report.md").read_text()
+        wve.quotes.cached_quotes_from_dir.cache_clear()  # As in a fresh process
+
+        assert runner.invoke(main, args, catch_exceptions=False).exit_code == first.exit_code == 0
+        assert (tmp_path / "report.md").read_text() == report
+        assert extract.call_count == 1
+
+        (transcript_dir / "video3.txt").write_text("I believe this new transcript changes everything we know.")
+        runner.invoke(main, args, catch_exceptions=False)
+        assert extract.call_count == 2
+
 
 class TestRunJsonOutput:
     """Tests for --json output mode."""
@@ -182,6 +223,31 @@ class TestRunResume:
         # Should attempt download even with existing transcripts
         assert "Downloading" in result.output or "Failed" in result.output or result.exit_code != 0
 
+    def test_downloads_concurrently(self, runner, url_list_file, tmp_path, mocker):
+        """URL-list downloads overlap instead of running one after another."""
+        import threading
+
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_download(url, output_dir, lang):
+            barrier.wait()  # Only returns once all three downloads are in flight
+            path = Path(output_dir) / f"{url[-6:]}.txt"
+            path.write_text("text")
+            return path
+
+        mocker.patch("wve.transcripts.download_transcript", side_effect=fake_download)
+        output_dir = tmp_path / "output"
+        result = runner.invoke(
+            main,
+            ["run", str(url_list_file), "-s", "Test", "-o", str(output_dir), "--fetch-only"],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert "Downloaded 3 transcript(s)" in result.output
+        assert sorted(p.name for p in (output_dir / "transcripts").iterdir()) == [
+            "abc123.txt", "def456.txt", "ghi789.txt"
+        ]
+
 
 class TestRunSave:
     """Tests for --save integration with store."""
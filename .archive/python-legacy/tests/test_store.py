@@ -0,0 +1,119 @@
+"""Tests for the worldview store index."""
+
+import pytest
+
+from wve.store import (
+    WorldviewEntry,
+    delete_entry,
+    get_index_path,
+    list_entries,
+    list_entry_summaries,
+    load_index,
+    save_entry,
+    search_entries,
+)
+
+
+@pytest.fixture
+def temp_store_dir(tmp_path, monkeypatch):
+    """Use temporary directory for store storage."""
+    store_dir = tmp_path / "store"
+    monkeypatch.setattr("wve.store.DEFAULT_STORE_DIR", store_dir)
+    return store_dir
+
+
+class TestIndex:
+    def test_empty_store(self, temp_store_dir):
+        assert load_index() == []
+
+    def test_save_and_list(self, temp_store_dir):
+        save_entry(WorldviewEntry(slug="alice", display_name="Alice", tags=["econ"]))
+        save_entry(WorldviewEntry(slug="bob", display_name="Bob"))
+
+        assert [e.slug for e in list_entries()] == ["alice", "bob"]
+        assert [e.slug for e in search_entries("econ")] == ["alice"]
+
+    def test_resave_replaces_entry(self, temp_store_dir):
+        save_entry(WorldviewEntry(slug="alice", display_name="Alice"))
+        save_entry(WorldviewEntry(slug="alice", display_name="Alice Smith"))
+
+        entries = load_index()
+        assert len(entries) == 1
+        assert entries[0].display_name == "Alice Smith"
+
+    def test_delete(self, temp_store_dir):
+        save_entry(WorldviewEntry(slug="alice", display_name="Alice"))
+        save_entry(WorldviewEntry(slug="bob", display_name="Bob"))
+
+        assert delete_entry("alice")
+        assert [e.slug for e in load_index()] == ["bob"]
+        assert not delete_entry("alice")
+
+    def test_cached_entries_are_isolated(self, temp_store_dir):
+        """Mutating a saved or loaded entry does not change the cached index."""
+        entry = WorldviewEntry(slug="alice", display_name="Alice", tags=["econ"])
+        save_entry(entry)
+        entry.tags.append("saved-object")
+        load_index()[0].tags.append("loaded-object")
+
+        assert list_entries()[0].tags == ["econ"]
+
+    def test_skips_malformed_lines(self, temp_store_dir):
+        save_entry(WorldviewEntry(slug="alice", display_name="Alice"))
+        with open(get_index_path(), "a") as f:
+            f.write("not json\n\n")
+
+        assert [e.slug for e in load_index()] == ["alice"]
+
+    def test_external_edit_invalidates_cache(self, temp_store_dir):
+        save_entry(WorldviewEntry(slug="alice", display_name="Alice"))
+        assert len(load_index()) == 1
+
+        index_path = get_index_path()
+        index_path.write_text(
+            index_path.read_text()
+            + WorldviewEntry(slug="bob", display_name="Bob").model_dump_json()
+            + "\n"
+        )
+        assert [e.slug for e in load_index()] == ["alice", "bob"]
+
+    def test_resave_appends_and_compacts(self, temp_store_dir, monkeypatch):
+        monkeypatch.setattr("wve.store.INDEX_COMPACT_MIN_LINES", 4)
+        for i in range(4):
+            save_entry(WorldviewEntry(slug="alice", display_name=f"Alice {i}"))
+
+        # Fourth line pushes the log past 2x live entries and triggers a rewrite
+        lines = get_index_path().read_text().splitlines()
+        assert len(lines) == 1
+        assert load_index()[0].display_name == "Alice 3"
+
+    def test_delete_tombstone_survives_reload(self, temp_store_dir):
+        import wve.store
+
+        save_entry(WorldviewEntry(slug="alice", display_name="Alice"))
+        save_entry(WorldviewEntry(slug="bob", display_name="Bob"))
+        delete_entry("alice")
+
+        wve.store._INDEX_CACHE.clear()
+        assert [e.slug for e in load_index()] == ["bob"]
+        assert '"_deleted"' in get_index_path().read_text()
+
+    def test_resave_after_delete(self, temp_store_dir):
+        save_entry(WorldviewEntry(slug="alice", display_name="Alice"))
+        delete_entry("alice")
+        save_entry(WorldviewEntry(slug="alice", display_name="Alice"))
+
+        assert (temp_store_dir / "alice" / "worldview.json").exists()
+        assert [e.slug for e in load_index()] == ["alice"]
+
+    def test_summaries_match_entries(self, temp_store_dir):
+        import wve.store
+
+        save_entry(WorldviewEntry(slug="alice", display_name="Alice", source_count=3, themes=[{"name": "x"}]))
+        save_entry(WorldviewEntry(slug="bob", display_name="Bob"))
+        delete_entry("bob")
+        expected = [(e.slug, e.display_name, e.source_count, e.updated_at) for e in list_entries()]
+
+        assert [tuple(s) for s in list_entry_summaries()] == expected  # From the cached index
+        wve.store._INDEX_CACHE.clear()
+        assert [tuple(s) for s in list_entry_summaries()] == expected  # From the log
@@ -62,6 +62,16 @@ class TestMediumSynthesis:
         # TODO: Verify no Ollama calls
         pass
 
+    def test_phrase_matching_automaton_matches_scan(self):
+        """Aho-Corasick phrase matching agrees with the substring scan."""
+        pytest.importorskip("ahocorasick")
+        from wve.synthesize import _phrase_matches, _phrase_matches_scan
+
+        groups = [("state", "tat"), ("money",), ("nation", "state"), ("zzz",), ("",)]
+        phrases = ["nation state", "sound money", "the state of money", "tattoo", "other"]
+        assert _phrase_matches(groups, phrases) == _phrase_matches_scan(groups, phrases)
+        assert _phrase_matches(groups, phrases)[0] == [0, 2, 3]
+
 
 class TestDeepSynthesis:
     """Tests for deep (Ollama) synthesis."""
@@ -78,6 +88,24 @@ class TestDeepSynthesis:
         # TODO: Verify prompt content
         pass
 
+    def test_context_drops_repeats_and_respects_budget(
+        self, sample_clusters, sample_extraction, monkeypatch
+    ):
+        """Terms shown under themes are not repeated, and sections fit the budget."""
+        from wve.models import ClusterResult, Extraction
+        from wve.synthesize import _deep_context
+
+        clusters = ClusterResult.model_validate(sample_clusters)
+        extraction = Extraction.model_validate(sample_extraction)
+        context = _deep_context(clusters, extraction)
+        key_terms = context.split("## Key Terms (by TF-IDF)\n")[1].split("\n")[0].split(", ")
+        assert "civilization" not in key_terms  # Already listed as a cluster member
+
+        monkeypatch.setattr("wve.synthesize.DEEP_SECTION_CHAR_BUDGET", 120)
+        themes = _deep_context(clusters, extraction).split("\n\n")[0].splitlines()[1:]
+        assert 0 < len(themes) < len(clusters.clusters)
+        assert len("\n".join(themes)) <= 120
+
     def test_parses_ollama_json_response(self, sample_clusters, mock_ollama):
         """Deep synthesis parses Ollama JSON response."""
         # TODO: Verify JSON parsing
@@ -102,6 +130,193 @@ class TestDeepSynthesis:
         # TODO: Verify error handling
         pass
 
+    def test_deep_many_overlaps_requests(self, sample_clusters, sample_extraction, monkeypatch):
+        """Batch deep synthesis issues all prompts concurrently, results in order."""
+        import asyncio
+        import json
+        import sys
+        import types
+
+        from wve.models import ClusterResult, Extraction
+        from wve.synthesize import synthesize_deep_many
+
+        in_flight = []
+        peak = []
+
+        class FakeAsyncClient:
+            def __init__(self, host):
+                pass
+
+            async def generate(self, model, prompt, format):
+                in_flight.append(prompt)
+                peak.append(len(in_flight))
+                await asyncio.sleep(0.01)
+                in_flight.remove(prompt)
+                subject = "Alice" if "Alice" in prompt else "Bob"
+                point = {"point": f"{subject} point", "confidence": 0.9}
+                return {"response": json.dumps({"worldview_points": [point]})}
+
+        monkeypatch.setitem(sys.modules, "ollama", types.SimpleNamespace(AsyncClient=FakeAsyncClient))
+        clusters = ClusterResult.model_validate(sample_clusters)
+        extraction = Extraction.model_validate(sample_extraction)
+
+        results = synthesize_deep_many(
+            [(clusters, extraction, "Alice"), (clusters, extraction, "Bob")], n_points=1
+        )
+        assert [w.points[0].point for w in results] == ["Alice point", "Bob point"]
+        assert max(peak) == 2
+
+    def test_deep_many_bins_by_n_points(self, sample_clusters, sample_extraction, monkeypatch):
+        """Jobs with different n_points run in separate concurrent waves."""
+        import asyncio
+        import json
+        import sys
+        import types
+
+        from wve.models import ClusterResult, Extraction
+        from wve.synthesize import synthesize_deep_many
+
+        waves = []
+
+        class FakeAsyncClient:
+            def __init__(self, host):
+                waves.append([])
+
+            async def generate(self, model, prompt, format):
+                n = 3 if "Identify 3 beliefs" in prompt else 1
+                waves[-1].append(n)
+                await asyncio.sleep(0)
+                points = [{"point": f"p{i}"} for i in range(n)]
+                return {"response": json.dumps({"worldview_points": points})}
+
+        monkeypatch.setitem(sys.modules, "ollama", types.SimpleNamespace(AsyncClient=FakeAsyncClient))
+        clusters = ClusterResult.model_validate(sample_clusters)
+        extraction = Extraction.model_validate(sample_extraction)
+        jobs = [(clusters, extraction, name) for name in ("Alice", "Bob", "Carol")]
+
+        results = synthesize_deep_many(jobs, n_points=[1, 3, 1])
+
+        assert waves == [[1, 1], [3]]
+        assert [len(w.points) for w in results] == [1, 3, 1]
+        with pytest.raises(ValueError):
+            synthesize_deep_many(jobs, n_points=[1, 3])
+
+    def test_deep_batched_single_call(self, sample_clusters, sample_extraction, mock_ollama, monkeypatch):
+        """Batched deep synthesis packs subjects into one prompt and splits results."""
+        import sys
+        import types
+
+        from wve.models import ClusterResult, Extraction
+        from wve.synthesize import synthesize_deep_batched
+
+        monkeypatch.setitem(sys.modules, "ollama", types.SimpleNamespace())
+        mock_ollama.return_value = {
+            "results": [
+                {"subject_index": 2, "worldview_points": [{"point": "Bob point"}]},
+                {"subject_index": 1, "worldview_points": [{"point": "Alice point"}]},
+            ]
+        }
+        clusters = ClusterResult.model_validate(sample_clusters)
+        extraction = Extraction.model_validate(sample_extraction)
+        jobs = [(clusters, extraction, name) for name in ("Alice", "Bob", "Carol")]
+
+        results = synthesize_deep_batched(jobs, n_points=1)
+
+        mock_ollama.assert_called_once()
+        prompt = mock_ollama.call_args[0][0]
+        assert "# Subject 1: Alice" in prompt and "# Subject 3: Carol" in prompt
+        assert results[0].points[0].point == "Alice point"
+        assert results[1].points[0].point == "Bob point"
+        assert results[2].method == "medium"  # Skipped by the model
+
+    def test_deep_streams_points(self, sample_clusters, sample_extraction, monkeypatch, mocker):
+        """Streamed tokens split mid-string still yield complete points."""
+        import json
+        import sys
+        import types
+
+        from wve.models import ClusterResult, Extraction
+        from wve.synthesize import synthesize_deep
+
+        monkeypatch.setitem(sys.modules, "ollama", types.SimpleNamespace())
+        monkeypatch.setenv("WVE_PROMPT_CACHE", "off")
+        body = json.dumps({"worldview_points": [
+            {"point": 'Says "}" often', "confidence": 0.9, "supporting_evidence": ["a\\b"]},
+            {"point": "Second point"},
+        ]})
+        client = mocker.Mock()
+        client.generate.return_value = iter([{"response": body[i:i + 7]} for i in range(0, len(body), 7)])
+        mocker.patch("wve.synthesize.get_ollama_client", return_value=client)
+
+        result = synthesize_deep(
+            ClusterResult.model_validate(sample_clusters),
+            Extraction.model_validate(sample_extraction),
+            "Alice",
+            n_points=2,
+        )
+
+        assert client.generate.call_args.kwargs["stream"] is True
+        assert "worldview_points" in client.generate.call_args.kwargs["format"]["properties"]
+        assert [p.point for p in result.points] == ['Says "}" often', "Second point"]
+        assert result.points[0].evidence == ["a\\b"]
+
+
+class TestGroundedSynthesis:
+    """Tests for quote-grounded synthesis."""
+
+    def test_reuses_cache_until_transcripts_change(self, tmp_path, monkeypatch, mock_ollama, mocker):
+        """Re-runs skip quote extraction and the LLM until a transcript changes."""
+        import shutil
+
+        import wve.quotes
+        from wve.synthesize import synthesize_grounded
+
+        monkeypatch.setenv("WVE_CACHE_DIR", str(tmp_path / "cache"))
+        transcripts = tmp_path / "transcripts"
+        transcripts.mkdir()
+        transcript = transcripts / "v1.txt"
+        transcript.write_text(
+            "I believe that most people misunderstand how civilizations actually decline over time. "
+            "The truth is that 90% of institutions fail within 50 years of their founding."
+        )
+        extract = mocker.spy(wve.quotes, "extract_quotes_from_dir")
+
+        first = synthesize_grounded(transcripts, "Alice")
+        assert first["worldview_points"][0]["point"] == "Test point"
+        assert synthesize_grounded(transcripts, "Alice") == first
+        assert extract.call_count == 1
+        assert mock_ollama.call_count == 1
+
+        shutil.rmtree(tmp_path / "cache")
+        synthesize_grounded(transcripts, "Alice", n_points=3)
+        assert extract.call_count == 1  # Quotes are still memoised in-process
+        assert mock_ollama.call_count == 2
+
+        transcript.write_text(transcript.read_text() + " I think this matters more than anything.")
+        synthesize_grounded(transcripts, "Alice")
+        assert extract.call_count == 2
+
+    def test_empty_answers_and_other_hosts_miss_cache(self, tmp_path, monkeypatch, mock_ollama):
+        """Empty LLM results are retried, and results are kept per Ollama host."""
+        from wve.synthesize import synthesize_grounded
+
+        monkeypatch.setenv("WVE_CACHE_DIR", str(tmp_path / "cache"))
+        transcripts = tmp_path / "transcripts"
+        transcripts.mkdir()
+        (transcripts / "v1.txt").write_text(
+            "I believe that most people misunderstand how civilizations actually decline over time."
+        )
+        points = mock_ollama.return_value
+        mock_ollama.return_value = {}
+
+        assert synthesize_grounded(transcripts, "Alice")["worldview_points"] == []
+        mock_ollama.return_value = points
+        assert synthesize_grounded(transcripts, "Alice")["worldview_points"]
+        assert mock_ollama.call_count == 2
+
+        synthesize_grounded(transcripts, "Alice", ollama_host="http://other:11434")
+        assert mock_ollama.call_count == 3
+
 
 class TestSynthesisOutput:
     """Tests for synthesis output structure."""
@@ -121,6 +336,17 @@ class TestSynthesisOutput:
         # TODO: Verify source_videos field
         pass
 
+    def test_save_worldview_matches_pydantic_json(self, sample_clusters, tmp_path):
+        """Saved file is the same indented JSON pydantic would write."""
+        from wve.models import ClusterResult
+        from wve.synthesize import save_worldview, synthesize_quick
+
+        worldview = synthesize_quick(ClusterResult.model_validate(sample_clusters), subject="Zoë")
+        out = tmp_path / "worldview.json"
+        save_worldview(worldview, str(out))
+
+        assert out.read_bytes() == worldview.model_dump_json(indent=2).encode()
+
 
 class TestSynthesisQuality:
     """Quality tests for synthesis output."""
@@ -25,8 +25,49 @@ class TestTranscriptDownload:
     @pytest.mark.slow
     def test_download_batch_processing(self, mock_yt_dlp, sample_video_metadata, tmp_path):
         """Batch download processes multiple videos correctly."""
-        # TODO: Test batch processing from JSON input
-        pass
+        import subprocess
+
+        from wve.models import VideoMetadata
+        from wve.transcripts import download_transcripts
+
+        def fake_run(cmd, **kwargs):
+            for url in cmd[1:cmd.index("--write-auto-sub")]:
+                video_id = url[-11:]
+                if video_id != "-Ucfj5zRz7k":  # No captions for this one
+                    (tmp_path / f"{video_id}.en.vtt").write_text(f"WEBVTT\n\nsaid {video_id}\n")
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        mock_yt_dlp.side_effect = fake_run
+        videos = [VideoMetadata.model_validate(v) for v in sample_video_metadata]
+        manifest = download_transcripts(
+            videos + ["https://youtu.be/abcdefghijk"], tmp_path, max_workers=1
+        )
+
+        mock_yt_dlp.assert_called_once()  # One yt-dlp process for the whole batch
+
+        ids = [v.id for v in videos if v.id != "-Ucfj5zRz7k"] + ["abcdefghijk"]
+        assert [v.id for v in manifest.videos] == ids
+        assert manifest.transcripts["abcdefghijk"].read_text() == "said abcdefghijk"
+        assert (tmp_path / "manifest.json").exists()
+
+    def test_download_repeated_video(self, mock_yt_dlp, tmp_path):
+        """A video listed twice is fetched once and stays in the manifest."""
+        import subprocess
+
+        from wve.transcripts import download_transcripts
+
+        def fake_run(cmd, **kwargs):
+            for url in cmd[1:cmd.index("--write-auto-sub")]:
+                (tmp_path / f"{url[-11:]}.en.vtt").write_text(f"WEBVTT\n\nsaid {url[-11:]}\n")
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        mock_yt_dlp.side_effect = fake_run
+        a, b = "https://youtu.be/aaaaaaaaaaa", "https://youtu.be/bbbbbbbbbbb"
+        manifest = download_transcripts([a, a, b], tmp_path, max_workers=3)
+
+        assert [v.id for v in manifest.videos] == ["aaaaaaaaaaa", "bbbbbbbbbbb"]
+        assert set(manifest.transcripts) == {"aaaaaaaaaaa", "bbbbbbbbbbb"}
+        assert mock_yt_dlp.call_count == 2
 
 
 class TestTranscriptPreprocessing:
@@ -45,11 +86,9 @@ Hello world
 Hello world
 This is a test
 """
-        # TODO: from wve.transcripts import preprocess_vtt
-        # result = preprocess_vtt(vtt_content)
-        # assert "WEBVTT" not in result
-        # assert "Kind:" not in result
-        pass
+        from wve.transcripts import vtt_to_text
+
+        assert vtt_to_text(vtt_content) == "Hello world This is a test"
 
     def test_removes_timestamps(self):
         """Preprocessing removes timestamp lines."""
@@ -67,15 +106,17 @@ Hello world
 00:00:02.000 --> 00:00:04.000
 Hello world today
 """
-        # Result should be: "Hello\nHello world\nHello world today"
-        # Not: "Hello\nHello\nworld\nHello\nworld\ntoday"
-        pass
+        from wve.transcripts import vtt_to_text
+
+        repeated = vtt_content + "\n00:00:03.000 --> 00:00:05.000\nHello world today\n"
+        assert vtt_to_text(repeated) == "Hello Hello world Hello world today"
 
     def test_strips_html_tags(self):
         """Preprocessing removes HTML formatting tags."""
-        vtt_content = "<c>Hello</c> <b>world</b>"
-        # TODO: Verify tags removed
-        pass
+        from wve.transcripts import vtt_to_text
+
+        vtt_content = "00:00:00.000 --> 00:00:02.000\n<c>Hello</c> <b>world</b><00:00:01.500>"
+        assert vtt_to_text(vtt_content) == "Hello world"
 
     def test_decodes_html_entities(self):
         """Preprocessing decodes HTML entities."""
@@ -83,6 +124,31 @@ Hello world today
         # TODO: Verify decoded to "Tom & Jerry > Mickey"
         pass
 
+    def test_path_streaming_matches_text(self, tmp_path):
+        """Streaming from a file gives the same lines as converting the string."""
+        from wve.transcripts import vtt_to_text, vtt_to_text_path
+
+        vtt_content = "WEBVTT\n\n00:00:00.000 --> 00:00:02.000\n<c>Hi</c> there\nHi there\nbye\n"
+        vtt_path = tmp_path / "a.en.vtt"
+        vtt_path.write_text(vtt_content)
+
+        assert " ".join(vtt_to_text_path(vtt_path)) == vtt_to_text(vtt_content) == "Hi there bye"
+
+    def test_interrupted_conversion_leaves_no_transcript(self, tmp_path, mocker):
+        """A conversion that fails midway leaves neither a .txt nor a partial file."""
+        from wve.transcripts import _vtt_to_txt
+
+        (tmp_path / "abcdefghijk.en.vtt").write_text("WEBVTT\n\nfirst\nsecond\n")
+
+        def broken(path):
+            yield "first"
+            raise KeyboardInterrupt
+
+        mocker.patch("wve.transcripts.vtt_to_text_path", side_effect=broken)
+        with pytest.raises(KeyboardInterrupt):
+            _vtt_to_txt("abcdefghijk", tmp_path)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["abcdefghijk.en.vtt"]
+
     @pytest.mark.robustness
     def test_handles_encoding_errors(self):
         """Preprocessing handles encoding errors gracefully."""